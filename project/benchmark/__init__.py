@@ -0,0 +1,9 @@
+"""
+Package: Benchmark
+~~~~~~~~~~~~~~~~~~
+
+This package contains small timing scripts used to check the
+performance characteristics of the data structures.
+"""
+
+__author__ = "Kunal Bagga"
@@ -0,0 +1,251 @@
+import gc
+import math
+import random
+import sys
+from time import perf_counter
+from project.data_structures.array_avl_tree import ArrayAVLTree
+from project.data_structures.avl_tree import AVLTree
+from project.data_structures.binary_tree import BinaryTree
+from project.utility.benchmark_utility import traced_bytes
+
+
+def measure_insert_cost(max_size: int):
+    """Inserts random keys into trees of growing sizes and reports the average
+    cost per insert. With cached heights it should grow with log2(n), so the
+    last column should stay roughly flat."""
+    print(f'{"size":>10}{"height":>8}{"us/insert":>12}{"us/log2(n)":>12}')
+    size = 1_000
+    while size <= max_size:
+        keys = random.Random(size).sample(range(10 * size), size)
+        tree = AVLTree()
+
+        gc.disable()
+        start = perf_counter()
+        for key in keys:
+            tree.add(key)
+        elapsed = perf_counter() - start
+        gc.enable()
+
+        per_insert = elapsed / size * 1e6
+        print(f'{size:>10,}{tree.head.height:>8}{per_insert:>12.2f}{per_insert / math.log2(size):>12.3f}')
+        size *= 10
+
+
+def measure_mixed_workload(size: int, rounds: int = 10):
+    """Fills a tree with random keys, then runs rounds replacing a random half of
+    them, checking the invariants and comparing the height to the AVL bound of
+    1.44 * log2(n) after every round."""
+    rng = random.Random(size)
+    tree = AVLTree()
+    keys = [rng.randrange(10 * size) for _ in range(size)]
+    for key in keys:
+        tree.add(key)
+
+    print(f'\nRandom insert/delete rounds on {size:,} keys')
+    print(f'{"round":>6}{"count":>10}{"height":>8}{"bound":>8}{"seconds":>10}')
+    for round_number in range(1, rounds + 1):
+        rng.shuffle(keys)
+        half = size // 2
+
+        start = perf_counter()
+        for key in keys[:half]:
+            tree.remove(key)
+        keys[:half] = [rng.randrange(10 * size) for _ in range(half)]
+        for key in keys[:half]:
+            tree.add(key)
+        elapsed = perf_counter() - start
+
+        tree.check_invariants()
+        bound = 1.44 * math.log2(tree.count())
+        assert tree.head.height <= bound, 'The tree is out of balance'
+        print(f'{round_number:>6}{tree.count():>10,}{tree.head.height:>8}{bound:>8.1f}{elapsed:>10.3f}')
+
+
+def compare_order_statistics(size: int, queries: int = 1_000):
+    """Times select, rank and count_range against answering the same queries by
+    scanning the in-order enumeration, which is what they replace."""
+    rng = random.Random(size)
+    tree = AVLTree()
+    for key in rng.sample(range(10 * size), size):
+        tree.add(key)
+    positions = [rng.randrange(size) for _ in range(queries)]
+    bounds = [sorted(rng.sample(range(10 * size), 2)) for _ in range(queries)]
+
+    def scan_select(index):
+        for position, value in enumerate(tree.enumerate_in_order_traversal()):
+            if position == index:
+                return value
+
+    def scan_count_range(low, high):
+        return sum(1 for value in tree.enumerate_in_order_traversal() if low <= value < high)
+
+    scan_queries = max(1, queries // 100)
+    print(f'\nOrder statistics on {size:,} keys (microseconds per query)')
+    print(f'{"query":>14}{"tree":>12}{"scan":>14}')
+    for name, fast, slow, arguments in (
+            ('select', tree.select, scan_select, [(position,) for position in positions]),
+            ('count_range', tree.count_range, scan_count_range, bounds)):
+        start = perf_counter()
+        for argument in arguments:
+            fast(*argument)
+        fast_time = (perf_counter() - start) / queries * 1e6
+
+        start = perf_counter()
+        for argument in arguments[:scan_queries]:
+            slow(*argument)
+        slow_time = (perf_counter() - start) / scan_queries * 1e6
+
+        print(f'{name:>14}{fast_time:>12.2f}{slow_time:>14,.0f}')
+
+
+def compare_range_scan(size: int, window: int = 100, queries: int = 100):
+    """Times yielding a window of keys with range, which seeks to the window, against
+    filtering the full in-order enumeration."""
+    rng = random.Random(size)
+    tree = AVLTree()
+    for key in range(size):
+        tree.put(key, str(key))
+    lows = [rng.randrange(size - window) for _ in range(queries)]
+
+    start = perf_counter()
+    for low in lows:
+        for _ in tree.range(low, low + window):
+            pass
+    range_time = (perf_counter() - start) / queries * 1e6
+
+    start = perf_counter()
+    for low in lows[:10]:
+        for key in tree.enumerate_in_order_traversal():
+            if low <= int(key) < low + window:
+                pass
+    scan_time = (perf_counter() - start) / 10 * 1e6
+
+    print(f'\nWindow of {window} keys out of {size:,} (microseconds per query)')
+    print(f'{"range":>14}{range_time:>14,.0f}')
+    print(f'{"full scan":>14}{scan_time:>14,.0f}')
+
+
+def compare_bulk_build(size: int):
+    """Times building trees of sorted keys with a loop of add against the O(n)
+    bulk constructors, and from_iterable and extend with shuffled keys."""
+    keys = list(range(size))
+    shuffled = random.Random(size).sample(keys, size)
+    timings = []
+
+    def add_loop():
+        tree = AVLTree()
+        for key in keys:
+            tree.add(key)
+
+    gc.disable()
+    for name, build in (('AVLTree add loop', add_loop),
+                        ('AVLTree.from_sorted', lambda: AVLTree.from_sorted(keys)),
+                        ('AVLTree.from_iterable', lambda: AVLTree.from_iterable(shuffled)),
+                        ('AVLTree.extend', lambda: AVLTree.from_sorted(keys[::2]).extend(keys[1::2])),
+                        ('BinaryTree.from_sorted', lambda: BinaryTree.from_sorted(keys))):
+        start = perf_counter()
+        build()
+        timings.append((name, perf_counter() - start))
+        gc.collect()
+    gc.enable()
+
+    print(f'\nBuilding a tree of {size:,} keys')
+    add_time = timings[0][1]
+    for name, elapsed in timings:
+        print(f'{name:>24}{elapsed:>10.3f} s{add_time / elapsed:>8.1f}x')
+
+
+def compare_set_operations(size: int):
+    """Times union, intersection and difference of a large tree with trees of growing
+    sizes against inserting or removing the keys of the smaller tree one by one.
+    The trees are rebuilt before every operation, since the operations consume them."""
+    rng = random.Random(size)
+    large_keys = sorted(rng.sample(range(4 * size), size))
+
+    print(f'\nSet operations with a tree of {size:,} keys (milliseconds)')
+    print(f'{"other size":>12}{"union":>10}{"by put":>10}{"inter":>10}{"diff":>10}{"by remove":>11}')
+    other_size = 10
+    while other_size <= size:
+        other_keys = sorted(rng.sample(range(4 * size), other_size))
+        timings = []
+
+        for operation in ('union', 'put', 'intersection', 'difference', 'remove'):
+            large = AVLTree.from_sorted(large_keys)
+            other = AVLTree.from_sorted(other_keys)
+
+            start = perf_counter()
+            if operation == 'put':
+                for key in other_keys:
+                    large.put(key, key)
+            elif operation == 'remove':
+                for key in other_keys:
+                    large.remove(key)
+            else:
+                getattr(large, operation)(other)
+            timings.append((perf_counter() - start) * 1e3)
+
+        print(f'{other_size:>12,}' + ''.join(f'{timing:>10.2f}' for timing in timings[:4]) +
+              f'{timings[4]:>11.2f}')
+        other_size *= 10
+
+
+def compare_array_storage(size: int):
+    """Compares the node based AVLTree with the array backed ArrayAVLTree on the
+    same random integer keys: memory, add, contains and in-order scan rates, and
+    dumping and loading the array backed tree."""
+    rng = random.Random(size)
+    keys = rng.sample(range(10 * size), size)
+    lookups = [rng.randrange(10 * size) for _ in range(size)]
+
+    print(f'\nNode vs array storage for {size:,} keys')
+    print(f'{"storage":>10}{"bytes/key":>11}{"add/s":>12}{"contains/s":>12}{"scan/s":>12}')
+    def add_all(tree):
+        for key in keys:
+            tree.add(key)
+        return tree
+
+    for name, tree_type in (('nodes', AVLTree), ('arrays', ArrayAVLTree)):
+        # Tracing slows the adds down, so the memory is measured on a separate build.
+        memory = traced_bytes(lambda: add_all(tree_type()))
+
+        start = perf_counter()
+        tree = tree_type()
+        for key in keys:
+            tree.add(key)
+        add_time = perf_counter() - start
+
+        start = perf_counter()
+        for key in lookups:
+            tree.contains(key)
+        contains_time = perf_counter() - start
+
+        start = perf_counter()
+        for _ in tree.enumerate_in_order_traversal():
+            pass
+        scan_time = perf_counter() - start
+
+        print(f'{name:>10}{memory / size:>11.1f}{size / add_time:>12,.0f}'
+              f'{size / contains_time:>12,.0f}{size / scan_time:>12,.0f}')
+
+    start = perf_counter()
+    blob = tree.dump()
+    dump_time = perf_counter() - start
+    start = perf_counter()
+    ArrayAVLTree.load(blob)
+    load_time = perf_counter() - start
+    print(f'dump {len(blob):,} bytes in {dump_time:.4f} s, load in {load_time:.4f} s')
+
+
+def main():
+    max_size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    measure_insert_cost(max_size)
+    measure_mixed_workload(max_size // 10)
+    compare_order_statistics(max_size // 10)
+    compare_range_scan(max_size // 10)
+    compare_bulk_build(max_size)
+    compare_set_operations(max_size // 10)
+    compare_array_storage(max_size)
+
+
+if __name__ == '__main__':
+    main()
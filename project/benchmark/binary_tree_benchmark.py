@@ -0,0 +1,114 @@
+import gc
+import random
+import sys
+from time import perf_counter
+from project.data_structures.avl_tree import AVLTree
+from project.data_structures.binary_tree import BinaryTree, BinaryTreeNode
+
+
+# region Recursive References
+def _recursive_add(node: BinaryTreeNode, value):
+    """The recursive insert the trees used before, kept for comparison."""
+    if node.compare_to_value(value) > 0:
+        if node.left is None:
+            node.left = BinaryTreeNode(value)
+        else:
+            _recursive_add(node.left, value)
+    else:
+        if node.right is None:
+            node.right = BinaryTreeNode(value)
+        else:
+            _recursive_add(node.right, value)
+
+
+def _recursive_pre_order(action, node):
+    if node is not None:
+        action(node.value)
+        _recursive_pre_order(action, node.left)
+        _recursive_pre_order(action, node.right)
+
+
+def _recursive_in_order(action, node):
+    if node is not None:
+        _recursive_in_order(action, node.left)
+        action(node.value)
+        _recursive_in_order(action, node.right)
+
+
+def _recursive_post_order(action, node):
+    if node is not None:
+        _recursive_post_order(action, node.left)
+        _recursive_post_order(action, node.right)
+        action(node.value)
+# endregion
+
+
+def compare_sorted_insert(total: int):
+    """Feeds sorted keys, the pathologically bad case, to an unbalanced tree with
+    the recursive and the iterative insert. The recursive one fails as soon as
+    the tree is deeper than the recursion limit."""
+    print(f'Sorted insert into BinaryTree (recursion limit {sys.getrecursionlimit()})')
+    head = BinaryTreeNode(0)
+    try:
+        for value in range(1, total):
+            _recursive_add(head, value)
+        print(f'{"recursive":>12}: {total:,} values added')
+    except RecursionError:
+        print(f'{"recursive":>12}: RecursionError after {value:,} values')
+
+    tree = BinaryTree()
+    start = perf_counter()
+    for value in range(total):
+        tree.add(value)
+    print(f'{"iterative":>12}: {total:,} values added in {perf_counter() - start:.3f} s')
+
+    start = perf_counter()
+    visited = sum(1 for _ in tree.enumerate_post_order_traversal())
+    print(f'{"iterative":>12}: {visited:,} values visited in post-order in {perf_counter() - start:.3f} s')
+
+
+def compare_traversals(total: int):
+    """Times the recursive traversals against the generator based ones on a balanced tree."""
+    tree = AVLTree()
+    for value in random.Random(total).sample(range(10 * total), total):
+        tree.add(value)
+
+    print(f'\nTraversals of an AVLTree of {total:,} values (seconds)')
+    print(f'{"order":>12}{"recursive":>12}{"action":>12}{"generator":>12}')
+    for order, recursive in (('pre', _recursive_pre_order),
+                             ('in', _recursive_in_order),
+                             ('post', _recursive_post_order),
+                             ('level', None)):
+        values = []
+        timings = []
+
+        gc.disable()
+        if recursive is None:
+            timings.append(None)
+        else:
+            start = perf_counter()
+            recursive(values.append, tree.head)
+            timings.append(perf_counter() - start)
+
+        start = perf_counter()
+        getattr(tree, f'{order}_order_traversal')(values.append)
+        timings.append(perf_counter() - start)
+
+        start = perf_counter()
+        for value in getattr(tree, f'enumerate_{order}_order_traversal')():
+            values.append(value)
+        timings.append(perf_counter() - start)
+        gc.enable()
+
+        print(f'{order:>12}' + ''.join('{:>12}'.format('-' if timing is None else f'{timing:.4f}')
+                                       for timing in timings))
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    compare_sorted_insert(min(total, 5_000))
+    compare_traversals(total)
+
+
+if __name__ == '__main__':
+    main()
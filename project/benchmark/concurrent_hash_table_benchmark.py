@@ -0,0 +1,76 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from project.data_structures.concurrent_hash_table import ConcurrentHashTable
+
+THREAD_COUNTS = (1, 4, 16)
+
+
+def stress_test(threads: int, keys_per_thread: int):
+    """Has every thread add its own keys while all of them merge into the same
+    shared counters and read each other's keys, then checks nothing was lost.
+    The table starts tiny so that it is resized many times under contention.
+    """
+    table = ConcurrentHashTable(capacity=16)
+    shared_keys = 64
+
+    def worker(thread: int):
+        for num in range(keys_per_thread):
+            table.add((thread, num), num)
+            table.merge(('shared', num % shared_keys), 1, lambda old, new: old + new)
+            table.get_value(((thread + 1) % threads, num))
+            if num % 3 == 0:
+                table.remove((thread, num))
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(worker, range(threads)))
+
+    removed = (keys_per_thread + 2) // 3
+    expected_count = threads * (keys_per_thread - removed) + shared_keys
+    assert table.count() == expected_count == len(list(table.keys())), 'Items were lost'
+    assert sum(table[('shared', num)] for num in range(shared_keys)) == threads * keys_per_thread, \
+        'Merges were lost'
+    for thread in range(threads):
+        for num in range(keys_per_thread):
+            assert ((thread, num) in table) == (num % 3 != 0), f'Wrong key {(thread, num)}'
+
+    print(f'Stress test with {threads} threads passed')
+
+
+def measure_throughput(total: int, read_ratio: float = 0.8):
+    """Runs a fixed mix of reads and writes split between the thread counts and
+    reports the operations per second."""
+    print(f'\n{total:,} operations, {read_ratio:.0%} reads')
+    print(f'{"threads":>8}{"ops/s":>16}')
+    for threads in THREAD_COUNTS:
+        table = ConcurrentHashTable()
+        for key in range(total // 10):
+            table[key] = key
+
+        operations = total // threads
+        reads = int(operations * read_ratio)
+
+        def worker(thread: int):
+            key_range = total // 10
+            for num in range(reads):
+                table.get((num * 7 + thread) % key_range)
+            for num in range(operations - reads):
+                table[(num * 13 + thread) % key_range] = num
+
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(worker, range(threads)))
+        elapsed = perf_counter() - start
+
+        print(f'{threads:>8}{operations * threads / elapsed:>16,.0f}')
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    for threads in THREAD_COUNTS:
+        stress_test(threads, 20_000)
+    measure_throughput(total)
+
+
+if __name__ == '__main__':
+    main()
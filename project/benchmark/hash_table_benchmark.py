@@ -0,0 +1,197 @@
+import gc
+import sys
+import tracemalloc
+from time import perf_counter
+from project.data_structures.hash_table import HashTable, HashTableArray, OpenAddressingHashTableArray
+
+ENGINES = (HashTableArray, OpenAddressingHashTableArray)
+
+
+def measure_growth(total: int, array_type=HashTableArray, batches: int = 10):
+    """Inserts keys into a single table in equal batches and reports the
+    throughput of each batch. With indexing over the real capacity the
+    throughput should stay roughly flat as the table grows. A batch which
+    triggers a resize is slower, so the amortized add rate over all the
+    batches so far is reported as well.
+    """
+    table = HashTable(array_type=array_type)
+    batch_size = total // batches
+    key = 0
+    total_add_time = 0.0
+
+    print(f'Growth using {array_type.__name__}')
+    print(f'{"size":>12}{"add ops/s":>16}{"amortized":>16}{"get ops/s":>16}{"buckets":>12}')
+    for _ in range(batches):
+        start = perf_counter()
+        for _ in range(batch_size):
+            table.add(key, key)
+            key += 1
+        add_time = perf_counter() - start
+        total_add_time += add_time
+
+        start = perf_counter()
+        for lookup in range(key - batch_size, key):
+            table.get_value(lookup)
+        get_time = perf_counter() - start
+
+        print(f'{table.count():>12}{batch_size / add_time:>16,.0f}'
+              f'{table.count() / total_add_time:>16,.0f}'
+              f'{batch_size / get_time:>16,.0f}{table._array.capacity():>12}')
+    print()
+
+
+def compare_engines(total: int):
+    """Compares the memory used per entry and the lookup throughput of the
+    chained and the open addressing storage engines."""
+    keys = [f'key-{num}' for num in range(total)]
+
+    print(f'Engines with {total:,} string keys')
+    print(f'{"engine":>30}{"bytes/entry":>14}{"hit ops/s":>16}{"miss ops/s":>16}')
+    for array_type in ENGINES:
+        tracemalloc.start()
+        table = HashTable(array_type=array_type)
+        for key in keys:
+            table.add(key, None)
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = perf_counter()
+        for key in keys:
+            table.get_value(key)
+        hit_time = perf_counter() - start
+
+        start = perf_counter()
+        for num in range(total):
+            table.get_value(num)
+        miss_time = perf_counter() - start
+
+        print(f'{array_type.__name__:>30}{used / total:>14,.1f}'
+              f'{total / hit_time:>16,.0f}{total / miss_time:>16,.0f}')
+    print()
+
+
+def measure_resize_latency(total: int):
+    """Times every single add and reports the latency percentiles and the
+    worst single add, with and without incremental resizing. The garbage
+    collector is paused while timing (as timeit does) so that its full
+    collections do not hide the resize pauses.
+    """
+    print(f'Add latency over {total:,} adds (microseconds)')
+    print(f'{"engine":>30}{"incremental":>13}{"p50":>10}{"p99":>10}{"p99.9":>10}{"max":>12}')
+    for array_type in ENGINES:
+        for incremental_resize in (False, True):
+            table = HashTable(array_type=array_type, incremental_resize=incremental_resize)
+            timings = total * [0.0]
+
+            gc.disable()
+            for key in range(total):
+                start = perf_counter()
+                table.add(key, key)
+                timings[key] = perf_counter() - start
+            gc.enable()
+
+            timings.sort()
+            print(f'{array_type.__name__:>30}{str(incremental_resize):>13}'
+                  f'{timings[total // 2] * 1e6:>10.1f}'
+                  f'{timings[int(total * 0.99)] * 1e6:>10.1f}'
+                  f'{timings[int(total * 0.999)] * 1e6:>10.1f}'
+                  f'{timings[-1] * 1e6:>12.1f}')
+    print()
+
+
+def compare_bulk_load(total: int):
+    """Compares loading a table with one add per pair against from_items.
+    The garbage collector is paused, since the chained engine allocates
+    several objects per pair and the cost of collecting them would
+    otherwise dominate both timings.
+    """
+    pairs = [(f'key-{num}', num) for num in range(total)]
+    gc.disable()
+
+    print(f'Bulk load of {total:,} pairs (seconds)')
+    print(f'{"engine":>30}{"add loop":>12}{"from_items":>12}{"speedup":>10}')
+    for array_type in ENGINES:
+        start = perf_counter()
+        table = HashTable(array_type=array_type)
+        for key, value in pairs:
+            table.add(key, value)
+        loop_time = perf_counter() - start
+
+        start = perf_counter()
+        HashTable.from_items(pairs, array_type=array_type)
+        bulk_time = perf_counter() - start
+
+        print(f'{array_type.__name__:>30}{loop_time:>12.2f}{bulk_time:>12.2f}{loop_time / bulk_time:>9.1f}x')
+    gc.enable()
+    print()
+
+
+def measure_value_index(total: int, lookups: int = 1000):
+    """Compares contains_value with and without the reverse value index,
+    along with the memory the index costs."""
+    print(f'contains_value over {total:,} items ({lookups:,} lookups)')
+    print(f'{"track_values":>14}{"bytes/entry":>14}{"lookups/s":>16}')
+    for track_values in (False, True):
+        tracemalloc.start()
+        table = HashTable.from_items(((num, f'value-{num}') for num in range(total)),
+                                     expected_size=total, track_values=track_values)
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = perf_counter()
+        for num in range(lookups):
+            table.contains_value(f'value-{num * (total // lookups) - 1}')
+        lookup_time = perf_counter() - start
+
+        print(f'{str(track_values):>14}{used / total:>14,.1f}{lookups / lookup_time:>16,.0f}')
+    print()
+
+
+def compare_mapping_protocol(total: int):
+    """Compares the single probe mapping protocol against the get_value
+    and update methods on a table of the given size."""
+    keys = list(range(total))
+
+    print(f'Mapping protocol over {total:,} keys (ops/s)')
+    print(f'{"engine":>30}{"get_value":>14}{"table[key]":>14}{"update":>14}{"table[key]=":>14}')
+    for array_type in ENGINES:
+        table = HashTable.from_items(((key, key) for key in keys), expected_size=total, array_type=array_type)
+        timings = []
+
+        start = perf_counter()
+        for key in keys:
+            table.get_value(key)
+        timings.append(perf_counter() - start)
+
+        start = perf_counter()
+        for key in keys:
+            table[key]
+        timings.append(perf_counter() - start)
+
+        start = perf_counter()
+        for key in keys:
+            table.update(key, key)
+        timings.append(perf_counter() - start)
+
+        start = perf_counter()
+        for key in keys:
+            table[key] = key
+        timings.append(perf_counter() - start)
+
+        print(f'{array_type.__name__:>30}' + ''.join(f'{total / timing:>14,.0f}' for timing in timings))
+    print()
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    for array_type in ENGINES:
+        measure_growth(total, array_type)
+    compare_engines(total)
+    measure_resize_latency(total)
+    compare_bulk_load(total)
+    measure_value_index(total)
+    compare_mapping_protocol(total)
+
+
+if __name__ == '__main__':
+    main()
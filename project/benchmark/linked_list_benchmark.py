@@ -0,0 +1,102 @@
+import gc
+import sys
+from time import perf_counter
+from project.data_structures import doubly_linked_list, singly_linked_list
+from project.data_structures.unrolled_linked_list import UnrolledLinkedList
+from project.utility.benchmark_utility import traced_bytes
+
+
+def compare_sequential_workloads(size: int):
+    """Compares both node per value linked lists with the unrolled linked list at a few
+    block sizes, all built by appending the same integers: memory per value and the
+    rates of append, a full enumerate, a contains miss and a count, which each visit
+    every value. The integers are allocated up front so they are not counted."""
+    values = list(range(size))
+    missing = -1
+
+    def append_all(linked_list):
+        for value in values:
+            linked_list.append(value)
+        return linked_list
+
+    print(f'{size:,} values (values per second)')
+    print(f'{"list":>20}{"bytes/value":>13}{"append":>13}{"enumerate":>13}{"contains":>13}{"count":>13}')
+    for name, list_type in (('singly LinkedList', singly_linked_list.LinkedList),
+                            ('doubly LinkedList', doubly_linked_list.LinkedList),
+                            ('Unrolled(16)', lambda: UnrolledLinkedList(16)),
+                            ('Unrolled(64)', lambda: UnrolledLinkedList(64)),
+                            ('Unrolled(256)', lambda: UnrolledLinkedList(256))):
+        memory = traced_bytes(lambda: append_all(list_type()))
+
+        linked_list = list_type()
+        start = perf_counter()
+        append_all(linked_list)
+        append_rate = size / (perf_counter() - start)
+
+        start = perf_counter()
+        for _ in linked_list.enumerate():
+            pass
+        enumerate_rate = size / (perf_counter() - start)
+
+        start = perf_counter()
+        linked_list.contains(missing)
+        contains_rate = size / (perf_counter() - start)
+
+        start = perf_counter()
+        linked_list.count(0)
+        count_rate = size / (perf_counter() - start)
+
+        print(f'{name:>20}{memory / size:>13.1f}{append_rate:>13,.0f}{enumerate_rate:>13,.0f}'
+              f'{contains_rate:>13,.0f}{count_rate:>13,.0f}')
+
+
+def compare_batch_building(batches: int, batch_size: int):
+    """Builds batches of values as separate lists and joins them into one, for both
+    linked lists: appending every value one by one versus extend, and re-appending the
+    values of each batch versus splicing the batch lists."""
+    values = list(range(batch_size))
+
+    print(f'{batches:,} batches of {batch_size:,} values (seconds)')
+    print(f'{"list":>20}{"append":>10}{"extend":>10}{"re-append":>12}{"splice":>10}')
+    for name, list_type in (('singly LinkedList', singly_linked_list.LinkedList),
+                            ('doubly LinkedList', doubly_linked_list.LinkedList)):
+        start = perf_counter()
+        parts = []
+        for _ in range(batches):
+            part = list_type()
+            for value in values:
+                part.append(value)
+            parts.append(part)
+        append_time = perf_counter() - start
+
+        start = perf_counter()
+        parts = [list_type.from_iterable(values) for _ in range(batches)]
+        extend_time = perf_counter() - start
+
+        start = perf_counter()
+        joined = list_type()
+        for part in parts:
+            for value in part.enumerate():
+                joined.append(value)
+        reappend_time = perf_counter() - start
+        del joined
+        gc.collect()
+
+        start = perf_counter()
+        joined = list_type()
+        for part in parts:
+            joined.splice(part)
+        splice_time = perf_counter() - start
+
+        print(f'{name:>20}{append_time:>10.4f}{extend_time:>10.4f}{reappend_time:>12.4f}{splice_time:>10.4f}')
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    compare_sequential_workloads(size)
+    print()
+    compare_batch_building(size // 1000, 1000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+import sys
+from project.data_structures.avl_tree import AVLTree, AVLTreeNode
+from project.data_structures.binary_tree import BinaryTree, BinaryTreeNode
+from project.data_structures import doubly_linked_list, singly_linked_list
+from project.data_structures.hash_table import HashTableNodePair
+from project.utility.benchmark_utility import traced_bytes
+
+
+def _node_size(node) -> int:
+    """The shallow size of a node, including its instance dictionary if it has one."""
+    size = sys.getsizeof(node)
+    if hasattr(node, '__dict__'):
+        size += sys.getsizeof(node.__dict__)
+    return size
+
+
+def _dict_based_copy(node_type: type) -> type:
+    """Returns a copy of the node class without __slots__, whose instances keep their
+    attributes in an instance dictionary as the node classes did before."""
+    namespace = {name: member for name, member in vars(node_type).items()
+                 if name not in node_type.__slots__ and name not in ('__slots__', '__dict__', '__weakref__')}
+    return type(node_type.__name__, node_type.__bases__, namespace)
+
+
+def report_node_memory(total: int):
+    """Builds every node based structure with the same integers and reports the memory
+    per node, both as traced by tracemalloc for the whole structure and as the shallow
+    size of a single node. The integers themselves are allocated up front so they are
+    not counted."""
+    values = list(range(total))
+
+    def build_doubly_linked_list():
+        linked_list = doubly_linked_list.LinkedList()
+        for value in values:
+            linked_list.add_last(doubly_linked_list.LinkedListNode(value))
+        return linked_list
+
+    def build_singly_linked_list():
+        linked_list = singly_linked_list.LinkedList()
+        for value in values:
+            linked_list.add_last(singly_linked_list.LinkedListNode(value))
+        return linked_list
+
+    structures = (
+        ('AVLTree', lambda: AVLTree.from_sorted(values), lambda tree: tree.head),
+        ('BinaryTree', lambda: BinaryTree.from_sorted(values), lambda tree: tree.head),
+        ('doubly LinkedList', build_doubly_linked_list, lambda linked_list: linked_list.head()),
+        ('singly LinkedList', build_singly_linked_list, lambda linked_list: linked_list.head()),
+        ('HashTableNodePair', lambda: [HashTableNodePair(value, value) for value in values], lambda pairs: pairs[0]),
+    )
+
+    print(f'{total:,} nodes per structure (bytes per node)')
+    print(f'{"structure":>20}{"traced":>10}{"node":>8}{"slots":>8}')
+    for name, build, first_node in structures:
+        traced = traced_bytes(build) / total
+        node = first_node(build())
+        print(f'{name:>20}{traced:>10.1f}{_node_size(node):>8}{str(not hasattr(node, "__dict__")):>8}')
+
+
+def compare_slots(total: int):
+    """Creates the same number of nodes of every node class and of a copy of the class
+    without __slots__, and reports the memory traced per node for both and the saving.
+    The references from the list holding the nodes are not counted."""
+    values = list(range(total))
+    node_types = (
+        ('AVLTreeNode', AVLTreeNode, lambda node_type, value: node_type(value, value, None)),
+        ('BinaryTreeNode', BinaryTreeNode, lambda node_type, value: node_type(value)),
+        ('doubly LinkedListNode', doubly_linked_list.LinkedListNode, lambda node_type, value: node_type(value)),
+        ('singly LinkedListNode', singly_linked_list.LinkedListNode, lambda node_type, value: node_type(value)),
+        ('HashTableNodePair', HashTableNodePair, lambda node_type, value: node_type(value, value)),
+    )
+    list_size = traced_bytes(lambda: [None for _ in values])
+
+    print(f'{total:,} nodes per class (bytes per node)')
+    print(f'{"node":>22}{"__dict__":>10}{"slots":>8}{"saving":>9}')
+    for name, node_type, create in node_types:
+        dict_based_type = _dict_based_copy(node_type)
+        dict_based = (traced_bytes(lambda: [create(dict_based_type, value) for value in values]) - list_size) / total
+        slotted = (traced_bytes(lambda: [create(node_type, value) for value in values]) - list_size) / total
+        print(f'{name:>22}{dict_based:>10.1f}{slotted:>8.1f}{1 - slotted / dict_based:>9.0%}')
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    report_node_memory(total)
+    print()
+    compare_slots(total)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+import os
+import sys
+import tempfile
+from time import perf_counter
+from project.data_structures.hash_table import HashTable
+from project.data_structures.persistent_hash_table import PersistentHashTable
+
+
+def compare_startup(total: int):
+    """Compares rebuilding an in memory table from source data against opening
+    a persistent table built once, and the lookup rate of both."""
+    pairs = [(f'key-{num}', num) for num in range(total)]
+    path = os.path.join(tempfile.mkdtemp(), 'table.pht')
+
+    start = perf_counter()
+    table = HashTable.from_items(pairs)
+    rebuild_time = perf_counter() - start
+
+    start = perf_counter()
+    with PersistentHashTable(path, capacity=2 * total) as persistent:
+        for key, value in pairs:
+            persistent.add(key, value)
+    build_time = perf_counter() - start
+
+    start = perf_counter()
+    persistent = PersistentHashTable(path, readonly=True)
+    open_time = perf_counter() - start
+
+    start = perf_counter()
+    for key, _ in pairs:
+        table.get_value(key)
+    memory_lookup_time = perf_counter() - start
+
+    start = perf_counter()
+    for key, _ in pairs:
+        persistent.get_value(key)
+    file_lookup_time = perf_counter() - start
+    persistent.close()
+
+    print(f'{total:,} pairs, file size {os.path.getsize(path):,} bytes')
+    print(f'{"rebuild HashTable":>30}{rebuild_time:>12.3f} s')
+    print(f'{"build persistent file":>30}{build_time:>12.3f} s')
+    print(f'{"open persistent file":>30}{open_time:>12.6f} s')
+    print(f'{"HashTable lookups":>30}{total / memory_lookup_time:>12,.0f} ops/s')
+    print(f'{"persistent lookups":>30}{total / file_lookup_time:>12,.0f} ops/s')
+    os.remove(path)
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    compare_startup(total)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+import sys
+from time import perf_counter
+from project.data_structures import queue_using_linked_list, queue_using_list
+from project.utility.benchmark_utility import traced_bytes
+
+
+def compare_queues(size: int):
+    """Compares the ring buffer Queue, with and without shrinking, with the deque based
+    Queue: memory per item when holding size items and the rates of filling the
+    queue, enumerating it, draining it, and of a steady stream where each enqueue is
+    followed by a dequeue. The items are allocated up front so they are not counted."""
+    items = list(range(size))
+
+    def fill(queue):
+        for item in items:
+            queue.enqueue(item)
+        return queue
+
+    print(f'{size:,} items (items per second)')
+    print(f'{"queue":>20}{"bytes/item":>12}{"enqueue":>13}{"enumerate":>13}{"dequeue":>13}{"stream":>13}')
+    for name, queue_type in (('ring buffer', queue_using_list.Queue),
+                             ('ring buffer shrink', lambda: queue_using_list.Queue(shrink=True)),
+                             ('deque', queue_using_linked_list.Queue)):
+        memory = traced_bytes(lambda: fill(queue_type()))
+
+        queue = queue_type()
+        start = perf_counter()
+        fill(queue)
+        enqueue_rate = size / (perf_counter() - start)
+
+        start = perf_counter()
+        for _ in queue.enumerate():
+            pass
+        enumerate_rate = size / (perf_counter() - start)
+
+        start = perf_counter()
+        for _ in items:
+            queue.dequeue()
+        dequeue_rate = size / (perf_counter() - start)
+
+        queue = fill(queue_type())
+        start = perf_counter()
+        for item in items:
+            queue.enqueue(item)
+            queue.dequeue()
+        stream_rate = size / (perf_counter() - start)
+
+        print(f'{name:>20}{memory / size:>12.1f}{enqueue_rate:>13,.0f}{enumerate_rate:>13,.0f}'
+              f'{dequeue_rate:>13,.0f}{stream_rate:>13,.0f}')
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    compare_queues(size)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+import sys
+from time import perf_counter
+from project.data_structures.set import Set
+
+
+def sweep_sizes(max_size: int):
+    """Times building two half-overlapping sets and running the set algebra on them
+    for sizes growing tenfold. With hashing every column should grow linearly."""
+    print(f'{"size":>10}{"build":>10}{"contains":>10}{"union":>10}{"inter":>10}'
+          f'{"diff":>10}{"sym diff":>10}{"in-place":>10}  (seconds)')
+    size = 100
+    while size <= max_size:
+        timings = []
+
+        start = perf_counter()
+        first = Set(range(size))
+        second = Set(range(size // 2, size + size // 2))
+        timings.append(perf_counter() - start)
+
+        start = perf_counter()
+        for item in range(size):
+            second.contains(item)
+        timings.append(perf_counter() - start)
+
+        for operation in (Set.union, Set.intersection, Set.difference, Set.symmetric_difference):
+            start = perf_counter()
+            operation(first, second)
+            timings.append(perf_counter() - start)
+
+        start = perf_counter()
+        first.intersection_update(second)
+        first.update(second)
+        first.difference_update(second)
+        first.symmetric_difference_update(second)
+        timings.append(perf_counter() - start)
+
+        print(f'{size:>10,}' + ''.join(f'{timing:>10.4f}' for timing in timings))
+        size *= 10
+
+
+def main():
+    max_size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    sweep_sizes(max_size)
+
+
+if __name__ == '__main__':
+    main()
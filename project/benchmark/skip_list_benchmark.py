@@ -0,0 +1,96 @@
+import random
+import sys
+from time import perf_counter
+from project.data_structures.avl_tree import AVLTree
+from project.data_structures import doubly_linked_list, singly_linked_list
+from project.data_structures.skip_list import SkipList
+
+
+def _ordered_insert(linked_list: doubly_linked_list.LinkedList, value):
+    """Inserts the value before the first greater one by walking the sorted list."""
+    current = linked_list.head()
+    while current is not None and current.value <= value:
+        current = current.next
+
+    if current is None:
+        linked_list.append(value)
+    else:
+        linked_list.insert_before(current, value)
+
+
+def _linked_list_range(linked_list, low, high):
+    """Enumerates the values with low <= value < high of a sorted linked list."""
+    for value in linked_list.enumerate():
+        if value >= high:
+            return
+        if value >= low:
+            yield value
+
+
+def compare_ordered_search(size: int, operations: int):
+    """Compares SkipList with AVLTree and both linked lists kept sorted, all holding
+    the same random keys: the rates of ordered add, contains, remove and of scanning
+    ranges of about a hundred keys. The linked lists run only the first operations of
+    each kind, since each one is a linear walk."""
+    rng = random.Random(size)
+    keys = rng.sample(range(10 * size), size)
+    added = [rng.randrange(10 * size) for _ in range(operations)]
+    lookups = [rng.randrange(10 * size) for _ in range(operations)]
+    removals = rng.sample(keys, operations)
+    ranges = [(low, low + 1000) for low in (rng.randrange(10 * size) for _ in range(operations))]
+
+    def build_skip_list():
+        return SkipList(keys, seed=size)
+
+    def build_avl_tree():
+        return AVLTree.from_iterable(keys)
+
+    def build_linked_list(list_type):
+        return lambda: list_type.from_iterable(sorted(keys))
+
+    containers = (
+        ('SkipList', build_skip_list, SkipList.add, lambda skip_list, low, high: skip_list.range(low, high)),
+        ('AVLTree', build_avl_tree, AVLTree.add, lambda tree, low, high: tree.range(low, high)),
+        ('doubly LinkedList', build_linked_list(doubly_linked_list.LinkedList), _ordered_insert, _linked_list_range),
+        ('singly LinkedList', build_linked_list(singly_linked_list.LinkedList), None, _linked_list_range),
+    )
+
+    print(f'{size:,} random keys (operations per second)')
+    print(f'{"container":>20}{"add":>11}{"contains":>11}{"remove":>11}{"range":>11}')
+    for name, build, add, enumerate_range in containers:
+        container = build()
+        count = operations if name in ('SkipList', 'AVLTree') else min(operations, 200)
+
+        add_rate = '-'
+        if add is not None:
+            start = perf_counter()
+            for key in added[:count]:
+                add(container, key)
+            add_rate = f'{count / (perf_counter() - start):,.0f}'
+
+        start = perf_counter()
+        for key in lookups[:count]:
+            container.contains(key)
+        contains_rate = count / (perf_counter() - start)
+
+        start = perf_counter()
+        for low, high in ranges[:count]:
+            for _ in enumerate_range(container, low, high):
+                pass
+        range_rate = count / (perf_counter() - start)
+
+        start = perf_counter()
+        for key in removals[:count]:
+            container.remove(key)
+        remove_rate = count / (perf_counter() - start)
+
+        print(f'{name:>20}{add_rate:>11}{contains_rate:>11,.0f}{remove_rate:>11,.0f}{range_rate:>11,.0f}')
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    compare_ordered_search(size, size // 10)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+import random
+import sys
+from time import perf_counter
+from project.data_structures.avl_tree import AVLTree
+from project.data_structures.sorted_list import SortedList
+from project.utility.benchmark_utility import traced_bytes
+
+
+def compare_containers(size: int):
+    """Compares AVLTree with SortedList at a few fan-outs on the same random keys:
+    memory per key and the rates of add, contains, remove and in-order scan."""
+    rng = random.Random(size)
+    keys = rng.sample(range(10 * size), size)
+    lookups = [rng.randrange(10 * size) for _ in range(size)]
+    removals = keys[:size // 10]
+
+    def add_all(container):
+        for key in keys:
+            container.add(key)
+        return container
+
+    print(f'{size:,} random keys (operations per second)')
+    print(f'{"container":>20}{"bytes/key":>11}{"add":>11}{"contains":>11}{"remove":>11}{"scan":>12}')
+    for name, container_type in (('AVLTree', AVLTree),
+                                 ('SortedList(64)', lambda: SortedList(fan_out=64)),
+                                 ('SortedList(1000)', lambda: SortedList(fan_out=1000)),
+                                 ('SortedList(4000)', lambda: SortedList(fan_out=4000))):
+        memory = traced_bytes(lambda: add_all(container_type()))
+
+        container = container_type()
+        start = perf_counter()
+        add_all(container)
+        add_rate = size / (perf_counter() - start)
+
+        start = perf_counter()
+        for key in lookups:
+            container.contains(key)
+        contains_rate = size / (perf_counter() - start)
+
+        start = perf_counter()
+        for _ in container.enumerate_in_order_traversal():
+            pass
+        scan_rate = size / (perf_counter() - start)
+
+        start = perf_counter()
+        for key in removals:
+            container.remove(key)
+        remove_rate = len(removals) / (perf_counter() - start)
+
+        print(f'{name:>20}{memory / size:>11.1f}{add_rate:>11,.0f}{contains_rate:>11,.0f}'
+              f'{remove_rate:>11,.0f}{scan_rate:>12,.0f}')
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    compare_containers(size)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,453 @@
+from __future__ import annotations
+import struct
+import sys
+from array import array
+from collections import deque
+from typing import Union, List
+
+TKey = Union[int, float]
+
+# dump() writes a header followed by the raw contents of the four arrays:
+#
+#   header    magic, version, little endian flag, key type code, slots, root, free list head, count
+#   arrays    keys, left indices, right indices, heights, each with one entry per slot
+#
+# The arrays are written in the byte order of the machine which dumped them and
+# are swapped on load if the machine which loads them differs.
+_HEADER = struct.Struct('<4sB?cxQQQQ')
+
+_MAGIC = b'AVLA'
+_VERSION = 1
+
+# Slot 0 is the nil node: every missing child points at it, and its height is 0,
+# so the height of any child can be read without checking for a missing one.
+_NIL = 0
+
+
+class ArrayAVLTree:
+    """An AVL tree of numbers stored in parallel arrays instead of node objects.
+
+    Slot i of the keys, left, right and heights arrays describes one node, and
+    the children are referred to by slot index. A node costs about 17 bytes
+    instead of a Python object, and a lookup reads packed arrays rather than
+    chasing object pointers. The slots of removed nodes are chained in a free
+    list through the left array and reused by later adds.
+
+    It has the same add, contains, remove and traversal methods as AVLTree, and
+    the whole tree can be saved as a single binary blob with dump and restored
+    with load.
+    """
+
+    def __init__(self, typecode: str = 'q'):
+        """Constructs an empty tree.
+
+        :param typecode: The array type code of the keys, e.g. 'q' for 64 bit integers or 'd' for floats.
+        """
+        self._keys = array(typecode, [0])
+        self._left = array('I', [_NIL])
+        self._right = array('I', [_NIL])
+        self._heights = array('B', [0])
+        self._root = _NIL
+        self._free = _NIL   # The first slot of the free list, or nil if it is empty
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: TKey) -> bool:
+        return self.contains(key)
+
+    # region Slots
+    def _allocate(self, key: TKey) -> int:
+        """Returns a slot for a new leaf with the key, reusing a free slot if there is one."""
+        slot = self._free
+        if slot != _NIL:
+            self._free = self._left[slot]
+            self._keys[slot] = key
+            self._left[slot] = _NIL
+            self._right[slot] = _NIL
+            self._heights[slot] = 1
+            return slot
+
+        self._keys.append(key)
+        self._left.append(_NIL)
+        self._right.append(_NIL)
+        self._heights.append(1)
+        return len(self._keys) - 1
+
+    def _release(self, slot: int):
+        """Puts the slot at the head of the free list."""
+        self._left[slot] = self._free
+        self._right[slot] = _NIL
+        self._heights[slot] = 0
+        self._free = slot
+    # endregion
+
+    # region Balancing Methods
+    def _update_height(self, slot: int):
+        heights = self._heights
+        left_height = heights[self._left[slot]]
+        right_height = heights[self._right[slot]]
+        heights[slot] = 1 + (left_height if left_height > right_height else right_height)
+
+    def _rotate_left(self, slot: int) -> int:
+        new_root = self._right[slot]
+        self._right[slot] = self._left[new_root]
+        self._left[new_root] = slot
+        self._update_height(slot)
+        self._update_height(new_root)
+        return new_root
+
+    def _rotate_right(self, slot: int) -> int:
+        new_root = self._left[slot]
+        self._left[slot] = self._right[new_root]
+        self._right[new_root] = slot
+        self._update_height(slot)
+        self._update_height(new_root)
+        return new_root
+
+    def _balance(self, slot: int) -> int:
+        """Updates the height of the node and rotates it if it is unbalanced.
+
+        :return: The slot of the node which is now the root of the subtree.
+        """
+        left, right, heights = self._left, self._right, self._heights
+        balance_factor = heights[right[slot]] - heights[left[slot]]
+
+        if balance_factor > 1:
+            child = right[slot]
+            if heights[right[child]] < heights[left[child]]:
+                right[slot] = self._rotate_right(child)
+            return self._rotate_left(slot)
+        if balance_factor < -1:
+            child = left[slot]
+            if heights[left[child]] < heights[right[child]]:
+                left[slot] = self._rotate_left(child)
+            return self._rotate_right(slot)
+
+        self._update_height(slot)
+        return slot
+
+    def _rebalance_path(self, path: List[int]):
+        """Balances the nodes on the path from the head down to a changed node, bottom
+        up, and stops once a subtree ends up as high as it was before."""
+        left, heights = self._left, self._heights
+
+        for position in range(len(path) - 1, -1, -1):
+            slot = path[position]
+            height = heights[slot]
+            subtree = self._balance(slot)
+
+            if subtree != slot:
+                # A rotation replaced the root of the subtree, so relink it in its parent.
+                if position == 0:
+                    self._root = subtree
+                else:
+                    parent = path[position - 1]
+                    if left[parent] == slot:
+                        left[parent] = subtree
+                    else:
+                        self._right[parent] = subtree
+            if heights[subtree] == height:
+                break
+    # endregion
+
+    def add(self, key: TKey):
+        """Adds the provided key to the tree.
+
+        :param key: Key to add to the tree.
+        """
+        keys, left, right = self._keys, self._left, self._right
+        slot = self._allocate(key)
+        self._count += 1
+
+        if self._root == _NIL:
+            self._root = slot
+            return
+
+        path = []
+        current = self._root
+        while True:
+            path.append(current)
+            if key < keys[current]:
+                if left[current] == _NIL:
+                    left[current] = slot
+                    break
+                current = left[current]
+            else:
+                if right[current] == _NIL:
+                    right[current] = slot
+                    break
+                current = right[current]
+
+        self._rebalance_path(path)
+
+    def contains(self, key: TKey) -> bool:
+        """Determines if the specified key exists in the tree.
+
+        :param key: The key to search for.
+        :return: True if the tree contains the key, false otherwise.
+        """
+        keys, left, right = self._keys, self._left, self._right
+        current = self._root
+
+        while current != _NIL:
+            current_key = keys[current]
+            if key < current_key:
+                current = left[current]
+            elif key > current_key:
+                current = right[current]
+            else:
+                return True
+
+        return False
+
+    def remove(self, key: TKey) -> bool:
+        """Removes the first occurrence of the specified key from the tree.
+
+        :param key: The key to remove.
+        :return: True if key was removed, False otherwise.
+        """
+        keys, left, right = self._keys, self._left, self._right
+        path = []
+        current = self._root
+
+        while current != _NIL:
+            current_key = keys[current]
+            if key < current_key:
+                path.append(current)
+                current = left[current]
+            elif key > current_key:
+                path.append(current)
+                current = right[current]
+            else:
+                break
+        else:
+            return False
+
+        if left[current] != _NIL and right[current] != _NIL:
+            # The successor's key moves into current, and the successor, which has
+            # no left child, is the node which is unlinked instead.
+            path.append(current)
+            successor = right[current]
+            while left[successor] != _NIL:
+                path.append(successor)
+                successor = left[successor]
+
+            keys[current] = keys[successor]
+            current = successor
+
+        child = left[current] if left[current] != _NIL else right[current]
+        if not path:
+            self._root = child
+        elif left[path[-1]] == current:
+            left[path[-1]] = child
+        else:
+            right[path[-1]] = child
+
+        self._release(current)
+        self._count -= 1
+        self._rebalance_path(path)
+        return True
+
+    # region Serialization
+    def dump(self) -> bytes:
+        """Returns the whole tree as a single binary blob, which load turns back into a tree."""
+        header = _HEADER.pack(_MAGIC, _VERSION, sys.byteorder == 'little', self._keys.typecode.encode(),
+                              len(self._keys), self._root, self._free, self._count)
+        return b''.join((header, self._keys.tobytes(), self._left.tobytes(),
+                         self._right.tobytes(), self._heights.tobytes()))
+
+    @classmethod
+    def load(cls, blob: bytes) -> ArrayAVLTree:
+        """Rebuilds a tree from a blob returned by dump.
+
+        :param blob: The dumped tree.
+        :raises ValueError: If the blob is not a dumped tree.
+        """
+        if len(blob) < _HEADER.size:
+            raise ValueError('The blob is too short to be a dumped tree')
+
+        magic, version, little_endian, typecode, slots, root, free, count = _HEADER.unpack_from(blob)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError('The blob is not a dumped tree')
+
+        tree = cls(typecode.decode())
+        offset = _HEADER.size
+        for name in ('_keys', '_left', '_right', '_heights'):
+            buffer = array(getattr(tree, name).typecode)
+            end = offset + slots * buffer.itemsize
+            if end > len(blob):
+                raise ValueError('The blob is truncated')
+
+            buffer.frombytes(blob[offset:end])
+            if little_endian != (sys.byteorder == 'little'):
+                buffer.byteswap()
+            setattr(tree, name, buffer)
+            offset = end
+
+        tree._root, tree._free, tree._count = root, free, count
+        return tree
+    # endregion
+
+    # region Traversals
+    def pre_order_traversal(self, action):
+        """Performs the provided action on each key in pre-order traversal order."""
+        for key in self.enumerate_pre_order_traversal():
+            action(key)
+
+    def enumerate_pre_order_traversal(self):
+        """Enumerates the keys contained in the tree in pre-order traversal order.
+
+        :return: The enumerator.
+        """
+        keys, left, right = self._keys, self._left, self._right
+        stack = [self._root] if self._root != _NIL else []
+
+        while stack:
+            current = stack.pop()
+            yield keys[current]
+
+            if right[current] != _NIL:
+                stack.append(right[current])
+            if left[current] != _NIL:
+                stack.append(left[current])
+
+    def post_order_traversal(self, action):
+        """Performs the provided action on each key in post-order traversal order."""
+        for key in self.enumerate_post_order_traversal():
+            action(key)
+
+    def enumerate_post_order_traversal(self):
+        """Enumerates the keys contained in the tree in post-order traversal order.
+
+        :return: The enumerator.
+        """
+        keys, left, right = self._keys, self._left, self._right
+        stack = []
+        current = self._root
+        last_yielded = _NIL
+
+        while current != _NIL or stack:
+            if current != _NIL:
+                stack.append(current)
+                current = left[current]
+                continue
+
+            slot = stack[-1]
+            if right[slot] != _NIL and right[slot] != last_yielded:
+                current = right[slot]
+            else:
+                yield keys[slot]
+                last_yielded = stack.pop()
+
+    def in_order_traversal(self, action):
+        """Performs the provided action on each key in in-order traversal order."""
+        for key in self.enumerate_in_order_traversal():
+            action(key)
+
+    def enumerate_in_order_traversal(self):
+        """Enumerates the keys contained in the tree in in-order traversal order.
+
+        :return: The enumerator.
+        """
+        keys, left, right = self._keys, self._left, self._right
+        stack = []
+        current = self._root
+
+        while current != _NIL or stack:
+            if current != _NIL:
+                stack.append(current)
+                current = left[current]
+            else:
+                current = stack.pop()
+                yield keys[current]
+                current = right[current]
+
+    def level_order_traversal(self, action):
+        """Performs the provided action on each key in level-order traversal order."""
+        for key in self.enumerate_level_order_traversal():
+            action(key)
+
+    def enumerate_level_order_traversal(self):
+        """Enumerates the keys contained in the tree level by level from the head,
+        each level from left to right.
+
+        :return: The enumerator.
+        """
+        keys, left, right = self._keys, self._left, self._right
+        queue = deque([self._root] if self._root != _NIL else [])
+
+        while queue:
+            current = queue.popleft()
+            yield keys[current]
+
+            if left[current] != _NIL:
+                queue.append(left[current])
+            if right[current] != _NIL:
+                queue.append(right[current])
+    # endregion
+
+    def check_invariants(self):
+        """Verifies the structure of the tree: the ordering of the keys, the stored
+        heights, the balance of every node, the count and the free list.
+
+        :raises ValueError: If any of the invariants does not hold.
+        """
+        left, right, heights = self._left, self._right, self._heights
+        count = 0
+        for slot in self._enumerate_slots_post_order():
+            count += 1
+            left_height, right_height = heights[left[slot]], heights[right[slot]]
+            if heights[slot] != 1 + max(left_height, right_height):
+                raise ValueError(f'The stored height of slot {slot} is wrong')
+            if abs(right_height - left_height) > 1:
+                raise ValueError(f'Slot {slot} is unbalanced')
+
+        previous = None
+        for key in self.enumerate_in_order_traversal():
+            if previous is not None and key < previous:
+                raise ValueError(f'{key} is after {previous} in order')
+            previous = key
+
+        if count != self._count:
+            raise ValueError(f'The tree has {count} nodes but a count of {self._count}')
+
+        free = 0
+        slot = self._free
+        while slot != _NIL:
+            free += 1
+            slot = left[slot]
+        if count + free + 1 != len(self._keys):
+            raise ValueError('Some slots are neither in the tree nor in the free list')
+
+    def _enumerate_slots_post_order(self):
+        """Enumerates the slots of the nodes in post-order, so children come before their parents."""
+        left, right = self._left, self._right
+        stack = []
+        current = self._root
+        last_yielded = _NIL
+
+        while current != _NIL or stack:
+            if current != _NIL:
+                stack.append(current)
+                current = left[current]
+                continue
+
+            slot = stack[-1]
+            if right[slot] != _NIL and right[slot] != last_yielded:
+                current = right[slot]
+            else:
+                yield slot
+                last_yielded = stack.pop()
+
+    def clear(self):
+        """Removes all the keys from the tree and releases the arrays."""
+        self.__init__(self._keys.typecode)
+
+    def count(self) -> int:
+        """Returns the number of keys currently contained in the tree.
+
+        :return: Returns the count of keys in the tree.
+        """
+        return self._count
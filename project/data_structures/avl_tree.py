@@ -1,9 +1,16 @@
 from __future__ import annotations
 from collections import deque
 from enum import Enum
-from typing import TypeVar, Optional
+from heapq import merge
+from itertools import islice
+from operator import attrgetter
+from typing import TypeVar, Optional, Iterable, List, Tuple
 
 TNode = TypeVar('TNode')
+TKey = TypeVar('TKey')
+TValue = TypeVar('TValue')
+
+_MISSING = object()
 
 
 class TreeState(Enum):
@@ -13,35 +20,50 @@ class TreeState(Enum):
 
 
 class AVLTreeNode:
-    """An AVL tree node class."""
-    def __init__(self, value: TNode, parent: Optional[AVLTreeNode], tree: AVLTree):
-        self._value: TNode = value
+    """An AVL tree node class. The nodes are ordered by their keys; a tree used as
+    a collection of values stores each value as its own key."""
+    __slots__ = ('key', 'value', 'left', 'right', 'parent', 'height', 'size')
+
+    def __init__(self, key: TKey, value: TValue, parent: Optional[AVLTreeNode]):
+        self.key: TKey = key
+        self.value: TValue = value
         self.left: Optional[AVLTreeNode] = None
         self.right: Optional[AVLTreeNode] = None
         self.parent: AVLTreeNode = parent
-        self._tree: AVLTree = tree
+
+        # The height of the subtree rooted at this node. It is kept up to date
+        # by the rotations and by the tree's add and remove, so reading the
+        # height of a child is O(1) instead of a walk over its whole subtree.
+        self.height: int = 1
+
+        # The number of nodes in the subtree rooted at this node, kept up to date the
+        # same way, which lets the tree find a node by its position in O(log n).
+        self.size: int = 1
 
     # region Properties and Methods
     @property
-    def value(self) -> TNode:
-        return self._value
+    def _left_height(self) -> int:
+        return self.left.height if self.left else 0
 
     @property
-    def tree(self) -> AVLTree:
-        return self._tree
-
-    def _max_child_height(self, node: AVLTreeNode) -> int:
-        if node:
-            return 1 + max(self._max_child_height(node.left), self._max_child_height(node.right))
-        return 0
+    def _right_height(self) -> int:
+        return self.right.height if self.right else 0
 
     @property
-    def _left_height(self) -> int:
-        return self._max_child_height(self.left)
+    def _left_size(self) -> int:
+        return self.left.size if self.left else 0
 
     @property
-    def _right_height(self) -> int:
-        return self._max_child_height(self.right)
+    def _right_size(self) -> int:
+        return self.right.size if self.right else 0
+
+    def update_height(self):
+        """Recomputes the height of the node from the cached heights of its children."""
+        self.height = 1 + max(self._left_height, self._right_height)
+
+    def update_size(self):
+        """Recomputes the size of the node from the cached sizes of its children."""
+        self.size = 1 + self._left_size + self._right_size
 
     @property
     def _state(self) -> TreeState:
@@ -60,33 +82,37 @@ class AVLTreeNode:
     # endregion
 
     def compare_to(self, other: AVLTreeNode) -> int:
-        """Compares the current node to the provided value.
+        """Compares the key of the current node to the key of the provided node.
 
-        :param other: The node value to compare to.
-        :return: 1 if the instance value is greater than provided value, -1 if less or 0 if equal.
+        :param other: The node to compare to.
+        :return: 1 if the instance key is greater than provided key, -1 if less or 0 if equal.
         """
-        if self._value == other.value:
+        if self.key == other.key:
             return 0
-        elif self._value > other.value:
+        elif self.key > other.key:
             return 1
         else:
             return -1
 
-    def compare_to_value(self, value: TNode) -> int:
-        """Compares the current node to the provided value.
+    def compare_to_value(self, key: TKey) -> int:
+        """Compares the key of the current node to the provided key.
 
-        :param value: The value to compare to.
-        :return: 1 if the instance value is greater than provided value, -1 if less or 0 if equal.
+        :param key: The key to compare to.
+        :return: 1 if the instance key is greater than provided key, -1 if less or 0 if equal.
         """
-        if self._value == value:
+        if self.key == key:
             return 0
-        elif self._value > value:
+        elif self.key > key:
             return 1
         else:
             return -1
 
     # region Balancing Methods
     def balance(self):
+        """Updates the height and the size of the node and rotates it if it is unbalanced.
+        The heights and the sizes of the children must already be up to date."""
+        self.update_height()
+        self.update_size()
         tree_state = self._state
 
         if tree_state == TreeState.RightHeavy:
@@ -122,10 +148,18 @@ class AVLTreeNode:
 
         # Take ownership of right's left child as right (now parent)
         self.right = new_root.left
+        if self.right:
+            self.right.parent = self
 
         # The new root takes self as it's left
         new_root.left = self
 
+        # Self is now below the new root, so its height and size are updated first.
+        self.update_height()
+        self.update_size()
+        new_root.update_height()
+        new_root.update_size()
+
     def _right_rotation(self):
         """
             c (self)
@@ -148,10 +182,18 @@ class AVLTreeNode:
 
         # Take ownership of left's right child as left (now parent)
         self.left = new_root.right
+        if self.left:
+            self.left.parent = self
 
         # The new root takes self as it's right
         new_root.right = self
 
+        # Self is now below the new root, so its height and size are updated first.
+        self.update_height()
+        self.update_size()
+        new_root.update_height()
+        new_root.update_size()
+
     def _left_right_rotation(self):
         self.right._right_rotation()
         self._left_rotation()
@@ -161,57 +203,317 @@ class AVLTreeNode:
         self._right_rotation()
 
     def _replace_root(self, new_root: AVLTreeNode):
+        # If self is the head, the tree takes the new root as its head after balancing.
         if self.parent:
-            if self.parent.left == self:
+            if self.parent.left is self:
                 self.parent.left = new_root
-            elif self.parent.right == self:
+            elif self.parent.right is self:
                 self.parent.right = new_root
-        else:
-            self._tree.head = new_root
 
         new_root.parent = self.parent
         self.parent = new_root
     # endregion
 
 
+# region Join and Split
+# These work on detached subtrees rather than on trees: each takes subtree roots,
+# relinks the nodes and returns the root of the result, which has no parent set.
+def _height(node: Optional[AVLTreeNode]) -> int:
+    return node.height if node else 0
+
+
+def _link(left: Optional[AVLTreeNode], node: AVLTreeNode, right: Optional[AVLTreeNode]) -> AVLTreeNode:
+    """Makes left and right the children of node and updates its height and size."""
+    node.left = left
+    node.right = right
+    if left is not None:
+        left.parent = node
+    if right is not None:
+        right.parent = node
+
+    node.update_height()
+    node.update_size()
+    return node
+
+
+def _rotate_left(node: AVLTreeNode) -> AVLTreeNode:
+    new_root = node.right
+    return _link(_link(node.left, node, new_root.left), new_root, new_root.right)
+
+
+def _rotate_right(node: AVLTreeNode) -> AVLTreeNode:
+    new_root = node.left
+    return _link(new_root.left, new_root, _link(new_root.right, node, node.right))
+
+
+def _join_right(left: AVLTreeNode, pivot: AVLTreeNode, right: Optional[AVLTreeNode]) -> AVLTreeNode:
+    """Joins when left is higher: goes down the right spine of left to a subtree about
+    as high as right, links the pivot there and rebalances on the way back up."""
+    if _height(left.right) <= _height(right) + 1:
+        subtree = _link(left.right, pivot, right)
+        if subtree.height <= _height(left.left) + 1:
+            return _link(left.left, left, subtree)
+        return _rotate_left(_link(left.left, left, _rotate_right(subtree)))
+
+    subtree = _join_right(left.right, pivot, right)
+    joined = _link(left.left, left, subtree)
+    if subtree.height <= _height(left.left) + 1:
+        return joined
+    return _rotate_left(joined)
+
+
+def _join_left(left: Optional[AVLTreeNode], pivot: AVLTreeNode, right: AVLTreeNode) -> AVLTreeNode:
+    """The mirror image of _join_right, for when right is higher."""
+    if _height(right.left) <= _height(left) + 1:
+        subtree = _link(left, pivot, right.left)
+        if subtree.height <= _height(right.right) + 1:
+            return _link(subtree, right, right.right)
+        return _rotate_right(_link(_rotate_left(subtree), right, right.right))
+
+    subtree = _join_left(left, pivot, right.left)
+    joined = _link(subtree, right, right.right)
+    if subtree.height <= _height(right.right) + 1:
+        return joined
+    return _rotate_right(joined)
+
+
+def _join(left: Optional[AVLTreeNode], pivot: AVLTreeNode, right: Optional[AVLTreeNode]) -> AVLTreeNode:
+    """Joins two subtrees, all of whose keys are ordered around the pivot node,
+    in O(|height(left) - height(right)| + 1)."""
+    if _height(left) > _height(right) + 1:
+        root = _join_right(left, pivot, right)
+    elif _height(right) > _height(left) + 1:
+        root = _join_left(left, pivot, right)
+    else:
+        root = _link(left, pivot, right)
+
+    root.parent = None
+    return root
+
+
+def _split_last(node: AVLTreeNode) -> (Optional[AVLTreeNode], AVLTreeNode):
+    """Removes the node with the greatest key from the subtree.
+
+    :return: Tuple of the remaining subtree and the removed node.
+    """
+    if node.right is None:
+        if node.left is not None:
+            node.left.parent = None
+        return node.left, node
+
+    rest, last = _split_last(node.right)
+    return _join(node.left, node, rest), last
+
+
+def _join2(left: Optional[AVLTreeNode], right: Optional[AVLTreeNode]) -> Optional[AVLTreeNode]:
+    """Joins two subtrees, all of whose keys in left are not greater than those in right."""
+    if left is None:
+        return right
+
+    rest, last = _split_last(left)
+    return _join(rest, last, right)
+
+
+def _split(node: Optional[AVLTreeNode], key: TKey) -> (Optional[AVLTreeNode], Optional[AVLTreeNode]):
+    """Splits the subtree into the nodes with keys less than the key and the others.
+
+    :return: Tuple of the two subtrees.
+    """
+    if node is None:
+        return None, None
+
+    if node.compare_to_value(key) < 0:
+        less, rest = _split(node.right, key)
+        return _join(node.left, node, less), rest
+
+    rest, greater = _split(node.left, key)
+    return rest, _join(greater, node, node.right)
+
+
+def _split_at(node: Optional[AVLTreeNode], key: TKey) \
+        -> (Optional[AVLTreeNode], Optional[AVLTreeNode], Optional[AVLTreeNode]):
+    """Splits the subtree around a node with the key.
+
+    :return: Tuple of the subtree before the node, the node with the key (or None if
+        there is none) and the subtree after it.
+    """
+    if node is None:
+        return None, None, None
+
+    result = node.compare_to_value(key)
+    if result < 0:
+        less, found, greater = _split_at(node.right, key)
+        return _join(node.left, node, less), found, greater
+    if result > 0:
+        less, found, greater = _split_at(node.left, key)
+        return less, found, _join(greater, node, node.right)
+
+    for child in (node.left, node.right):
+        if child is not None:
+            child.parent = None
+    return node.left, node, node.right
+
+
+def _union(first: Optional[AVLTreeNode], second: Optional[AVLTreeNode]) -> Optional[AVLTreeNode]:
+    if first is None:
+        return second
+    if second is None:
+        return first
+
+    # A node of second with the key of the root of first is dropped.
+    less, _, greater = _split_at(second, first.key)
+    left, right = first.left, first.right
+    return _join(_union(left, less), first, _union(right, greater))
+
+
+def _intersection(first: Optional[AVLTreeNode], second: Optional[AVLTreeNode]) -> Optional[AVLTreeNode]:
+    if first is None or second is None:
+        return None
+
+    less, found, greater = _split_at(second, first.key)
+    left, right = first.left, first.right
+    left, right = _intersection(left, less), _intersection(right, greater)
+    return _join(left, first, right) if found is not None else _join2(left, right)
+
+
+def _difference(first: Optional[AVLTreeNode], second: Optional[AVLTreeNode]) -> Optional[AVLTreeNode]:
+    if first is None or second is None:
+        return first
+
+    less, _, greater = _split_at(first, second.key)
+    left, right = second.left, second.right
+    return _join2(_difference(less, left), _difference(greater, right))
+# endregion
+
+
 class AVLTree:
     def __init__(self):
         self.head: Optional[AVLTreeNode] = None
         self._count = 0
 
+    # region Bulk Build
+    @classmethod
+    def from_sorted(cls, keys: Iterable[TKey], values: Iterable[TValue] = None) -> AVLTree:
+        """Builds a perfectly balanced tree from keys which are already in order in O(n),
+        without any rotations.
+
+        :param keys: The keys in non-decreasing order.
+        :param values: The values of the keys in the same order, or None to store
+            each key as its own value.
+        :raises ValueError: If the keys are not in order or the lengths differ.
+        """
+        tree = cls()
+        keys = list(keys)
+        values = keys if values is None else list(values)
+        if len(values) != len(keys):
+            raise ValueError('The keys and the values differ in length')
+        for previous, key in zip(keys, islice(keys, 1, None)):
+            if key < previous:
+                raise ValueError(f'{key} is after {previous}, the keys are not sorted')
+
+        tree._link_balanced([AVLTreeNode(key, value, None) for key, value in zip(keys, values)])
+        return tree
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[TNode]) -> AVLTree:
+        """Builds a balanced tree of the values in any order in O(n log n), by sorting
+        them first and then building the tree as from_sorted does.
+
+        :param values: The values to add.
+        """
+        return cls.from_sorted(sorted(values))
+
+    def extend(self, values: Iterable[TNode]):
+        """Adds all the provided values. A few values are added one by one, while many
+        are merged with the nodes of the tree, which is then rebuilt balanced in
+        O(n + m log m) instead of m rotating inserts.
+
+        :param values: The values to add.
+        """
+        values = sorted(values)
+        if len(values) * max(1, self._count.bit_length()) < self._count:
+            for value in values:
+                self.add(value)
+            return
+
+        new_nodes = [AVLTreeNode(value, value, None) for value in values]
+        self._link_balanced(list(merge(self._enumerate_nodes_in_order(), new_nodes, key=attrgetter('key'))))
+
+    def _link_balanced(self, nodes: List[AVLTreeNode]):
+        """Makes the nodes, which are in order, a perfectly balanced tree."""
+        self.head = self._link_range(nodes, 0, len(nodes), None)
+        self._count = len(nodes)
+
+    def _link_range(self, nodes: List[AVLTreeNode], low: int, high: int,
+                    parent: Optional[AVLTreeNode]) -> Optional[AVLTreeNode]:
+        """Links nodes[low:high] below parent around their middle node and returns it.
+        The recursion is only as deep as the resulting tree."""
+        if low >= high:
+            return None
+
+        middle = (low + high) // 2
+        node = nodes[middle]
+        node.parent = parent
+        node.left = self._link_range(nodes, low, middle, node)
+        node.right = self._link_range(nodes, middle + 1, high, node)
+        node.update_height()
+        node.size = high - low
+        return node
+    # endregion
+
     # region Add
     def add(self, value: TNode):
         """Adds the provided value to the binary tree.
 
         :param value: Value to add to the tree.
         """
+        self._insert(value, value)
+
+    def put(self, key: TKey, value: TValue):
+        """Associates the value with the key, replacing the value of the key if it exists.
+
+        :param key: The key of the value.
+        :param value: The value to store.
+        """
+        node, _ = self._find_with_parent(key)
+        if node is not None:
+            node.value = value
+        else:
+            self._insert(key, value)
+
+    def _insert(self, key: TKey, value: TValue) -> AVLTreeNode:
+        """Adds a new node with the key and the value and returns it."""
         if self.head is None:
             # Case 1: The tree is empty - allocate the head.
-            self.head = AVLTreeNode(value, None, self)
+            self.head = node = AVLTreeNode(key, value, None)
         else:
             # Case 2: The tree is not empty so find the right location to insert.
-            self._add_to(self.head, value)
+            node = self._add_to(self.head, key, value)
 
         self._count += 1
-
-    def _add_to(self, node: AVLTreeNode, value: TNode):
-        """Recursion add algorithm."""
-        if node.compare_to_value(value) > 0:
-            # Case 1: value is less than the current node value.
-            if node.left is None:
-                # If there is no left child, make this the new left.
-                node.left = AVLTreeNode(value, node, self)
+        return node
+
+    def _add_to(self, node: AVLTreeNode, key: TKey, value: TValue) -> AVLTreeNode:
+        """Iterative add algorithm: walks down to the insert position, then back up
+        the parent pointers balancing every ancestor of the new node."""
+        while True:
+            if node.compare_to_value(key) > 0:
+                # Case 1: key is less than the current node key.
+                if node.left is None:
+                    # If there is no left child, make this the new left.
+                    new_node = node.left = AVLTreeNode(key, value, node)
+                    break
+                node = node.left
             else:
-                self._add_to(node.left, value)
-        else:
-            # Case 2: value is greater than or equal to the current node value.
-            if node.right is None:
-                # If there is no right child, make this the new right.
-                node.right = AVLTreeNode(value, node, self)
-            else:
-                self._add_to(node.right, value)
-
-        node.balance()
+                # Case 2: key is greater than or equal to the current node key.
+                if node.right is None:
+                    # If there is no right child, make this the new right.
+                    new_node = node.right = AVLTreeNode(key, value, node)
+                    break
+                node = node.right
+
+        self._rebalance_from(node)
+        return new_node
     # endregion
 
     def contains(self, value: TNode) -> bool:
@@ -259,112 +561,507 @@ class AVLTree:
         :param value: The param to remove.
         :return: True if value was removed, False otherwise.
         """
-        current, parent = self._find_with_parent(value)
+        current, _ = self._find_with_parent(value)
         if current is None:
             return False
 
-        if current.right is None:
-            # Case 1: If current has no right child, then current's left replaces current.
-            if parent is None:
-                self.head = current.left
+        self._remove_node(current)
+        return True
+
+    def _remove_node(self, current: AVLTreeNode):
+        """Unlinks the node from the tree and rebalances its ancestors."""
+        parent = current.parent
+
+        if current.left is None or current.right is None:
+            # Case 1: current has at most one child, which takes its place.
+            self._replace_child(parent, current, current.left or current.right)
+            rebalance_from = parent
+        else:
+            # Case 2: current has two children, so its successor (the left most node
+            # of its right subtree) takes its place.
+            successor = current.right
+            while successor.left is not None:
+                successor = successor.left
+
+            if successor.parent is current:
+                # The successor keeps its right subtree and is the lowest changed node.
+                rebalance_from = successor
             else:
-                if parent.compare_to(current) > 0:
-                    # If parent value is greater than current value,
-                    # make the current left child a left child of parent.
-                    parent.left = current.left
-                else:
-                    # If parent value is less than or equal to current value,
-                    # make the current left child a right child of parent.
-                    parent.right = current.left
-        elif current.right.left is None:
-            # Case 2: If current's right has no left child, then current's right child replaces current.
-            current.right.left = current.left
-
-            if parent is None:
-                self.head = current.right
+                # The successor's right subtree takes the successor's place first.
+                rebalance_from = successor.parent
+                self._replace_child(successor.parent, successor, successor.right)
+                successor.right = current.right
+                successor.right.parent = successor
+
+            successor.left = current.left
+            successor.left.parent = successor
+            successor.height = current.height
+            self._replace_child(parent, current, successor)
+
+        # Detach the removed node so that it does not keep the tree alive.
+        current.parent = current.left = current.right = None
+
+        self._rebalance_from(rebalance_from)
+        self._count -= 1
+
+    def _replace_child(self, parent: Optional[AVLTreeNode], child: AVLTreeNode, new_child: Optional[AVLTreeNode]):
+        """Puts new_child in the place of child below parent, or makes it the head if parent is None."""
+        if parent is None:
+            self.head = new_child
+        elif parent.left is child:
+            parent.left = new_child
+        else:
+            parent.right = new_child
+
+        if new_child is not None:
+            new_child.parent = parent
+    # endregion
+
+    def _rebalance_from(self, node: Optional[AVLTreeNode]):
+        """Walks up the parent pointers from node towards the head, updating the height
+        of every node and rotating the unbalanced ones. Once a subtree ends up as high
+        as it was before, nothing above it needs balancing and only the sizes are updated."""
+        while node is not None:
+            parent = node.parent
+            height = node.height
+            node.balance()
+
+            if node.parent is not parent:
+                # A rotation moved node below the new root of its subtree.
+                node = node.parent
+                if parent is None:
+                    self.head = node
+            if node.height == height:
+                break
+
+            node = parent
+
+        if node is not None:
+            node = node.parent
+            while node is not None:
+                node.update_size()
+                node = node.parent
+
+    def check_invariants(self):
+        """Verifies the structure of the tree: the parent pointers, the ordering of the
+        values, the cached heights, the balance of every node and the count.
+
+        :raises ValueError: If any of the invariants does not hold.
+        """
+        if self.head is not None and self.head.parent is not None:
+            raise ValueError('The head has a parent')
+
+        count = 0
+        previous = None
+        for node in self._enumerate_nodes_post_order():
+            count += 1
+            for child in (node.left, node.right):
+                if child is not None and child.parent is not node:
+                    raise ValueError(f'The parent pointer of {child.key} is not {node.key}')
+
+            if node.height != 1 + max(node._left_height, node._right_height):
+                raise ValueError(f'The cached height of {node.key} is wrong')
+            if node.size != 1 + node._left_size + node._right_size:
+                raise ValueError(f'The cached size of {node.key} is wrong')
+            if abs(node._balance_factor) > 1:
+                raise ValueError(f'{node.key} is unbalanced')
+
+        for key, _ in self.range():
+            if previous is not None and key < previous:
+                raise ValueError(f'{key} is after {previous} in order')
+            previous = key
+
+        if count != self._count:
+            raise ValueError(f'The tree has {count} nodes but a count of {self._count}')
+
+    # region Join and Split
+    @classmethod
+    def _from_root(cls, root: Optional[AVLTreeNode]) -> AVLTree:
+        """Returns a new tree whose head is the detached subtree root."""
+        tree = cls()
+        if root is not None:
+            root.parent = None
+            tree.head = root
+            tree._count = root.size
+
+        return tree
+
+    @classmethod
+    def join(cls, left: AVLTree, pivot: TKey, right: AVLTree, value: TValue = _MISSING) -> AVLTree:
+        """Joins two trees and a new pivot node into one tree in O(log n). The nodes of both
+        trees are moved into the result, so they are left empty.
+
+        :param left: The tree whose keys are not greater than the pivot.
+        :param pivot: The key of the new node between the two trees.
+        :param right: The tree whose keys are not less than the pivot.
+        :param value: The value of the pivot, which is its own value if not provided.
+        :raises ValueError: If the keys are not ordered around the pivot.
+        """
+        if (left.head is not None and left.max() > pivot) or (right.head is not None and right.min() < pivot):
+            raise ValueError(f'The keys of the trees are not ordered around {pivot}')
+
+        node = AVLTreeNode(pivot, pivot if value is _MISSING else value, None)
+        tree = cls._from_root(_join(left.head, node, right.head))
+        left.clear()
+        right.clear()
+        return tree
+
+    def split(self, key: TKey) -> (AVLTree, AVLTree):
+        """Splits the tree at the key in O(log n). The nodes are moved into the two
+        resulting trees, so this tree is left empty.
+
+        :param key: The key to split at.
+        :return: Tuple of a tree with the keys less than the key and a tree with the others.
+        """
+        less, rest = _split(self.head, key)
+        self.clear()
+        return self._from_root(less), self._from_root(rest)
+
+    def union(self, other: AVLTree) -> AVLTree:
+        """Returns a tree with the keys of both trees. For a key in both, the node of this
+        tree is kept. It takes O(m log(n/m + 1)) for trees of sizes m <= n, rather than m
+        inserts, and moves the nodes, so both trees are left empty.
+
+        :param other: The other tree.
+        """
+        tree = self._from_root(_union(self.head, other.head))
+        self._clear_operands(other)
+        return tree
+
+    def intersection(self, other: AVLTree) -> AVLTree:
+        """Returns a tree with the nodes of this tree whose keys are also in the other tree,
+        in O(m log(n/m + 1)). Both trees are left empty.
+
+        :param other: The other tree.
+        """
+        tree = self._from_root(_intersection(self.head, other.head))
+        self._clear_operands(other)
+        return tree
+
+    def difference(self, other: AVLTree) -> AVLTree:
+        """Returns a tree with the nodes of this tree whose keys are not in the other tree,
+        in O(m log(n/m + 1)). Both trees are left empty.
+
+        :param other: The other tree.
+        """
+        tree = self._from_root(_difference(self.head, other.head))
+        self._clear_operands(other)
+        return tree
+
+    def _clear_operands(self, other: AVLTree):
+        """Empties the operands of a set operation, whose nodes were moved into the result."""
+        self.clear()
+        other.clear()
+    # endregion
+
+    # region Ordered Map
+    # The queries return keys or (key, value) pairs, never nodes. min, max, pop_min and
+    # pop_max raise ValueError on an empty tree, like min() of an empty sequence.
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: TKey) -> bool:
+        return self.contains(key)
+
+    def get(self, key: TKey, default: TValue = None) -> TValue:
+        """Returns the value of the key, or the default if the key is not in the tree.
+
+        :param key: The key whose value is sought.
+        :param default: The value returned if the key is not found.
+        """
+        node, _ = self._find_with_parent(key)
+        return default if node is None else node.value
+
+    def floor(self, key: TKey) -> Optional[TKey]:
+        """Returns the greatest key less than or equal to the provided key, or None if there is none.
+
+        :param key: The key to search for.
+        """
+        result = None
+        current: AVLTreeNode = self.head
+
+        while current is not None:
+            if current.compare_to_value(key) > 0:
+                current = current.left
             else:
-                if parent.compare_to(current) > 0:
-                    # If parent value is greater than current value,
-                    # make the current left right a left child of parent.
-                    parent.left = current.right
+                # A candidate; a closer one can only be to the right.
+                result = current
+                current = current.right
+
+        return None if result is None else result.key
+
+    def ceiling(self, key: TKey) -> Optional[TKey]:
+        """Returns the least key greater than or equal to the provided key, or None if there is none.
+
+        :param key: The key to search for.
+        """
+        node = self._lower_bound_node(key)
+        return None if node is None else node.key
+
+    def lower_bound(self, key: TKey) -> Optional[Tuple[TKey, TValue]]:
+        """Returns the first (key, value) pair in order whose key is not less than the
+        provided key, or None if every key is less.
+
+        :param key: The key to search for.
+        """
+        node = self._lower_bound_node(key)
+        return None if node is None else (node.key, node.value)
+
+    def _lower_bound_node(self, key: TKey) -> Optional[AVLTreeNode]:
+        result = None
+        current: AVLTreeNode = self.head
+
+        while current is not None:
+            if current.compare_to_value(key) < 0:
+                current = current.right
+            else:
+                # A candidate; a closer one can only be to the left.
+                result = current
+                current = current.left
+
+        return result
+
+    def min(self) -> TKey:
+        """Returns the least key.
+
+        :raises ValueError: If the tree is empty.
+        """
+        return self._min_node().key
+
+    def max(self) -> TKey:
+        """Returns the greatest key.
+
+        :raises ValueError: If the tree is empty.
+        """
+        return self._max_node().key
+
+    def pop_min(self) -> (TKey, TValue):
+        """Removes the node with the least key.
+
+        :return: Tuple of the key and the value of the removed node.
+        :raises ValueError: If the tree is empty.
+        """
+        node = self._min_node()
+        self._remove_node(node)
+        return node.key, node.value
+
+    def pop_max(self) -> (TKey, TValue):
+        """Removes the node with the greatest key.
+
+        :return: Tuple of the key and the value of the removed node.
+        :raises ValueError: If the tree is empty.
+        """
+        node = self._max_node()
+        self._remove_node(node)
+        return node.key, node.value
+
+    def _min_node(self) -> AVLTreeNode:
+        if self.head is None:
+            raise ValueError('The tree is empty')
+
+        current = self.head
+        while current.left is not None:
+            current = current.left
+        return current
+
+    def _max_node(self) -> AVLTreeNode:
+        if self.head is None:
+            raise ValueError('The tree is empty')
+
+        current = self.head
+        while current.right is not None:
+            current = current.right
+        return current
+
+    def range(self, low: TKey = None, high: TKey = None, reverse: bool = False):
+        """Enumerates the (key, value) pairs with low <= key < high in order, or in reverse
+        order. It seeks to the first pair in O(log n) and then visits only the pairs
+        yielded. The tree must not be modified while enumerating.
+
+        :param low: The inclusive lower bound, or None for no lower bound.
+        :param high: The exclusive upper bound, or None for no upper bound.
+        :param reverse: True to enumerate from the greatest key down.
+        :return: The enumerator.
+        """
+        # The stack holds the ancestors still to be yielded, the next one on top.
+        stack = deque()
+        current: AVLTreeNode = self.head
+
+        if not reverse:
+            # Seek to low, keeping the nodes which are not less than it.
+            while current is not None:
+                if low is None or current.compare_to_value(low) >= 0:
+                    stack.append(current)
+                    current = current.left
                 else:
-                    # If parent value is less than or equal to current value,
-                    # make the current left right a right child of parent.
-                    parent.right = current.right
+                    current = current.right
+
+            while stack:
+                current = stack.pop()
+                if high is not None and current.compare_to_value(high) >= 0:
+                    return
+                yield current.key, current.value
+
+                # The successor is the left most node of the right subtree.
+                current = current.right
+                while current is not None:
+                    stack.append(current)
+                    current = current.left
         else:
-            # Case 3: If current's right child has a left child, then replace current with current's
-            # right child's left most child.
+            # Seek to high, keeping the nodes which are less than it.
+            while current is not None:
+                if high is None or current.compare_to_value(high) < 0:
+                    stack.append(current)
+                    current = current.right
+                else:
+                    current = current.left
 
-            # Find the right child's left most node and its parent.
-            left_most = current.right.left
-            left_most_parent = current.right
+            while stack:
+                current = stack.pop()
+                if low is not None and current.compare_to_value(low) < 0:
+                    return
+                yield current.key, current.value
 
-            while left_most.left is not None:
-                left_most_parent = left_most
-                left_most = left_most.left
+                # The predecessor is the right most node of the left subtree.
+                current = current.left
+                while current is not None:
+                    stack.append(current)
+                    current = current.right
+    # endregion
 
-            # The parent's left subtree becomes the leftmost's right subtree.
-            left_most_parent.left = left_most.right
+    # region Order Statistics
+    def __getitem__(self, index: int) -> TKey:
+        """Returns the key at the specified position in order, counting from the end if negative.
 
-            # Assign leftmost's left and right to current's left and right children.
-            left_most.left = current.left
-            left_most.right = current.right
+        :param index: The position of the key.
+        :raises IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index += self._count
+
+        return self.select(index)
+
+    def select(self, index: int) -> TKey:
+        """Returns the key at the specified zero based position in order, i.e. the
+        (index + 1)-th smallest key, in O(log n).
+
+        :param index: The position of the key.
+        :raises IndexError: If the index is out of range.
+        """
+        if not 0 <= index < self._count:
+            raise IndexError(f'Index {index} is out of range')
+
+        current: AVLTreeNode = self.head
+        while True:
+            left_size = current._left_size
 
-            if parent is None:
-                self.head = left_most
+            if index < left_size:
+                current = current.left
+            elif index > left_size:
+                # Skip the left subtree and the current node.
+                index -= left_size + 1
+                current = current.right
             else:
-                if parent.compare_to(current) > 0:
-                    # If parent value is greater than current value,
-                    # make leftmost the left child of parent.
-                    parent.left = left_most
-                else:
-                    # If parent value is less than or equal to current value,
-                    # make leftmost the right child of parent.
-                    parent.right = left_most
+                return current.key
 
-            if parent:
-                parent.balance()
-            elif self.head:
-                self.head.balance()
+    def rank(self, key: TKey) -> int:
+        """Returns the number of keys in the tree which are less than the provided key,
+        which is the position the key has or would have in order, in O(log n).
 
-        self._count -= 1
-        return True
+        :param key: The key to rank.
+        """
+        rank = 0
+        current: AVLTreeNode = self.head
+
+        while current is not None:
+            if current.compare_to_value(key) < 0:
+                # The current node and its left subtree are all less than key.
+                rank += current._left_size + 1
+                current = current.right
+            else:
+                current = current.left
+
+        return rank
+
+    def count_range(self, low: TKey, high: TKey) -> int:
+        """Returns the number of keys k in the tree with low <= k < high in O(log n).
+
+        :param low: The inclusive lower bound.
+        :param high: The exclusive upper bound.
+        """
+        return max(0, self.rank(high) - self.rank(low))
     # endregion
 
     # region Pre-Order Traversal
     def pre_order_traversal(self, action):
         """Performs the provided action on each binary tree value in pre-order traversal order."""
-        self._pre_order_traversal(action, self.head)
+        for value in self.enumerate_pre_order_traversal():
+            action(value)
 
-    def _pre_order_traversal(self, action, node: AVLTreeNode):
-        if node is not None:
-            action(node.value())
-            self._pre_order_traversal(action, node.left)
-            self._pre_order_traversal(action, node.right)
+    def enumerate_pre_order_traversal(self):
+        """Enumerates the values contained in the binary tree in pre-order traversal order.
+
+        :return: The enumerator.
+        """
+        # Store the nodes whose right subtree is still to be visited in this stack.
+        stack = deque()
+        current: AVLTreeNode = self.head
+
+        while current is not None or stack:
+            if current is None:
+                current = stack.pop()
+
+            # Pre-order is yield -> left -> right
+            yield current.value
+
+            if current.right is not None:
+                stack.append(current.right)
+            current = current.left
     # endregion
 
     # region Post-Order Traversal
     def post_order_traversal(self, action):
         """Performs the provided action on each binary tree value in post-order traversal order."""
-        self._post_order_traversal(action, self.head)
+        for value in self.enumerate_post_order_traversal():
+            action(value)
 
-    def _post_order_traversal(self, action, node: AVLTreeNode):
-        if node is not None:
-            self._post_order_traversal(action, node.left)
-            self._post_order_traversal(action, node.right)
-            action(node.value())
+    def enumerate_post_order_traversal(self):
+        """Enumerates the values contained in the binary tree in post-order traversal order.
+
+        :return: The enumerator.
+        """
+        for node in self._enumerate_nodes_post_order():
+            # Post-order is left -> right -> yield
+            yield node.value
+
+    def _enumerate_nodes_post_order(self):
+        """Enumerates the nodes of the tree in post-order, so children come before their parents."""
+        # Store the nodes whose subtrees are still being visited in this stack.
+        stack = deque()
+        current: AVLTreeNode = self.head
+        last_yielded: Optional[AVLTreeNode] = None
+
+        while current is not None or stack:
+            if current is not None:
+                # Go as far left as possible first.
+                stack.append(current)
+                current = current.left
+                continue
+
+            node: AVLTreeNode = stack[-1]
+            if node.right is not None and node.right is not last_yielded:
+                # The right subtree has not been visited yet.
+                current = node.right
+            else:
+                yield node
+                last_yielded = stack.pop()
     # endregion
 
     # region In-Order Traversal
     def in_order_traversal(self, action):
         """Performs the provided action on each binary tree value in in-order traversal order."""
-        self._in_order_traversal(action, self.head)
-
-    def _in_order_traversal(self, action, node: AVLTreeNode):
-        if node is not None:
-            self._in_order_traversal(action, node.left)
-            action(node.value())
-            self._in_order_traversal(action, node.right)
+        for value in self.enumerate_in_order_traversal():
+            action(value)
 
     def enumerate_in_order_traversal(self):
         """Enumerates the values contained in the binary tree in in-order traversal order.
@@ -410,6 +1107,46 @@ class AVLTree:
                     # so we can process it and then go to its right node.
                     current = stack.pop()
                     go_left_next = False
+
+    def _enumerate_nodes_in_order(self):
+        """Enumerates the nodes of the tree in in-order traversal order."""
+        stack = deque()
+        current: AVLTreeNode = self.head
+
+        while current is not None or stack:
+            if current is not None:
+                stack.append(current)
+                current = current.left
+            else:
+                current = stack.pop()
+                yield current
+                current = current.right
+    # endregion
+
+    # region Level-Order Traversal
+    def level_order_traversal(self, action):
+        """Performs the provided action on each binary tree value in level-order traversal order."""
+        for value in self.enumerate_level_order_traversal():
+            action(value)
+
+    def enumerate_level_order_traversal(self):
+        """Enumerates the values contained in the binary tree level by level from the head,
+        each level from left to right.
+
+        :return: The enumerator.
+        """
+        if self.head is None:
+            return
+
+        queue = deque([self.head])
+        while queue:
+            node: AVLTreeNode = queue.popleft()
+            yield node.value
+
+            if node.left is not None:
+                queue.append(node.left)
+            if node.right is not None:
+                queue.append(node.right)
     # endregion
 
     def clear(self):
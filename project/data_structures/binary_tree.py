@@ -1,9 +1,15 @@
 from __future__ import annotations
 from collections import deque
+from heapq import merge
+from itertools import islice
+from operator import attrgetter
+from typing import Optional, Iterable, List
 
 
 class BinaryTreeNode:
     """A binary tree node class - encapsulates the value and left/right pointers."""
+    __slots__ = ('_value', 'left', 'right')
+
     def __init__(self, value):
         self._value = value
         self.left = None
@@ -49,6 +55,68 @@ class BinaryTree:
     def head(self):
         return self._head
 
+    # region Bulk Build
+    @classmethod
+    def from_sorted(cls, values: Iterable) -> BinaryTree:
+        """Builds a perfectly balanced tree from values which are already in order in O(n),
+        instead of the degenerate list adding them one by one would make.
+
+        :param values: The values in non-decreasing order.
+        :raises ValueError: If the values are not in order.
+        """
+        tree = cls()
+        values = list(values)
+        for previous, value in zip(values, islice(values, 1, None)):
+            if value < previous:
+                raise ValueError(f'{value} is after {previous}, the values are not sorted')
+
+        tree._link_balanced([BinaryTreeNode(value) for value in values])
+        return tree
+
+    @classmethod
+    def from_iterable(cls, values: Iterable) -> BinaryTree:
+        """Builds a balanced tree of the values in any order in O(n log n), by sorting
+        them first and then building the tree as from_sorted does.
+
+        :param values: The values to add.
+        """
+        return cls.from_sorted(sorted(values))
+
+    def extend(self, values: Iterable):
+        """Adds all the provided values. A few values are added one by one, at the cost of
+        the depth of the tree each, while many are merged with the nodes of the tree,
+        which is then rebuilt balanced in O(n + m log m).
+
+        :param values: The values to add.
+        """
+        values = sorted(values)
+        if len(values) * max(1, self._count.bit_length()) < self._count:
+            for value in values:
+                self.add(value)
+            return
+
+        new_nodes = [BinaryTreeNode(value) for value in values]
+        if new_nodes:
+            self._link_balanced(list(merge(self._enumerate_nodes_in_order(), new_nodes, key=attrgetter('value'))))
+
+    def _link_balanced(self, nodes: List[BinaryTreeNode]):
+        """Makes the nodes, which are in order, a perfectly balanced tree."""
+        self._head = self._link_range(nodes, 0, len(nodes))
+        self._count = len(nodes)
+
+    def _link_range(self, nodes: List[BinaryTreeNode], low: int, high: int) -> Optional[BinaryTreeNode]:
+        """Links nodes[low:high] around their middle node and returns it.
+        The recursion is only as deep as the resulting tree."""
+        if low >= high:
+            return None
+
+        middle = (low + high) // 2
+        node = nodes[middle]
+        node.left = self._link_range(nodes, low, middle)
+        node.right = self._link_range(nodes, middle + 1, high)
+        return node
+    # endregion
+
     # region Add
     def add(self, value):
         """Adds the provided value to the binary tree.
@@ -65,21 +133,22 @@ class BinaryTree:
         self._count += 1
 
     def _add_to(self, node: BinaryTreeNode, value):
-        """Recursion add algorithm."""
-        if node.compare_to_value(value) > 0:
-            # Case 1: value is less than the current node value.
-            if node.left is None:
-                # If there is no left child, make this the new left.
-                node.left = BinaryTreeNode(value)
+        """Iterative add algorithm, so that degenerate trees do not exhaust the recursion limit."""
+        while True:
+            if node.compare_to_value(value) > 0:
+                # Case 1: value is less than the current node value.
+                if node.left is None:
+                    # If there is no left child, make this the new left.
+                    node.left = BinaryTreeNode(value)
+                    return
+                node = node.left
             else:
-                self._add_to(node.left, value)
-        else:
-            # Case 2: value is greater than or equal to the current node value.
-            if node.right is None:
-                # If there is no right child, make this the new right.
-                node.right = BinaryTreeNode(value)
-            else:
-                self._add_to(node.right, value)
+                # Case 2: value is greater than or equal to the current node value.
+                if node.right is None:
+                    # If there is no right child, make this the new right.
+                    node.right = BinaryTreeNode(value)
+                    return
+                node = node.right
     # endregion
 
     def contains(self, value) -> bool:
@@ -197,37 +266,68 @@ class BinaryTree:
     # region Pre-Order Traversal
     def pre_order_traversal(self, action):
         """Performs the provided action on each binary tree value in pre-order traversal order."""
-        self._pre_order_traversal(action, self._head)
+        for value in self.enumerate_pre_order_traversal():
+            action(value)
+
+    def enumerate_pre_order_traversal(self):
+        """Enumerates the values contained in the binary tree in pre-order traversal order.
 
-    def _pre_order_traversal(self, action, node: BinaryTreeNode):
-        if node is not None:
-            action(node.value)
-            self._pre_order_traversal(action, node.left)
-            self._pre_order_traversal(action, node.right)
+        :return: The enumerator.
+        """
+        # Store the nodes whose right subtree is still to be visited in this stack.
+        stack = deque()
+        current: BinaryTreeNode = self._head
+
+        while current is not None or stack:
+            if current is None:
+                current = stack.pop()
+
+            # Pre-order is yield -> left -> right
+            yield current.value
+
+            if current.right is not None:
+                stack.append(current.right)
+            current = current.left
     # endregion
 
     # region Post-Order Traversal
     def post_order_traversal(self, action):
         """Performs the provided action on each binary tree value in post-order traversal order."""
-        self._post_order_traversal(action, self._head)
+        for value in self.enumerate_post_order_traversal():
+            action(value)
 
-    def _post_order_traversal(self, action, node: BinaryTreeNode):
-        if node is not None:
-            self._post_order_traversal(action, node.left)
-            self._post_order_traversal(action, node.right)
-            action(node.value)
+    def enumerate_post_order_traversal(self):
+        """Enumerates the values contained in the binary tree in post-order traversal order.
+
+        :return: The enumerator.
+        """
+        # Store the nodes whose subtrees are still being visited in this stack.
+        stack = deque()
+        current: BinaryTreeNode = self._head
+        last_yielded: Optional[BinaryTreeNode] = None
+
+        while current is not None or stack:
+            if current is not None:
+                # Go as far left as possible first.
+                stack.append(current)
+                current = current.left
+                continue
+
+            node: BinaryTreeNode = stack[-1]
+            if node.right is not None and node.right is not last_yielded:
+                # The right subtree has not been visited yet.
+                current = node.right
+            else:
+                # Post-order is left -> right -> yield
+                yield node.value
+                last_yielded = stack.pop()
     # endregion
 
     # region In-Order Traversal
     def in_order_traversal(self, action):
         """Performs the provided action on each binary tree value in in-order traversal order."""
-        self._in_order_traversal(action, self._head)
-
-    def _in_order_traversal(self, action, node: BinaryTreeNode):
-        if node is not None:
-            self._in_order_traversal(action, node.left)
-            action(node.value)
-            self._in_order_traversal(action, node.right)
+        for value in self.enumerate_in_order_traversal():
+            action(value)
 
     def enumerate_in_order_traversal(self):
         """Enumerates the values contained in the binary tree in in-order traversal order.
@@ -273,6 +373,46 @@ class BinaryTree:
                     # so we can process it and then go to its right node.
                     current = stack.pop()
                     go_left_next = False
+
+    def _enumerate_nodes_in_order(self):
+        """Enumerates the nodes of the tree in in-order traversal order."""
+        stack = deque()
+        current: BinaryTreeNode = self._head
+
+        while current is not None or stack:
+            if current is not None:
+                stack.append(current)
+                current = current.left
+            else:
+                current = stack.pop()
+                yield current
+                current = current.right
+    # endregion
+
+    # region Level-Order Traversal
+    def level_order_traversal(self, action):
+        """Performs the provided action on each binary tree value in level-order traversal order."""
+        for value in self.enumerate_level_order_traversal():
+            action(value)
+
+    def enumerate_level_order_traversal(self):
+        """Enumerates the values contained in the binary tree level by level from the head,
+        each level from left to right.
+
+        :return: The enumerator.
+        """
+        if self._head is None:
+            return
+
+        queue = deque([self._head])
+        while queue:
+            node: BinaryTreeNode = queue.popleft()
+            yield node.value
+
+            if node.left is not None:
+                queue.append(node.left)
+            if node.right is not None:
+                queue.append(node.right)
     # endregion
 
     def clear(self):
@@ -0,0 +1,310 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from functools import wraps
+from time import monotonic
+from typing import TypeVar, Callable, Optional
+from .doubly_linked_list import LinkedList, LinkedListNode
+from .hash_table import HashTable
+
+TKey = TypeVar('TKey')
+TValue = TypeVar('TValue')
+
+_MISSING = object()      # The default of the memoize lookups, as results may be None
+_KWARGS_MARK = object()  # Separates the positional from the keyword arguments in memoize keys
+
+
+class _CacheEntry:
+    """The value of the linked list nodes in the caches."""
+
+    def __init__(self, key: TKey, value: TValue):
+        self.key: TKey = key
+        self.value: TValue = value
+        self.frequency: int = 1                             # The number of uses (LFUCache)
+        self.expires: float = 0.0                           # The time the entry expires at (TTLCache)
+        self.expiry_node: Optional[LinkedListNode] = None   # The node in the expiry list (TTLCache)
+
+
+class Cache(ABC):
+    """The base of the bounded caches: a hash table from each key to its linked
+    list node, so that finding, moving and evicting an entry are all O(1)."""
+
+    # The hash table is sized up front for at most this many entries and grows as usual past it.
+    _reserve_limit: int = 1024
+
+    def __init__(self, capacity: int):
+        """Constructs a cache holding at most the specified number of entries.
+
+        :param capacity: The maximum number of entries.
+        """
+        if capacity <= 0:
+            raise ValueError('The capacity must be positive')
+
+        self._capacity = capacity
+        self._nodes = HashTable()
+        self._nodes.reserve(min(capacity, self._reserve_limit))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key: TKey) -> bool:
+        return self._lookup(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def count(self) -> int:
+        """The number of entries currently in the cache."""
+        return len(self._nodes)
+
+    def capacity(self) -> int:
+        """The maximum number of entries in the cache."""
+        return self._capacity
+
+    def _lookup(self, key: TKey) -> Optional[LinkedListNode]:
+        """Returns the node of the key, or None if the key is not cached."""
+        return self._nodes.get(key)
+
+    def get(self, key: TKey, default: TValue = None) -> TValue:
+        """Returns the cached value of the key, counting a hit or a miss.
+
+        :param key: The key whose value is sought.
+        :param default: The value returned if the key is not cached.
+        """
+        node = self._lookup(key)
+        if node is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._touch(node)
+        return node.value.value
+
+    def put(self, key: TKey, value: TValue):
+        """Caches the value of the key, evicting an entry if the cache is full.
+
+        :param key: The key being cached.
+        :param value: The value of the key.
+        """
+        node = self._lookup(key)
+        if node is not None:
+            node.value.value = value
+            self._touch(node)
+            return
+
+        if len(self._nodes) >= self._capacity:
+            self._evict()
+            self.evictions += 1
+
+        node = LinkedListNode(_CacheEntry(key, value))
+        self._nodes[key] = node
+        self._insert(node)
+
+    def remove(self, key: TKey) -> bool:
+        """Removes the key from the cache.
+
+        :param key: The key to remove.
+        :return: True if the key was cached, False otherwise.
+        """
+        node = self._nodes.pop(key, None)
+        if node is None:
+            return False
+
+        self._unlink(node)
+        return True
+
+    def clear(self):
+        """Removes every entry from the cache. The counters are kept."""
+        self._nodes.clear()
+
+    @abstractmethod
+    def _touch(self, node: LinkedListNode):
+        """Records a use of the node's entry."""
+
+    @abstractmethod
+    def _insert(self, node: LinkedListNode):
+        """Adds the node of a new entry to the eviction order."""
+
+    @abstractmethod
+    def _unlink(self, node: LinkedListNode):
+        """Removes the node of an entry from the eviction order."""
+
+    @abstractmethod
+    def _evict(self):
+        """Removes the entry which should go first."""
+
+
+class LRUCache(Cache):
+    """A bounded cache evicting the least recently used entry.
+
+    The entries are kept in a doubly linked list from the most to the least
+    recently used: a use moves its node to the head and eviction drops the tail.
+    """
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._list = LinkedList()
+
+    def clear(self):
+        super().clear()
+        self._list.clear()
+
+    def _touch(self, node: LinkedListNode):
+        self._list.move_to_front(node)
+
+    def _insert(self, node: LinkedListNode):
+        self._list.add_first(node)
+
+    def _unlink(self, node: LinkedListNode):
+        self._list.unlink(node)
+
+    def _evict(self):
+        node = self._list.tail()
+        self._unlink(node)
+        self._nodes.remove(node.value.key)
+
+
+class LFUCache(Cache):
+    """A bounded cache evicting the least frequently used entry, and the least
+    recently used one among entries used equally often.
+
+    Every use count has its own doubly linked list of entries, ordered from the
+    most to the least recently used, and the smallest use count is tracked, so
+    both a use and an eviction are O(1).
+    """
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._frequency_lists = HashTable()
+        self._min_frequency = 0
+
+    def clear(self):
+        super().clear()
+        self._frequency_lists.clear()
+        self._min_frequency = 0
+
+    def _frequency_list(self, frequency: int) -> LinkedList:
+        """Returns the list of entries used the specified number of times, creating it if required."""
+        frequency_list = self._frequency_lists.get(frequency)
+        if frequency_list is None:
+            frequency_list = self._frequency_lists[frequency] = LinkedList()
+
+        return frequency_list
+
+    def _touch(self, node: LinkedListNode):
+        entry = node.value
+        self._unlink(node)
+        entry.frequency += 1
+        self._frequency_list(entry.frequency).add_first(node)
+
+        if self._min_frequency not in self._frequency_lists:
+            self._min_frequency = entry.frequency
+
+    def _insert(self, node: LinkedListNode):
+        self._frequency_list(1).add_first(node)
+        self._min_frequency = 1
+
+    def _unlink(self, node: LinkedListNode):
+        frequency = node.value.frequency
+        frequency_list = self._frequency_lists[frequency]
+        frequency_list.unlink(node)
+
+        if frequency_list.head() is None:
+            self._frequency_lists.remove(frequency)
+
+    def _evict(self):
+        if self._min_frequency not in self._frequency_lists:
+            # A remove emptied the least frequent list, so find the next one.
+            self._min_frequency = min(self._frequency_lists.keys())
+
+        node = self._frequency_lists[self._min_frequency].tail()
+        self._unlink(node)
+        self._nodes.remove(node.value.key)
+
+
+class TTLCache(LRUCache):
+    """A bounded least recently used cache whose entries also expire a fixed
+    time after they were put.
+
+    Since every entry lives for the same time, a second linked list ordered by
+    put time is also ordered by expiry, so the expired entries are always at its
+    tail and are dropped in O(1) each.
+    """
+
+    def __init__(self, capacity: int, ttl: float, timer: Callable[[], float] = monotonic):
+        """Constructs a cache holding at most the specified number of entries.
+
+        :param capacity: The maximum number of entries.
+        :param ttl: The number of seconds an entry lives after it was put.
+        :param timer: The clock used for the expiry times.
+        """
+        super().__init__(capacity)
+        self._ttl = ttl
+        self._timer = timer
+        self._expiry_list = LinkedList()
+        self.expirations = 0
+
+    def clear(self):
+        super().clear()
+        self._expiry_list.clear()
+
+    def expire(self):
+        """Removes every expired entry."""
+        now = self._timer()
+        expiry_node = self._expiry_list.tail()
+
+        # The values of the expiry list are the nodes of the entries in the LRU list.
+        while expiry_node is not None and expiry_node.value.value.expires <= now:
+            node = expiry_node.value
+            self._nodes.remove(node.value.key)
+            self._unlink(node)
+            self.expirations += 1
+            expiry_node = self._expiry_list.tail()
+
+    def _lookup(self, key: TKey) -> Optional[LinkedListNode]:
+        self.expire()
+        return super()._lookup(key)
+
+    def put(self, key: TKey, value: TValue):
+        super().put(key, value)
+
+        # A new or a replaced value lives for the full time from now.
+        node = self._nodes[key]
+        node.value.expires = self._timer() + self._ttl
+        self._expiry_list.move_to_front(node.value.expiry_node)
+
+    def _insert(self, node: LinkedListNode):
+        super()._insert(node)
+        node.value.expiry_node = LinkedListNode(node)
+        self._expiry_list.add_first(node.value.expiry_node)
+
+    def _unlink(self, node: LinkedListNode):
+        super()._unlink(node)
+        self._expiry_list.unlink(node.value.expiry_node)
+
+
+def memoize(cache: Cache):
+    """Returns a decorator caching the results of a function in the specified cache.
+
+    The positional and keyword arguments of a call make up its key, so they must
+    be hashable. The cache is available as the cache attribute of the function.
+
+    :param cache: The cache to store the results in, e.g. LRUCache(1000).
+    """
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = function(*args, **kwargs)
+                cache.put(key, value)
+
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
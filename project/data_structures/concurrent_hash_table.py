@@ -0,0 +1,351 @@
+from __future__ import annotations
+from collections.abc import MutableMapping
+from threading import Lock
+from typing import TypeVar, List, Optional, Tuple, Generator, Callable, Iterator
+from .hash_table import HashTableNodePair, _mix_hash, _next_power_of_two, _MISSING
+
+TKey = TypeVar('TKey')
+TValue = TypeVar('TValue')
+
+# A bucket is an immutable tuple of (key, value) tuples, or None when empty.
+Bucket = Optional[Tuple[Tuple[TKey, TValue], ...]]
+
+
+class ConcurrentHashTable(MutableMapping):
+    """A thread safe key/value associative collection.
+
+    The buckets are split into lock stripes: the stripe of a bucket is given by
+    the low bits of its index, so every stripe owns a fixed share of the buckets
+    and writers on different stripes never wait for each other. Since the bucket
+    count and the stripe count are both powers of two, a key stays in the same
+    stripe when the array doubles.
+
+    Buckets are immutable tuples which writers replace as a whole, so reads take
+    no lock at all: a reader either sees a bucket before or after a write, never
+    half of one. Resizing takes every stripe lock in order and swaps in the new
+    bucket array once it is complete.
+    """
+
+    # If the array exceeds this fill percentage, it will grow.
+    _fill_factor: float = 0.75
+
+    def __init__(self, capacity: int = 1000, stripes: int = 16):
+        """Constructs a concurrent hash table with the specified capacity.
+
+        :param capacity: The initial capacity of the table.
+        :param stripes: The number of locks the buckets are split between,
+        rounded up to a power of two.
+        """
+        stripes = _next_power_of_two(stripes)
+        self._locks: List[Lock] = [Lock() for _ in range(stripes)]
+        self._stripe_mask = stripes - 1
+
+        # The number of items in each stripe, only changed under its lock.
+        self._counts: List[int] = stripes * [0]
+
+        self._buckets: List[Bucket] = _next_power_of_two(max(capacity, stripes)) * [None]
+        self._max_items_at_current_size = int(self._fill_factor * len(self._buckets)) + 1
+
+    @staticmethod
+    def _find(bucket: Bucket, key: TKey) -> int:
+        """Returns the position of the key in the bucket, or -1 if it is not there."""
+        if bucket is not None:
+            for position, (item_key, _) in enumerate(bucket):
+                if item_key == key:
+                    return position
+
+        return -1
+
+    def _lookup(self, key: TKey, default: TValue) -> TValue:
+        """Returns the value for the key without taking a lock, or the default if it is not found."""
+        buckets = self._buckets
+        bucket = buckets[_mix_hash(hash(key)) & (len(buckets) - 1)]
+        if bucket is not None:
+            for item_key, value in bucket:
+                if item_key == key:
+                    return value
+
+        return default
+
+    def _set_locked(self, buckets: List[Bucket], index: int, stripe: int, key: TKey, value: TValue):
+        """Sets the value of the key in the bucket. The stripe lock must be held."""
+        bucket = buckets[index]
+        position = self._find(bucket, key)
+        if position < 0:
+            buckets[index] = (bucket or ()) + ((key, value),)
+            self._counts[stripe] += 1
+        else:
+            buckets[index] = bucket[:position] + ((key, value),) + bucket[position + 1:]
+
+    def _remove_locked(self, buckets: List[Bucket], index: int, stripe: int, position: int):
+        """Removes the item at the position of the bucket. The stripe lock must be held."""
+        bucket = buckets[index]
+        buckets[index] = (bucket[:position] + bucket[position + 1:]) or None
+        self._counts[stripe] -= 1
+
+    def _grow_if_needed(self):
+        """Doubles the bucket array if the table has gone past its fill factor.
+        Must be called without holding any stripe lock."""
+        if self.count() < self._max_items_at_current_size:
+            return
+
+        # Taking the locks in order means two threads resizing at once cannot deadlock.
+        for lock in self._locks:
+            lock.acquire()
+
+        try:
+            # Another thread may have grown the table while we waited.
+            if self.count() >= self._max_items_at_current_size:
+                larger_buckets: List[Bucket] = 2 * len(self._buckets) * [None]
+                mask = len(larger_buckets) - 1
+
+                for bucket in self._buckets:
+                    if bucket is not None:
+                        for item in bucket:
+                            index = _mix_hash(hash(item[0])) & mask
+                            larger_buckets[index] = (larger_buckets[index] or ()) + (item,)
+
+                self._buckets = larger_buckets
+                self._max_items_at_current_size = int(self._fill_factor * len(larger_buckets)) + 1
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def add(self, key: TKey, value: TValue):
+        """Adds the key/value pair to the hash table.
+
+        :param key: The key of the item being added.
+        :param value: The value of the item being added.
+        :raises KeyError: If the key already exists in the hash table.
+        """
+        h = _mix_hash(hash(key))
+        stripe = h & self._stripe_mask
+
+        with self._locks[stripe]:
+            # The array cannot be swapped by a resize while a stripe lock is held.
+            buckets = self._buckets
+            index = h & (len(buckets) - 1)
+            if self._find(buckets[index], key) >= 0:
+                raise KeyError("The collection already contains the key")
+
+            self._set_locked(buckets, index, stripe, key, value)
+
+        self._grow_if_needed()
+
+    def update(self, *args, **kwargs):
+        """Updates the hash table, called in one of these forms:
+
+        update(key, value) replaces the value of the existing key, raising
+        KeyError if the key does not exist in the hash table.
+
+        update(mapping), update(iterable of key/value pairs) and update(**kwargs),
+        or a mapping or iterable together with keyword arguments, set every pair
+        like dict.update does, adding the keys which do not exist.
+
+        :param args: Either the key and the value, or a single mapping or iterable of pairs.
+        :param kwargs: Keys and values to set, for string keys.
+        :raises KeyError: If called as update(key, value) and the key does not exist.
+        """
+        if len(args) != 2 or kwargs:
+            super().update(*args, **kwargs)
+            return
+
+        key, value = args
+        h = _mix_hash(hash(key))
+        stripe = h & self._stripe_mask
+
+        with self._locks[stripe]:
+            buckets = self._buckets
+            index = h & (len(buckets) - 1)
+            if self._find(buckets[index], key) < 0:
+                raise KeyError("The collection does not contain the key")
+
+            self._set_locked(buckets, index, stripe, key, value)
+
+    def remove(self, key: TKey) -> bool:
+        """Removes the item from the hash table whose key matches
+        the specified key.
+
+        :param key: The key of the item to remove.
+        :return: True if the item was removed, false otherwise.
+        """
+        return self.pop(key, _MISSING) is not _MISSING
+
+    def get_value(self, key: TKey) -> (bool, TValue):
+        """Finds and returns the value for the specified key without taking a lock.
+
+        :param key: The key whose value is sought.
+        :return: Tuple containing boolean denoting if the item is found in the hash table
+        and the value associated with the specified key.
+        """
+        value = self._lookup(key, _MISSING)
+        if value is _MISSING:
+            return False, None
+
+        return True, value
+
+    def compute_if_absent(self, key: TKey, factory: Callable[[TKey], TValue]) -> TValue:
+        """Returns the value for the key, atomically adding factory(key) first if the
+        key does not exist. The factory runs under the stripe lock, so it is called at
+        most once per key and must not use the hash table itself.
+
+        :param key: The key whose value is sought.
+        :param factory: Creates the value of a missing key.
+        :return: The existing or the newly added value.
+        """
+        value = self._lookup(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        h = _mix_hash(hash(key))
+        stripe = h & self._stripe_mask
+
+        with self._locks[stripe]:
+            buckets = self._buckets
+            index = h & (len(buckets) - 1)
+            bucket = buckets[index]
+            position = self._find(bucket, key)
+            if position >= 0:
+                return bucket[position][1]
+
+            value = factory(key)
+            self._set_locked(buckets, index, stripe, key, value)
+
+        self._grow_if_needed()
+        return value
+
+    def merge(self, key: TKey, value: TValue, function: Callable[[TValue, TValue], TValue]) -> Optional[TValue]:
+        """Atomically sets the key to the value if it does not exist, or else to
+        function(old value, value). None stands for no value: if the function returns
+        None the key is removed, and merging None into a missing key adds nothing.
+        The function runs under the stripe lock and must not use the hash table itself.
+
+        :param key: The key of the item being merged.
+        :param value: The value to merge, passed to the function if the key exists.
+        :param function: Combines the existing value with the value.
+        :return: The new value of the key, or None if it was removed.
+        """
+        h = _mix_hash(hash(key))
+        stripe = h & self._stripe_mask
+
+        with self._locks[stripe]:
+            buckets = self._buckets
+            index = h & (len(buckets) - 1)
+            bucket = buckets[index]
+            position = self._find(bucket, key)
+
+            if position >= 0:
+                value = function(bucket[position][1], value)
+                if value is None:
+                    self._remove_locked(buckets, index, stripe, position)
+                    return None
+            elif value is None:
+                return None
+
+            self._set_locked(buckets, index, stripe, key, value)
+
+        if position < 0:
+            self._grow_if_needed()
+        return value
+
+    # region Mapping Protocol
+    def __getitem__(self, key: TKey) -> TValue:
+        value = self._lookup(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+
+        return value
+
+    def __setitem__(self, key: TKey, value: TValue):
+        h = _mix_hash(hash(key))
+        stripe = h & self._stripe_mask
+
+        with self._locks[stripe]:
+            buckets = self._buckets
+            self._set_locked(buckets, h & (len(buckets) - 1), stripe, key, value)
+
+        self._grow_if_needed()
+
+    def __delitem__(self, key: TKey):
+        self.pop(key)
+
+    def __contains__(self, key: TKey) -> bool:
+        return self._lookup(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __iter__(self) -> Iterator[TKey]:
+        return self.keys()
+
+    def get(self, key: TKey, default: TValue = None) -> TValue:
+        """Returns the value for the specified key, or the default if the key does not exist."""
+        return self._lookup(key, default)
+
+    def setdefault(self, key: TKey, default: TValue = None) -> TValue:
+        """Returns the value for the specified key, atomically adding the key with the
+        default value first if it does not exist."""
+        return self.compute_if_absent(key, lambda _: default)
+
+    def pop(self, key: TKey, default: TValue = _MISSING) -> TValue:
+        """Removes the item whose key matches the specified key and returns its value.
+
+        :param key: The key of the item to remove.
+        :param default: The value returned if the key does not exist.
+        :raises KeyError: If the key does not exist and no default is given.
+        """
+        h = _mix_hash(hash(key))
+        stripe = h & self._stripe_mask
+
+        with self._locks[stripe]:
+            buckets = self._buckets
+            index = h & (len(buckets) - 1)
+            bucket = buckets[index]
+            position = self._find(bucket, key)
+            if position >= 0:
+                self._remove_locked(buckets, index, stripe, position)
+                return bucket[position][1]
+
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+    # endregion
+
+    def keys(self) -> Generator[TKey, None, None]:
+        """Returns an enumerator for all of the keys in the hash table. The enumeration
+        is weakly consistent: it never fails on concurrent changes, but may or may not
+        see the changes made while it runs."""
+        for bucket in self._buckets:
+            if bucket is not None:
+                for key, _ in bucket:
+                    yield key
+
+    def values(self) -> Generator[TValue, None, None]:
+        """Returns a weakly consistent enumerator for all of the values in the hash table."""
+        for bucket in self._buckets:
+            if bucket is not None:
+                for _, value in bucket:
+                    yield value
+
+    def items(self) -> Generator[HashTableNodePair, None, None]:
+        """Returns a weakly consistent enumerator for all of the items in the hash table."""
+        for bucket in self._buckets:
+            if bucket is not None:
+                for key, value in bucket:
+                    yield HashTableNodePair(key, value)
+
+    def clear(self):
+        """Removes all items from the hash table."""
+        for lock in self._locks:
+            lock.acquire()
+
+        try:
+            self._buckets = len(self._buckets) * [None]
+            self._counts = len(self._counts) * [0]
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def count(self) -> int:
+        """The number of items currently in the hash table."""
+        return sum(self._counts)
@@ -1,5 +1,10 @@
+from __future__ import annotations
+from typing import Iterable
+
+
 class LinkedListNode:
     """A node in the doubly linked list."""
+    __slots__ = ('value', 'next', 'previous')
 
     def __init__(self, value):
         """Constructs a new node with the specified value."""
@@ -23,10 +28,11 @@ class LinkedList:
     def tail(self) -> LinkedListNode:
         return self._tail
 
-    def add_first(self, node: LinkedListNode):
+    def add_first(self, node: LinkedListNode) -> LinkedListNode:
         """Adds the specified node to the start of the list.
 
         :param node: The node to add
+        :return: The added node.
         """
         # Save the head node so we don't lose the reference
         old_head = self._head
@@ -46,11 +52,13 @@ class LinkedList:
             old_head.previous = self._head
 
         self._count += 1
+        return node
 
-    def add_last(self, node: LinkedListNode):
+    def add_last(self, node: LinkedListNode) -> LinkedListNode:
         """Adds the specified node to the end of the list.
 
         :param node: The node to add
+        :return: The added node.
         """
         if self._count == 0:
             self._head = node
@@ -60,20 +68,153 @@ class LinkedList:
 
         self._tail = node
         self._count += 1
+        return node
 
-    def add(self, value):
+    def add(self, value) -> LinkedListNode:
         """Adds the specified value to the start of the list.
 
         :param value: The value to add.
+        :return: The node of the value, which can be passed to remove_node later.
         """
-        self.add_first(LinkedListNode(value))
+        return self.add_first(LinkedListNode(value))
 
-    def append(self, value):
+    def append(self, value) -> LinkedListNode:
         """Append the specified value to the end of the list.
 
         :param value: The value to append.
+        :return: The node of the value, which can be passed to remove_node later.
+        """
+        return self.add_last(LinkedListNode(value))
+
+    @classmethod
+    def from_iterable(cls, values: Iterable) -> LinkedList:
+        """Builds a list of the values in the order they are enumerated.
+
+        :param values: The values to add.
+        :return: The new list.
+        """
+        linked_list = cls()
+        linked_list.extend(values)
+        return linked_list
+
+    def extend(self, values: Iterable):
+        """Appends all the values to the end of the list. The new nodes are linked to
+        each other first and then to the tail in one step, instead of one append each.
+
+        :param values: The values to append.
+        """
+        head = None
+        tail = None
+        added = 0
+
+        for value in values:
+            node = LinkedListNode(value)
+            if tail is None:
+                head = node
+            else:
+                tail.next = node
+                node.previous = tail
+            tail = node
+            added += 1
+
+        if head is not None:
+            self._link_last(head, tail, added)
+
+    def _link_last(self, head: LinkedListNode, tail: LinkedListNode, count: int):
+        """Links the chain of count nodes from head to tail to the end of the list."""
+        if self._count == 0:
+            self._head = head
+        else:
+            self._tail.next = head
+            head.previous = self._tail
+
+        self._tail = tail
+        self._count += count
+
+    def splice(self, other: LinkedList):
+        """Moves all the nodes of the other list to the end of this list in O(1), by
+        linking its head to this tail. The other list is left empty.
+
+        :param other: The list to move the nodes from.
+        :raises ValueError: If the other list is this list.
+        """
+        if other is self:
+            raise ValueError('Cannot splice a list into itself')
+
+        if other._count != 0:
+            self._link_last(other._head, other._tail, other._count)
+            other.clear()
+
+    def split_at(self, node: LinkedListNode) -> LinkedList:
+        """Moves the specified node and all the nodes after it to a new list. The
+        relinking is O(1); counting the moved nodes walks out from the node in both
+        directions at once, so it stops after the shorter of the two parts.
+
+        :param node: A node which is currently in this list.
+        :return: The new list, starting with the node.
         """
-        self.add_last(LinkedListNode(value))
+        # Count the nodes after the node and before it in step until one side ends.
+        after = node.next
+        before = node.previous
+        after_count = 0
+        before_count = 0
+        while after is not None and before is not None:
+            after = after.next
+            before = before.previous
+            after_count += 1
+            before_count += 1
+
+        if after is None:
+            moved = after_count + 1
+        else:
+            moved = self._count - before_count
+
+        rest = type(self)()
+        rest._head = node
+        rest._tail = self._tail
+        rest._count = moved
+
+        if node.previous is None:
+            self._head = None
+            self._tail = None
+        else:
+            self._tail = node.previous
+            self._tail.next = None
+            node.previous = None
+        self._count -= moved
+
+        return rest
+
+    def insert_after(self, node: LinkedListNode, value) -> LinkedListNode:
+        """Inserts the value right after the specified node in O(1).
+
+        :param node: A node which is currently in this list.
+        :param value: The value to insert.
+        :return: The node of the value.
+        """
+        if node is self._tail:
+            return self.append(value)
+
+        new_node = LinkedListNode(value)
+        new_node.previous = node
+        new_node.next = node.next
+        node.next.previous = new_node
+        node.next = new_node
+
+        self._count += 1
+        return new_node
+
+    def insert_before(self, node: LinkedListNode, value) -> LinkedListNode:
+        """Inserts the value right before the specified node in O(1).
+
+        :param node: A node which is currently in this list.
+        :param value: The value to insert.
+        :return: The node of the value.
+        """
+        if node is self._head:
+            return self.add(value)
+
+        return self.insert_after(node.previous, value)
 
     def remove_first(self):
         if self._count != 0:
@@ -130,9 +271,55 @@ class LinkedList:
 
         return False
 
+    def unlink(self, node: LinkedListNode):
+        """Removes the specified node from the list in O(1), without searching
+        for its value. The node's links are cleared so it can be added again.
+
+        :param node: A node which is currently in this list.
+        """
+        if node.previous is None:
+            self._head = node.next
+        else:
+            node.previous.next = node.next
+
+        if node.next is None:
+            self._tail = node.previous
+        else:
+            node.next.previous = node.previous
+
+        node.next = None
+        node.previous = None
+        self._count -= 1
+
+    def remove_node(self, node: LinkedListNode):
+        """Removes the specified node, e.g. one returned by add or append, in O(1).
+
+        :param node: A node which is currently in this list.
+        :return: The value of the node.
+        """
+        self.unlink(node)
+        return node.value
+
+    def move_to_front(self, node: LinkedListNode):
+        """Moves the specified node to the start of the list in O(1).
+
+        :param node: A node which is currently in this list.
+        """
+        if node is not self._head:
+            self.unlink(node)
+            self.add_first(node)
+
     def pop(self):
-        """Remove a value from the end of the list."""
+        """Remove a value from the end of the list.
+
+        :return: The removed value, or None if the list is empty.
+        """
+        if self._count == 0:
+            return None
+
+        value = self._tail.value
         self.remove_last()
+        return value
 
     def clear(self):
         """Remove all the nodes from the list."""
@@ -140,11 +327,11 @@ class LinkedList:
         self._tail = None
         self._count = 0
 
-    # def count(self) -> int:
-    #     """
-    #     :return: The number of items currently in the list.
-    #     """
-    #     return self._count
+    def __len__(self) -> int:
+        """
+        :return: The number of items currently in the list.
+        """
+        return self._count
 
     def count(self, value) -> int:
         """
@@ -1,13 +1,21 @@
+from __future__ import annotations
+from array import array
 from collections import deque
-from typing import TypeVar, Deque, List, Union, Generator
-from math import fabs
+from collections.abc import MutableMapping
+from itertools import chain, count
+from typing import TypeVar, Deque, List, Union, Generator, Type, Optional, Iterable, Tuple, Sized, Iterator
 
 TKey = TypeVar('TKey')
 TValue = TypeVar('TValue')
 
+# Returned by the single probe lookups when the key is not found, since
+# None is a valid value.
+_MISSING = object()
+
 
 class HashTableNodePair:
     """A node in the hash table array."""
+    __slots__ = ('_key', '_value')
 
     def __init__(self, key: TKey, value: TValue):
         """Constructs a key/value pair for storage in the hash table.
@@ -30,6 +38,11 @@ class HashTableNodePair:
     def value(self, value: TValue):
         self._value = value
 
+    def __iter__(self) -> Iterator:
+        """Unpacks the pair as a (key, value) tuple."""
+        yield self._key
+        yield self._value
+
 
 class HashTableArrayNode:
     """The hash table data chain"""
@@ -102,6 +115,51 @@ class HashTableArrayNode:
 
         return found, value
 
+    def lookup(self, key: TKey, default: TValue) -> TValue:
+        """Returns the value for the specified key, or the default if the key is not in the list.
+
+        :param key: The key whose value is sought.
+        :param default: The value to return if the key is not found.
+        """
+        if self._items is not None:
+            for item in self._items:
+                if item.key == key:
+                    return item.value
+
+        return default
+
+    def set_value(self, key: TKey, value: TValue) -> bool:
+        """Sets the value of the key, adding the key/value pair if the key is not in the list.
+
+        :param key: The key of the item being set.
+        :param value: The value to set.
+        :return: True if the pair was added, False if an existing value was replaced.
+        """
+        if self._items is None:
+            self._items = deque()
+        else:
+            for item in self._items:
+                if item.key == key:
+                    item.value = value
+                    return False
+
+        self._items.appendleft(HashTableNodePair(key, value))
+        return True
+
+    def pop(self, key: TKey, default: TValue) -> TValue:
+        """Removes the item whose key matches the specified key and returns its value.
+
+        :param key: The key of the item to remove.
+        :param default: The value to return if the key is not found.
+        """
+        if self._items is not None:
+            for item in self._items:
+                if item.key == key:
+                    self._items.remove(item)
+                    return item.value
+
+        return default
+
     def _get_item(self, key: TKey) -> (bool, HashTableNodePair):
         if self._items is not None:
             for item in self._items:
@@ -132,6 +190,38 @@ class HashTableArrayNode:
             for item in self._items:
                 yield item
 
+    def add_pair(self, item: HashTableNodePair):
+        """Adds an existing key/value pair to the node without checking for
+        duplicate keys. Only used while re-hashing pairs that are already unique.
+
+        :param item: The key/value pair to add.
+        """
+        if self._items is None:
+            self._items = deque()
+
+        self._items.appendleft(item)
+
+
+def _next_power_of_two(num: int) -> int:
+    """Returns the smallest power of two which is greater than or equal to num."""
+    if num <= 1:
+        return 1
+    return 1 << (num - 1).bit_length()
+
+
+def _mix_hash(h: int) -> int:
+    """Mixes the hash code so that the high bits take part in the array index
+    too. Without this, keys whose hash codes only differ in the high bits
+    (e.g. multiples of a large power of two, or floats such as i / 1024, whose
+    hash codes keep the fraction in the top bits) would all share one bucket.
+    Python hash codes are 64 bits, so the upper half is folded onto the lower
+    half before the bits are spread down.
+    """
+    h &= 0xFFFFFFFFFFFFFFFF
+    h ^= h >> 32
+    h ^= (h >> 20) ^ (h >> 12)
+    return h ^ (h >> 7) ^ (h >> 4)
+
 
 class HashTableArray:
     """The fixed size array of the nodes in the hash table"""
@@ -139,21 +229,32 @@ class HashTableArray:
 
     def __init__(self, capacity: int):
         """Constructs a new hash table array with the specified capacity.
+        The capacity is rounded up to the next power of two so that the
+        array index can be computed with a bit mask instead of a modulo.
+
+        The nodes are allocated lazily on the first add to a bucket, so that
+        allocating a large array costs a single list allocation.
 
         :param capacity: The capacity of the array.
         """
+        capacity = _next_power_of_two(capacity)
         self._array = capacity * [None]
-        for i in range(capacity):
-            self._array[i] = HashTableArrayNode()
+        self._mask = capacity - 1
+
+    def _get_node(self, index: int) -> HashTableArrayNode:
+        """Returns the node at the index, allocating it if required."""
+        node = self._array[index]
+        if node is None:
+            node = self._array[index] = HashTableArrayNode()
+        return node
 
-    @staticmethod
-    def get_index(key: TKey) -> int:
+    def get_index(self, key: TKey) -> int:
         """Maps a key to the array index based on hash code.
 
         :param key: The key to be mapped.
         :return: array index.
         """
-        return int(fabs(hash(key) % 1000))
+        return _mix_hash(hash(key)) & self._mask
 
     def add(self, key: TKey, value: TValue):
         """Adds the key/value pair to the node.
@@ -162,7 +263,7 @@ class HashTableArray:
         :param value: The value of the item being added.
         :raises KeyError: If the key already exists in the node array.
         """
-        self._array[HashTableArray.get_index(key)].add(key, value)
+        self._get_node(self.get_index(key)).add(key, value)
 
     def update(self, key, value):
         """Updates the value of the existing key/value pair in the node array.
@@ -171,7 +272,11 @@ class HashTableArray:
         :param value: The updated value.
         :raises KeyError: If the key does not exist in the node array.
         """
-        self._array[HashTableArray.get_index(key)].update(key, value)
+        node = self._array[self.get_index(key)]
+        if node is None:
+            raise KeyError("The collection does not contain the key")
+
+        node.update(key, value)
 
     def remove(self, key) -> bool:
         """Removes the item from the node array whose key matches
@@ -180,7 +285,8 @@ class HashTableArray:
         :param key: The key of the item to remove.
         :return: True if the item was removed, false otherwise.
         """
-        return self._array[HashTableArray.get_index(key)].remove(key)
+        node = self._array[self.get_index(key)]
+        return node is not None and node.remove(key)
 
     def get_value(self, key: TKey) -> (bool, TValue):
         """Finds and returns the value for the specified key.
@@ -189,37 +295,435 @@ class HashTableArray:
         :return: Tuple containing boolean denoting if the item is found in the array
         and the value associated with the specified key.
         """
-        return self._array[HashTableArray.get_index(key)].get_value(key)
+        node = self._array[self.get_index(key)]
+        if node is None:
+            return False, None
+
+        return node.get_value(key)
+
+    def lookup(self, key: TKey, default: TValue) -> TValue:
+        """Returns the value for the specified key, or the default if the key is not in the array.
+
+        :param key: The key whose value is sought.
+        :param default: The value to return if the key is not found.
+        """
+        node = self._array[self.get_index(key)]
+        if node is None:
+            return default
+
+        return node.lookup(key, default)
+
+    def set_value(self, key: TKey, value: TValue) -> bool:
+        """Sets the value of the key, adding the key/value pair if the key is not in the array.
+
+        :param key: The key of the item being set.
+        :param value: The value to set.
+        :return: True if the pair was added, False if an existing value was replaced.
+        """
+        return self._get_node(self.get_index(key)).set_value(key, value)
+
+    def pop(self, key: TKey, default: TValue) -> TValue:
+        """Removes the item whose key matches the specified key and returns its value.
+
+        :param key: The key of the item to remove.
+        :param default: The value to return if the key is not found.
+        """
+        node = self._array[self.get_index(key)]
+        if node is None:
+            return default
+
+        return node.pop(key, default)
+
+    def add_pair(self, item: HashTableNodePair):
+        """Adds an existing key/value pair to the node array without checking
+        for duplicate keys. Used to move pairs into a larger array on growth.
+
+        :param item: The key/value pair to add.
+        """
+        self._get_node(self.get_index(item.key)).add_pair(item)
+
+    def move_bucket(self, index: int, target: HashTableArray):
+        """Moves every pair of the bucket at the index into the target array.
+        Used to spread a resize over many operations.
+
+        :param index: The index of the bucket to move.
+        :param target: The array receiving the pairs.
+        """
+        node = self._array[index]
+        if node is not None:
+            for item in node.items():
+                target.add_pair(item)
+            self._array[index] = None
 
     def capacity(self):
         """The capacity of the hash table array."""
         return len(self._array)
 
+    def resized(self, capacity: int) -> HashTableArray:
+        """Returns a new array with the specified capacity holding every pair of this array.
+
+        :param capacity: The capacity of the new array.
+        :return: The new array.
+        """
+        larger_array = HashTableArray(capacity)
+
+        # The keys are already known to be unique so the pairs are
+        # re-linked without the duplicate check.
+        for item in self.items():
+            larger_array.add_pair(item)
+
+        return larger_array
+
     def clear(self):
         """Removes every item from the hash table array."""
-        [node.clear() for node in self._array]
+        self._array = len(self._array) * [None]
 
     def keys(self) -> Generator[TKey, None, None]:
         """Returns an enumerator for all of the keys in the node array."""
         for node in self._array:
-            for key in node.keys():
-                yield key
+            if node is not None:
+                for key in node.keys():
+                    yield key
 
     def values(self) -> Generator[TValue, None, None]:
         """Returns an enumerator for all of the values in the node array."""
         for node in self._array:
-            for value in node.values():
-                yield value
+            if node is not None:
+                for value in node.values():
+                    yield value
 
     def items(self) -> Generator[HashTableNodePair, None, None]:
         """Returns an enumerator for all of the Items in the node array."""
         for node in self._array:
-            for item in node.items():
-                yield item
+            if node is not None:
+                for item in node.items():
+                    yield item
+
+
+_MASK_64 = (1 << 64) - 1
+
+_FIBONACCI_MULTIPLIER = 0x9E3779B97F4A7C15
+
+# Numbers the open addressing arrays, to give each its own home slot seed.
+_array_numbers = count(1)
+
+
+def _next_seed() -> int:
+    """Returns a new 64 bit seed for the home slots of an array,
+    scrambling the array number with the splitmix64 finalizer."""
+    z = (next(_array_numbers) * _FIBONACCI_MULTIPLIER) & _MASK_64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return z ^ (z >> 31)
+
+
+class OpenAddressingHashTableArray:
+    """A fixed size open addressing array for the hash table.
+
+    Instead of a chain object per bucket and a pair object per entry, the hash
+    codes, keys and values are stored in three flat parallel arrays. Collisions
+    are resolved with linear probing: a key lives in the first free slot at or
+    after its home index. Removed slots are marked with a tombstone so that the
+    probe sequence of the keys behind them is not broken; once too many
+    tombstones pile up the array is compacted in place.
+    """
+
+    # Markers stored in the keys array for slots which were never used
+    # and for slots whose item has been removed.
+    _EMPTY = object()
+    _DELETED = object()
+
+    def __init__(self, capacity: int):
+        """Constructs a new open addressing array with the specified capacity.
+        The capacity is rounded up to the next power of two.
+
+        :param capacity: The capacity of the array.
+        """
+        # Probing only stops at an empty slot, so the live items plus the
+        # tombstones must never fill the array. The hash table allows a fill
+        # factor of 0.75 plus one item and compaction allows an eighth of the
+        # slots as tombstones, which always leaves a slot free from 16 up.
+        capacity = _next_power_of_two(max(capacity, 16))
+        self._mask = capacity - 1
+        self._shift = 64 - (capacity.bit_length() - 1)
+        self._seed = _next_seed()
+        self._hashes = array('q', [0]) * capacity
+        self._keys: List[TKey] = capacity * [self._EMPTY]
+        self._values: List[TValue] = capacity * [None]
+        self._deleted = 0           # The number of tombstones in the array
+        self._draining = False      # True once items are being moved to a larger array
+
+    def _home(self, h: int) -> int:
+        """Returns the slot where the probe for the hash code starts.
+
+        Linear probing needs the home slots of nearby hash codes (e.g. consecutive
+        ints) to be scattered, so the slot is taken from the high bits of the hash
+        code multiplied by 2^64 / golden ratio (Fibonacci hashing). Every array
+        also xors the hash code with its own seed first; otherwise copying one
+        table into another in slot order would insert the keys in the order of
+        their home slots and pile them up into one long cluster.
+        """
+        return (((h ^ self._seed) * _FIBONACCI_MULTIPLIER) & _MASK_64) >> self._shift
+
+    def _find_slot(self, key: TKey, h: int) -> int:
+        """Returns the slot holding the key, or -1 if the key is not in the array."""
+        keys = self._keys
+        hashes = self._hashes
+        mask = self._mask
+        empty = self._EMPTY
+        index = self._home(h)
+
+        while True:
+            slot_key = keys[index]
+            if slot_key is empty:
+                return -1
+            if hashes[index] == h and (slot_key is key or slot_key == key):
+                return index
+            index = (index + 1) & mask
+
+    def _insert(self, key: TKey, value: TValue, h: int):
+        """Stores the pair in the first free slot of the probe sequence.
+        The caller must make sure the key is not already in the array.
+        """
+        keys = self._keys
+        mask = self._mask
+        empty = self._EMPTY
+        deleted = self._DELETED
+        index = self._home(h)
+
+        while True:
+            slot_key = keys[index]
+            if slot_key is empty:
+                break
+            if slot_key is deleted:
+                self._deleted -= 1
+                break
+            index = (index + 1) & mask
+
+        self._hashes[index] = h
+        keys[index] = key
+        self._values[index] = value
 
+    def add(self, key: TKey, value: TValue):
+        """Adds the key/value pair to the array.
 
-class HashTable:
-    """A key/value associative collection."""
+        :param key: The key of the item being added.
+        :param value: The value of the item being added.
+        :raises KeyError: If the key already exists in the array.
+        """
+        h = hash(key)
+        keys = self._keys
+        hashes = self._hashes
+        mask = self._mask
+        empty = self._EMPTY
+        deleted = self._DELETED
+        index = self._home(h)
+
+        # A single probe both checks for the key and finds the slot to use:
+        # the first tombstone on the way, or else the empty slot ending it.
+        free = -1
+        while True:
+            slot_key = keys[index]
+            if slot_key is empty:
+                break
+            if slot_key is deleted:
+                if free < 0:
+                    free = index
+            elif hashes[index] == h and (slot_key is key or slot_key == key):
+                raise KeyError("The collection already contains the key")
+            index = (index + 1) & mask
+
+        if free >= 0:
+            index = free
+            self._deleted -= 1
+
+        hashes[index] = h
+        keys[index] = key
+        self._values[index] = value
+
+    def update(self, key: TKey, value: TValue):
+        """Updates the value of the existing key/value pair in the array.
+
+        :param key: The key of the item being updated.
+        :param value: The updated value.
+        :raises KeyError: If the key does not exist in the array.
+        """
+        index = self._find_slot(key, hash(key))
+        if index < 0:
+            raise KeyError("The collection does not contain the key")
+
+        self._values[index] = value
+
+    def remove(self, key: TKey) -> bool:
+        """Removes the item from the array whose key matches the specified key.
+
+        :param key: The key of the item to remove.
+        :return: True if the item was removed, false otherwise.
+        """
+        return self.pop(key, _MISSING) is not _MISSING
+
+    def lookup(self, key: TKey, default: TValue) -> TValue:
+        """Returns the value for the specified key, or the default if the key is not in the array.
+
+        :param key: The key whose value is sought.
+        :param default: The value to return if the key is not found.
+        """
+        index = self._find_slot(key, hash(key))
+        if index < 0:
+            return default
+
+        return self._values[index]
+
+    def set_value(self, key: TKey, value: TValue) -> bool:
+        """Sets the value of the key, adding the key/value pair if the key is not in the array.
+
+        :param key: The key of the item being set.
+        :param value: The value to set.
+        :return: True if the pair was added, False if an existing value was replaced.
+        """
+        h = hash(key)
+        index = self._find_slot(key, h)
+        if index >= 0:
+            self._values[index] = value
+            return False
+
+        self._insert(key, value, h)
+        return True
+
+    def pop(self, key: TKey, default: TValue) -> TValue:
+        """Removes the item whose key matches the specified key and returns its value.
+
+        :param key: The key of the item to remove.
+        :param default: The value to return if the key is not found.
+        """
+        index = self._find_slot(key, hash(key))
+        if index < 0:
+            return default
+
+        value = self._values[index]
+        self._keys[index] = self._DELETED
+        self._values[index] = None
+        self._deleted += 1
+
+        # Tombstones lengthen every probe that runs over them, so once they take
+        # up an eighth of the array the live items are re-inserted in place.
+        # A draining array is never compacted as that would move items behind
+        # the buckets which have already been moved out.
+        if self._deleted > (self._mask + 1) >> 3 and not self._draining:
+            self._compact()
+
+        return value
+
+    def get_value(self, key: TKey) -> (bool, TValue):
+        """Finds and returns the value for the specified key.
+
+        :param key: The key whose value is sought.
+        :return: Tuple containing boolean denoting if the item is found in the array
+        and the value associated with the specified key.
+        """
+        index = self._find_slot(key, hash(key))
+        if index < 0:
+            return False, None
+
+        return True, self._values[index]
+
+    def _live_slots(self) -> Generator[int, None, None]:
+        """Returns an enumerator for the indexes of the slots holding an item."""
+        empty = self._EMPTY
+        deleted = self._DELETED
+        for index, key in enumerate(self._keys):
+            if key is not empty and key is not deleted:
+                yield index
+
+    def _compact(self):
+        """Re-inserts every live item into fresh arrays of the same capacity,
+        dropping all the tombstones."""
+        pairs = [(self._hashes[index], self._keys[index], self._values[index])
+                 for index in self._live_slots()]
+
+        capacity = self._mask + 1
+        self._hashes = array('q', [0]) * capacity
+        self._keys = capacity * [self._EMPTY]
+        self._values = capacity * [None]
+        self._deleted = 0
+
+        for h, key, value in pairs:
+            self._insert(key, value, h)
+
+    def capacity(self):
+        """The capacity of the array."""
+        return self._mask + 1
+
+    def resized(self, capacity: int) -> OpenAddressingHashTableArray:
+        """Returns a new array with the specified capacity holding every pair of this array.
+        The stored hash codes are reused so no key is hashed again.
+
+        :param capacity: The capacity of the new array.
+        :return: The new array.
+        """
+        larger_array = OpenAddressingHashTableArray(capacity)
+        hashes = self._hashes
+        keys = self._keys
+        values = self._values
+
+        for index in self._live_slots():
+            larger_array._insert(keys[index], values[index], hashes[index])
+
+        return larger_array
+
+    def move_bucket(self, index: int, target: OpenAddressingHashTableArray):
+        """Moves the pair in the slot at the index into the target array.
+        The slot becomes a tombstone so that the remaining keys can still be
+        found while the resize is in progress.
+
+        :param index: The index of the slot to move.
+        :param target: The array receiving the pair.
+        """
+        self._draining = True
+        key = self._keys[index]
+        if key is not self._EMPTY and key is not self._DELETED:
+            target._insert(key, self._values[index], self._hashes[index])
+            self._keys[index] = self._DELETED
+            self._values[index] = None
+
+    def clear(self):
+        """Removes every item from the array."""
+        capacity = self._mask + 1
+        self._keys = capacity * [self._EMPTY]
+        self._values = capacity * [None]
+        self._deleted = 0
+
+    def keys(self) -> Generator[TKey, None, None]:
+        """Returns an enumerator for all of the keys in the array."""
+        keys = self._keys
+        for index in self._live_slots():
+            yield keys[index]
+
+    def values(self) -> Generator[TValue, None, None]:
+        """Returns an enumerator for all of the values in the array."""
+        values = self._values
+        for index in self._live_slots():
+            yield values[index]
+
+    def items(self) -> Generator[HashTableNodePair, None, None]:
+        """Returns an enumerator for all of the items in the array.
+        The pairs are created on the fly, so setting their value does
+        not change the array.
+        """
+        keys = self._keys
+        values = self._values
+        for index in self._live_slots():
+            yield HashTableNodePair(keys[index], values[index])
+
+
+class HashTable(MutableMapping):
+    """A key/value associative collection.
+
+    Besides its own add/update/remove/get_value methods, the hash table
+    implements the full mapping protocol, so it can be used like a dict:
+    table[key], table[key] = value, del table[key], key in table, len(table)
+    and iteration over the keys.
+    """
 
     # If the array exceeds this fill percentage, it will grow.
     # In this example, the fill factor is the total number of items
@@ -228,26 +732,152 @@ class HashTable:
 
     # The maximum number of items to store before growing.
     # This is just cached value of the fill factor calculation.
+    # Since the array always doubles when this is reached, the average chain
+    # length stays below the fill factor no matter how large the table grows.
     _max_items_at_current_size: int = 0
 
     # The number of items in the hash table.
     _count: int = 0
 
     # The array where the items are stored.
-    _array: HashTableArray = None
+    _array: Union[HashTableArray, OpenAddressingHashTableArray] = None
+
+    # While an incremental resize is in progress, the array the items are
+    # being moved out of. None when no resize is in progress.
+    _old_array: Optional[Union[HashTableArray, OpenAddressingHashTableArray]] = None
+
+    # The index of the next bucket of the old array to move.
+    _rehash_index: int = 0
 
-    def __init__(self, capacity: int = 1000):
+    # The number of old buckets moved by every add, update and remove during
+    # an incremental resize. The old array only has a third more buckets than
+    # there are adds left before the next resize, so 2 or more finishes in time.
+    _rehash_buckets_per_step: int = 4
+
+    # The optional reverse index mapping every value to the number of keys
+    # holding it. None unless value tracking is enabled.
+    _value_counts: Optional[HashTable] = None
+
+    def __init__(self, capacity: int = 1000,
+                 array_type: Type[Union[HashTableArray, OpenAddressingHashTableArray]] = HashTableArray,
+                 incremental_resize: bool = False,
+                 track_values: bool = False):
         """Constructs a hash table with the specified capacity.
-        Default capacity is 1000.
+        Default capacity is 1000 (rounded up to 1024 by the array).
+
+        :param capacity: The initial capacity of the table.
+        :param array_type: The storage engine - HashTableArray (separate chaining, default)
+        or OpenAddressingHashTableArray (flat parallel arrays with linear probing).
+        :param incremental_resize: If True, growing keeps the old and the new array side by
+        side and every later operation moves a few buckets, instead of moving every item
+        during the add which crosses the fill factor.
+        :param track_values: If True, a reverse index from each value to its number of
+        occurrences is kept up to date, which makes contains_value O(1). The index is a
+        second hash table with one entry per distinct value, so it costs up to as much
+        memory again as the keys and requires the values to be hashable.
         """
-        self._array = HashTableArray(capacity)
+        self._array = array_type(capacity)
+        self._incremental_resize = incremental_resize
+        if track_values:
+            self._value_counts = HashTable(array_type=array_type)
 
         # When the count exceeds this value, the next add will cause the
         # array to grow.
         self._max_items_at_current_size = int(self._fill_factor * self._array.capacity()) + 1
 
-    # TODO: Need to implement iterator protocol.
-    # TODO: __iter__() and __getitem__().
+    # region Mapping Protocol
+    def __getitem__(self, key: TKey) -> TValue:
+        """Returns the value for the specified key with a single probe.
+
+        :raises KeyError: If the key does not exist in the hash table.
+        """
+        value = self._array.lookup(key, _MISSING)
+        if value is _MISSING:
+            if self._old_array is not None:
+                value = self._old_array.lookup(key, _MISSING)
+            if value is _MISSING:
+                raise KeyError(key)
+
+        return value
+
+    def __setitem__(self, key: TKey, value: TValue):
+        """Sets the value of the key, adding the key/value pair if the key does not exist.
+        Only adding a key can grow the hash table."""
+        if self._old_array is not None or self._value_counts is not None:
+            # The key might be in the old array, or the replaced value is
+            # needed for the reverse index.
+            found, _ = self.get_value(key)
+            if found:
+                self.update(key, value)
+            else:
+                self.add(key, value)
+            return
+
+        # At capacity, grow only if the key is new; replacing a value never resizes.
+        if self._count >= self._max_items_at_current_size and not self._array.get_value(key)[0]:
+            self._grow()
+
+        if self._array.set_value(key, value):
+            self._count += 1
+
+    def __delitem__(self, key: TKey):
+        """Removes the item whose key matches the specified key.
+
+        :raises KeyError: If the key does not exist in the hash table.
+        """
+        self.pop(key)
+
+    def __contains__(self, key: TKey) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[TKey]:
+        return iter(self.keys())
+
+    def get(self, key: TKey, default: TValue = None) -> TValue:
+        """Returns the value for the specified key, or the default if the key does not exist."""
+        value = self._array.lookup(key, _MISSING)
+        if value is _MISSING:
+            if self._old_array is not None:
+                return self._old_array.lookup(key, default)
+            return default
+
+        return value
+
+    def setdefault(self, key: TKey, default: TValue = None) -> TValue:
+        """Returns the value for the specified key, adding the key with the default
+        value first if it does not exist."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            self[key] = value = default
+
+        return value
+
+    def pop(self, key: TKey, default: TValue = _MISSING) -> TValue:
+        """Removes the item whose key matches the specified key and returns its value.
+
+        :param key: The key of the item to remove.
+        :param default: The value returned if the key does not exist.
+        :raises KeyError: If the key does not exist and no default is given.
+        """
+        if self._old_array is not None or self._value_counts is not None:
+            found, value = self.get_value(key)
+            if found:
+                self.remove(key)
+        else:
+            value = self._array.pop(key, _MISSING)
+            found = value is not _MISSING
+            if found:
+                self._count -= 1
+
+        if found:
+            return value
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+    # endregion
 
     def add(self, key: TKey, value: TValue):
         """Adds the key/value pair to the hash table.
@@ -257,35 +887,229 @@ class HashTable:
         :raises KeyError: If the key already exists in the hash table.
         """
 
+        if self._old_array is not None:
+            self._rehash_step()
+
         # If we are at capacity, the array needs to grow.
         if self.count() >= self._max_items_at_current_size:
-            # Allocate a larger array
-            larger_array = HashTableArray(self._array.capacity() * 2)
+            self._grow()
+
+        if self._old_array is not None:
+            found, _ = self._old_array.get_value(key)
+            if found:
+                raise KeyError("The collection already contains the key")
 
-            # And re-add each item to the new array.
-            [larger_array.add(node.key, node.value) for node in self._array.items()]
+        self._array.add(key, value)
+        self._count += 1
 
-            # The larger array is now the hash table storage.
-            self._array = larger_array
+        if self._value_counts is not None:
+            self._add_value_ref(value)
 
-            # Update the new max items cached value.
+    def _add_value_ref(self, value: TValue):
+        """Counts one more occurrence of the value in the reverse index."""
+        found, count = self._value_counts.get_value(value)
+        if found:
+            self._value_counts.update(value, count + 1)
+        else:
+            self._value_counts.add(value, 1)
+
+    def _remove_value_ref(self, value: TValue):
+        """Counts one less occurrence of the value in the reverse index."""
+        _, count = self._value_counts.get_value(value)
+        if count == 1:
+            self._value_counts.remove(value)
+        else:
+            self._value_counts.update(value, count - 1)
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[TKey, TValue]], expected_size: int = None, **kwargs) -> HashTable:
+        """Constructs a hash table holding the key/value pairs.
+
+        The table is sized once for the expected number of items, so loading
+        it never goes through the intermediate resizes of repeated adds.
+
+        :param items: The key/value pairs to add.
+        :param expected_size: The expected number of pairs. Taken from the items if they are sized.
+        :param kwargs: Any other argument of the constructor, e.g. array_type.
+        :return: The new hash table.
+        :raises KeyError: If a key is repeated in the items.
+        """
+        if expected_size is None and isinstance(items, Sized):
+            expected_size = len(items)
+
+        table = cls(**kwargs)
+        if expected_size:
+            table.reserve(expected_size)
+
+        table.add_many(items)
+        return table
+
+    def reserve(self, count: int):
+        """Grows the hash table in one step so that it can hold the specified
+        number of items without resizing again.
+
+        :param count: The number of items the table should hold.
+        """
+        if self._old_array is not None:
+            self._rehash_step(self._old_array.capacity())
+
+        capacity = _next_power_of_two(int(count / self._fill_factor) + 1)
+        if capacity > self._array.capacity():
+            self._array = self._array.resized(capacity)
             self._max_items_at_current_size = int(self._fill_factor * self._array.capacity()) + 1
 
-        self._array.add(key, value)
-        self._count += 1
+    def add_many(self, items: Iterable[Tuple[TKey, TValue]]):
+        """Adds every key/value pair to the hash table.
 
-    def update(self, key: TKey, value: TValue):
-        """Removes the item from the hash table whose key matches
-        the specified key.
+        The table is grown up front when the number of pairs is known and the
+        per-item capacity and resize checks of add are hoisted out of the loop.
 
-        :param key: The key of the item being updated.
-        :param value: The updated value.
-        :raises KeyError: If the key does not exist in the hash table.
+        :param items: The key/value pairs to add.
+        :raises KeyError: If a key already exists in the hash table. The pairs
+        before it remain added.
         """
+        if isinstance(items, Sized):
+            self.reserve(self._count + len(items))
+        elif self._old_array is not None:
+            self._rehash_step(self._old_array.capacity())
+
+        add = self._array.add
+        count = self._count
+        max_items = self._max_items_at_current_size
+        value_counts = self._value_counts
+
         try:
-            self._array.update(key, value)
-        except KeyError:
-            raise
+            for key, value in items:
+                if count >= max_items:
+                    self._count = count
+                    self.reserve(2 * count)
+                    add = self._array.add
+                    max_items = self._max_items_at_current_size
+
+                add(key, value)
+                count += 1
+
+                if value_counts is not None:
+                    self._add_value_ref(value)
+        finally:
+            self._count = count
+
+    def get_many(self, keys: Iterable[TKey], default: TValue = None) -> List[TValue]:
+        """Finds and returns the values for the specified keys.
+
+        :param keys: The keys whose values are sought.
+        :param default: The value returned for the keys which are not found.
+        :return: List of the values in the order of the keys.
+        """
+        if self._old_array is not None:
+            get_value = self.get_value
+        else:
+            get_value = self._array.get_value
+
+        values = []
+        for key in keys:
+            found, value = get_value(key)
+            values.append(value if found else default)
+
+        return values
+
+    def remove_many(self, keys: Iterable[TKey]) -> int:
+        """Removes the items from the hash table whose keys match the specified keys.
+
+        :param keys: The keys of the items to remove.
+        :return: The number of items removed.
+        """
+        if self._value_counts is not None:
+            # The removed values are needed to keep the reverse index up to date.
+            return sum(1 for key in keys if self.remove(key))
+
+        if self._old_array is not None:
+            self._rehash_step(self._old_array.capacity())
+
+        remove = self._array.remove
+        removed = 0
+        for key in keys:
+            if remove(key):
+                removed += 1
+
+        self._count -= removed
+        return removed
+
+    def _grow(self):
+        """Doubles the capacity of the hash table."""
+        if self._old_array is not None:
+            # Finish the previous incremental resize before starting another.
+            self._rehash_step(self._old_array.capacity())
+
+        capacity = self._array.capacity() * 2
+        if self._incremental_resize:
+            # Start with an empty larger array; the items are moved over by
+            # the following operations.
+            self._old_array = self._array
+            self._rehash_index = 0
+            self._array = type(self._array)(capacity)
+        else:
+            # Allocate a larger array holding every item. The larger array
+            # is now the hash table storage.
+            self._array = self._array.resized(capacity)
+
+        # Update the new max items cached value.
+        self._max_items_at_current_size = int(self._fill_factor * self._array.capacity()) + 1
+
+    def _rehash_step(self, buckets: int = None):
+        """Moves the next few buckets of the old array into the current array,
+        dropping the old array once it is fully moved.
+
+        :param buckets: The number of buckets to move.
+        """
+        old_array = self._old_array
+        start = self._rehash_index
+        end = min(start + (buckets or self._rehash_buckets_per_step), old_array.capacity())
+
+        for index in range(start, end):
+            old_array.move_bucket(index, self._array)
+
+        if end == old_array.capacity():
+            self._old_array = None
+            self._rehash_index = 0
+        else:
+            self._rehash_index = end
+
+    def update(self, *args, **kwargs):
+        """Updates the hash table, called in one of these forms:
+
+        update(key, value) replaces the value of the existing key, raising
+        KeyError if the key does not exist in the hash table.
+
+        update(mapping), update(iterable of key/value pairs) and update(**kwargs),
+        or a mapping or iterable together with keyword arguments, set every pair
+        like dict.update does, adding the keys which do not exist.
+
+        :param args: Either the key and the value, or a single mapping or iterable of pairs.
+        :param kwargs: Keys and values to set, for string keys.
+        :raises KeyError: If called as update(key, value) and the key does not exist.
+        """
+        if len(args) != 2 or kwargs:
+            super().update(*args, **kwargs)
+            return
+
+        key, value = args
+        if self._old_array is not None:
+            self._rehash_step()
+
+        array = self._array
+        if self._old_array is not None:
+            found, _ = self._old_array.get_value(key)
+            if found:
+                array = self._old_array
+
+        if self._value_counts is not None:
+            _, old_value = array.get_value(key)
+            array.update(key, value)
+            self._remove_value_ref(old_value)
+            self._add_value_ref(value)
+        else:
+            array.update(key, value)
 
     def remove(self, key: TKey) -> bool:
         """Removes the item from the hash table whose key matches
@@ -294,10 +1118,23 @@ class HashTable:
         :param key: The key of the item to remove.
         :return: True if the item was removed, false otherwise.
         """
-        removed = self._array.remove(key)
+        if self._value_counts is not None:
+            _, old_value = self.get_value(key)
+
+        if self._old_array is not None:
+            self._rehash_step()
+
+        if self._old_array is not None:
+            removed = self._old_array.remove(key) or self._array.remove(key)
+        else:
+            removed = self._array.remove(key)
+
         if removed:
             self._count -= 1
 
+            if self._value_counts is not None:
+                self._remove_value_ref(old_value)
+
         return removed
 
     def get_value(self, key: TKey) -> (bool, TValue):
@@ -307,6 +1144,13 @@ class HashTable:
         :return: Tuple containing boolean denoting if the item is found in the hash table
         and the value associated with the specified key.
         """
+        if self._old_array is not None:
+            # Lookups do not move buckets, so enumerating the table while
+            # looking up its keys sees every item exactly once.
+            found, value = self._old_array.get_value(key)
+            if found:
+                return found, value
+
         return self._array.get_value(key)
 
     def contains_value(self, value: TValue) -> bool:
@@ -315,7 +1159,11 @@ class HashTable:
         :param value: The value whose existence is being tested.
         :return: True if the value exists in the hash table, false otherwise.
         """
-        for map_value in self._array.values():
+        if self._value_counts is not None:
+            found, _ = self._value_counts.get_value(value)
+            return found
+
+        for map_value in self.values():
             if map_value == value:
                 return True
 
@@ -323,21 +1171,32 @@ class HashTable:
 
     def keys(self) -> Generator[TKey, None, None]:
         """Returns an enumerator for all of the keys in the hash table."""
+        if self._old_array is not None:
+            return chain(self._old_array.keys(), self._array.keys())
         return self._array.keys()
 
     def values(self) -> Generator[TValue, None, None]:
         """Returns an enumerator for all of the values in the hash table."""
+        if self._old_array is not None:
+            return chain(self._old_array.values(), self._array.values())
         return self._array.values()
 
     def items(self) -> Generator[HashTableNodePair, None, None]:
         """Returns an enumerator for all of the Items in the hash table."""
+        if self._old_array is not None:
+            return chain(self._old_array.items(), self._array.items())
         return self._array.items()
 
     def clear(self):
         """Removes all items from the hash table."""
         self._array.clear()
+        self._old_array = None
+        self._rehash_index = 0
         self._count = 0
 
+        if self._value_counts is not None:
+            self._value_counts.clear()
+
     def count(self) -> int:
         """The number of items currently in the hash table."""
         return self._count
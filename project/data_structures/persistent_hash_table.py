@@ -0,0 +1,469 @@
+from __future__ import annotations
+import mmap
+import os
+import struct
+from collections.abc import MutableMapping
+from hashlib import blake2b
+from typing import Union, Generator, Iterator, Tuple
+from .hash_table import HashTableNodePair, _next_power_of_two
+
+TItem = Union[bytes, str, int]
+
+# The file has a fixed little endian binary layout:
+#
+#   header    magic, version, index capacity, count, tombstones, index offset, log end
+#   index     capacity slots of (hash: int64, record offset: uint64)
+#   records   (key type: uint8, value type: uint8, key length: uint32, value length: uint32,
+#              key bytes, value bytes) appended one after the other
+#
+# A slot with offset 0 is empty and a slot with offset 1 is a tombstone; real
+# records always start after the header. Records and index regions are only ever
+# appended, and nothing that the header points at is written again: a change
+# appends its record and keeps the changed slot in memory, and the pending slots
+# are published by appending a copy of the index with them applied and then
+# pointing the header at it. So a reader keeps following the index it mapped,
+# whose records all lie within its mapping, until it re-maps. The space left
+# behind is reclaimed by compact().
+_HEADER = struct.Struct('<4sIQQQQQ')
+_HEADER_SIZE = 64
+_SLOT = struct.Struct('<qQ')
+_RECORD = struct.Struct('<BBII')
+
+_MAGIC = b'PHT1'
+_VERSION = 1
+_EMPTY = 0
+_DELETED = 1
+
+# Type tags of the stored keys and values.
+_BYTES = 0
+_STR = 1
+_INT = 2
+
+
+def _encode(item: TItem) -> (int, bytes):
+    """Returns the type tag and the bytes of a key or a value."""
+    if isinstance(item, bytes):
+        return _BYTES, item
+    if isinstance(item, str):
+        return _STR, item.encode('utf-8')
+    if isinstance(item, int):
+        return _INT, item.to_bytes(item.bit_length() // 8 + 1, 'little', signed=True)
+
+    raise TypeError(f'Only bytes, str and int can be stored, not {type(item).__name__}')
+
+
+def _decode(type_tag: int, data: bytes) -> TItem:
+    """Rebuilds a key or a value from its type tag and bytes."""
+    if type_tag == _BYTES:
+        return data
+    if type_tag == _STR:
+        return data.decode('utf-8')
+    return int.from_bytes(data, 'little', signed=True)
+
+
+def _hash(type_tag: int, data: bytes) -> int:
+    """A hash code which is stable across processes, unlike hash() for str and bytes."""
+    digest = blake2b(data, digest_size=8, person=bytes((type_tag,))).digest()
+    return int.from_bytes(digest, 'little', signed=True)
+
+
+class PersistentHashTable(MutableMapping):
+    """A key/value associative collection stored in a memory mapped file.
+
+    Opening a table only reads its header; the index and the records are paged
+    in by the operating system when they are first touched, so even a very large
+    table opens instantly. Any number of processes can open the same file read
+    only and share its pages through the OS page cache, next to one writer. The
+    writer's changes become visible to them when it publishes its index, on
+    flush() or once a quarter of the slots have pending changes, and they see
+    them after refresh().
+
+    Keys and values may be bytes, str or int. The index uses open addressing
+    with linear probing, like OpenAddressingHashTableArray, over a stable hash
+    of the encoded key.
+    """
+
+    # If the index exceeds this fill percentage (tombstones included), it will grow.
+    _fill_factor: float = 0.75
+
+    # If more than this percentage of the slots have unpublished changes, the index is published.
+    _publish_factor: float = 0.25
+
+    def __init__(self, path: str, readonly: bool = False, capacity: int = 1024):
+        """Opens the table stored in the file, creating the file if it does not exist.
+
+        :param path: The path of the table file.
+        :param readonly: If True, the file is mapped read only and cannot be changed.
+        :param capacity: The initial index capacity of a new file.
+        """
+        self._path = path
+        self._readonly = readonly
+        self._pending = {}  # The changed slots not published yet, by slot index
+
+        if not os.path.exists(path):
+            if readonly:
+                raise FileNotFoundError(path)
+            self._create(path, _next_power_of_two(capacity))
+
+        self._file = open(path, 'rb' if readonly else 'r+b')
+        self._map()
+
+    @staticmethod
+    def _create(path: str, capacity: int):
+        """Writes an empty table with the specified index capacity to the file."""
+        index_size = capacity * _SLOT.size
+        with open(path, 'wb') as file:
+            file.write(_HEADER.pack(_MAGIC, _VERSION, capacity, 0, 0, _HEADER_SIZE, _HEADER_SIZE + index_size))
+            file.truncate(_HEADER_SIZE + index_size)
+
+    def _map(self):
+        """Maps the file into memory and reads the header."""
+        access = mmap.ACCESS_READ if self._readonly else mmap.ACCESS_WRITE
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=access)
+
+        magic, version, self._capacity, self._count, self._deleted, self._index_offset, self._log_end = \
+            _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f'{self._path} is not a persistent hash table file')
+
+    def _write_header(self):
+        _HEADER.pack_into(self._mm, 0, _MAGIC, _VERSION, self._capacity, self._count,
+                          self._deleted, self._index_offset, self._log_end)
+
+    def _check_writable(self):
+        if self._readonly:
+            raise PermissionError('The table was opened read only')
+
+    def _reserve(self, size: int) -> int:
+        """Reserves space for size bytes at the end of the log and returns its offset.
+        The file doubles in size when it runs out of room, so appends are amortized O(1).
+        Everything past the log end in the header is ignored, and the reserved space is
+        not cleared: after an unclean exit it holds whatever was appended unpublished.
+        """
+        offset = self._log_end
+        if offset + size > len(self._mm):
+            new_size = max(2 * len(self._mm), offset + size)
+            self._mm.close()
+            self._file.truncate(new_size)
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_WRITE)
+
+        self._log_end = offset + size
+        return offset
+
+    # region Index
+    def _slot_offset(self, index: int) -> int:
+        return self._index_offset + index * _SLOT.size
+
+    def _read_slot(self, index: int) -> (int, int):
+        """Returns the hash and the record offset of the slot, including pending changes."""
+        slot = self._pending.get(index)
+        if slot is None:
+            slot = _SLOT.unpack_from(self._mm, self._slot_offset(index))
+        return slot
+
+    def _write_slot(self, index: int, slot_hash: int, record_offset: int):
+        """Changes the slot in memory, publishing the index once enough slots have changed."""
+        self._pending[index] = (slot_hash, record_offset)
+        if len(self._pending) > self._publish_factor * self._capacity:
+            self._publish()
+
+    def _publish(self):
+        """Appends a copy of the index with the pending slot changes applied and then
+        writes the header pointing at it, so the published index is never changed."""
+        if self._pending:
+            size = self._capacity * _SLOT.size
+            new_offset = self._reserve(size)
+            mm = self._mm
+            mm[new_offset:new_offset + size] = mm[self._index_offset:self._index_offset + size]
+            for index, (slot_hash, record_offset) in self._pending.items():
+                _SLOT.pack_into(mm, new_offset + index * _SLOT.size, slot_hash, record_offset)
+
+            self._index_offset = new_offset
+            self._pending.clear()
+
+        self._write_header()
+
+    def _find_slot(self, key_type: int, key_data: bytes, h: int) -> (int, int):
+        """Probes the index for the key.
+
+        :return: Tuple of the slot index holding the key (or -1) and the first
+        free slot index met on the way, to be used when adding the key.
+        """
+        mm = self._mm
+        mask = self._capacity - 1
+        index = h & mask
+        free = -1
+
+        while True:
+            slot_hash, record_offset = self._read_slot(index)
+            if record_offset == _EMPTY:
+                return -1, index if free < 0 else free
+            if record_offset == _DELETED:
+                if free < 0:
+                    free = index
+            elif slot_hash == h:
+                record_key_type, _, key_length, _ = _RECORD.unpack_from(mm, record_offset)
+                key_offset = record_offset + _RECORD.size
+                if record_key_type == key_type and mm[key_offset:key_offset + key_length] == key_data:
+                    return index, free
+            index = (index + 1) & mask
+
+    def _grow_index(self):
+        """Appends a new index, twice as large unless most of the used slots are
+        tombstones, re-inserts every live slot into it, pending changes included,
+        and publishes it. The stored hashes are reused, so no record is read."""
+        capacity = self._capacity
+        if self._count + 1 > capacity // 2:
+            capacity *= 2
+
+        old_capacity = self._capacity
+        size = capacity * _SLOT.size
+        new_offset = self._reserve(size)
+        mm = self._mm
+        # The space past the log end may still hold records which were never
+        # published before an unclean exit, so the new index is cleared first.
+        mm[new_offset:new_offset + size] = bytes(size)
+        mask = capacity - 1
+
+        for old_index in range(old_capacity):
+            slot_hash, record_offset = self._read_slot(old_index)
+            if record_offset > _DELETED:
+                index = slot_hash & mask
+                while _SLOT.unpack_from(mm, new_offset + index * _SLOT.size)[1] != _EMPTY:
+                    index = (index + 1) & mask
+                _SLOT.pack_into(mm, new_offset + index * _SLOT.size, slot_hash, record_offset)
+
+        self._index_offset = new_offset
+        self._capacity = capacity
+        self._deleted = 0
+        self._pending.clear()
+        self._write_header()
+    # endregion
+
+    def _read_record(self, record_offset: int) -> (TItem, TItem):
+        key_type, value_type, key_length, value_length = _RECORD.unpack_from(self._mm, record_offset)
+        key_offset = record_offset + _RECORD.size
+        value_offset = key_offset + key_length
+        return (_decode(key_type, self._mm[key_offset:value_offset]),
+                _decode(value_type, self._mm[value_offset:value_offset + value_length]))
+
+    def _append_record(self, key_type: int, key_data: bytes, value: TItem) -> int:
+        value_type, value_data = _encode(value)
+        record_offset = self._reserve(_RECORD.size + len(key_data) + len(value_data))
+        _RECORD.pack_into(self._mm, record_offset, key_type, value_type, len(key_data), len(value_data))
+
+        key_offset = record_offset + _RECORD.size
+        value_offset = key_offset + len(key_data)
+        self._mm[key_offset:value_offset] = key_data
+        self._mm[value_offset:value_offset + len(value_data)] = value_data
+        return record_offset
+
+    def _set(self, key: TItem, value: TItem, must_exist: bool, must_not_exist: bool):
+        """Appends a record for the pair and points the key's pending slot at it."""
+        self._check_writable()
+        key_type, key_data = _encode(key)
+        h = _hash(key_type, key_data)
+        index, free = self._find_slot(key_type, key_data, h)
+
+        if index >= 0 and must_not_exist:
+            raise KeyError("The collection already contains the key")
+        if index < 0 and must_exist:
+            raise KeyError("The collection does not contain the key")
+
+        if index < 0 and self._count + self._deleted + 1 > self._fill_factor * self._capacity:
+            self._grow_index()
+            index, free = self._find_slot(key_type, key_data, h)
+
+        record_offset = self._append_record(key_type, key_data, value)
+        if index < 0:
+            if self._read_slot(free)[1] == _DELETED:
+                self._deleted -= 1
+            index = free
+            self._count += 1
+
+        self._write_slot(index, h, record_offset)
+
+    def add(self, key: TItem, value: TItem):
+        """Adds the key/value pair to the table.
+
+        :param key: The key of the item being added.
+        :param value: The value of the item being added.
+        :raises KeyError: If the key already exists in the table.
+        """
+        self._set(key, value, must_exist=False, must_not_exist=True)
+
+    def update(self, *args, **kwargs):
+        """Updates the table, called in one of these forms:
+
+        update(key, value) replaces the value of the existing key, raising
+        KeyError if the key does not exist in the table.
+
+        update(mapping), update(iterable of key/value pairs) and update(**kwargs),
+        or a mapping or iterable together with keyword arguments, set every pair
+        like dict.update does, adding the keys which do not exist.
+
+        :param args: Either the key and the value, or a single mapping or iterable of pairs.
+        :param kwargs: Keys and values to set, for string keys.
+        :raises KeyError: If called as update(key, value) and the key does not exist.
+        """
+        if len(args) != 2 or kwargs:
+            super().update(*args, **kwargs)
+            return
+
+        key, value = args
+        self._set(key, value, must_exist=True, must_not_exist=False)
+
+    def remove(self, key: TItem) -> bool:
+        """Removes the item from the table whose key matches the specified key.
+
+        :param key: The key of the item to remove.
+        :return: True if the item was removed, false otherwise.
+        """
+        self._check_writable()
+        key_type, key_data = _encode(key)
+        index, _ = self._find_slot(key_type, key_data, _hash(key_type, key_data))
+        if index < 0:
+            return False
+
+        self._count -= 1
+        self._deleted += 1
+        self._write_slot(index, 0, _DELETED)
+        return True
+
+    def get_value(self, key: TItem) -> (bool, TItem):
+        """Finds and returns the value for the specified key.
+
+        :param key: The key whose value is sought.
+        :return: Tuple containing boolean denoting if the item is found in the table
+        and the value associated with the specified key.
+        """
+        key_type, key_data = _encode(key)
+        index, _ = self._find_slot(key_type, key_data, _hash(key_type, key_data))
+        if index < 0:
+            return False, None
+
+        _, record_offset = self._read_slot(index)
+        return True, self._read_record(record_offset)[1]
+
+    # region Mapping Protocol
+    def __getitem__(self, key: TItem) -> TItem:
+        found, value = self.get_value(key)
+        if not found:
+            raise KeyError(key)
+
+        return value
+
+    def __setitem__(self, key: TItem, value: TItem):
+        self._set(key, value, must_exist=False, must_not_exist=False)
+
+    def __delitem__(self, key: TItem):
+        if not self.remove(key):
+            raise KeyError(key)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[TItem]:
+        return self.keys()
+    # endregion
+
+    def _records(self) -> Generator[Tuple[TItem, TItem], None, None]:
+        """Returns an enumerator for the key/value tuples of every live slot."""
+        for index in range(self._capacity):
+            _, record_offset = self._read_slot(index)
+            if record_offset > _DELETED:
+                yield self._read_record(record_offset)
+
+    def keys(self) -> Generator[TItem, None, None]:
+        """Returns an enumerator for all of the keys in the table."""
+        for key, _ in self._records():
+            yield key
+
+    def values(self) -> Generator[TItem, None, None]:
+        """Returns an enumerator for all of the values in the table."""
+        for _, value in self._records():
+            yield value
+
+    def items(self) -> Generator[HashTableNodePair, None, None]:
+        """Returns an enumerator for all of the items in the table."""
+        for key, value in self._records():
+            yield HashTableNodePair(key, value)
+
+    def count(self) -> int:
+        """The number of items currently in the table."""
+        return self._count
+
+    def garbage_size(self) -> int:
+        """The number of bytes taken by replaced records and old index regions,
+        which compact() would reclaim. Reads every record."""
+        live_size = _HEADER_SIZE + self._capacity * _SLOT.size
+        for key, value in self._records():
+            live_size += _RECORD.size + len(_encode(key)[1]) + len(_encode(value)[1])
+
+        return self._log_end - live_size
+
+    def clear(self):
+        """Removes all items from the table, truncating the file."""
+        self._check_writable()
+        self._mm.close()
+        self._file.close()
+        os.remove(self._path)
+        self._pending.clear()
+        self._create(self._path, self._capacity)
+        self._file = open(self._path, 'r+b')
+        self._map()
+
+    def compact(self):
+        """Rewrites the table into a new file holding only the live records and a
+        right sized index, then swaps it in place of the old file. Readers which
+        still have the old file open keep seeing the old contents until they reopen it.
+        """
+        self._check_writable()
+        compact_path = self._path + '.compact'
+        if os.path.exists(compact_path):
+            os.remove(compact_path)
+
+        capacity = _next_power_of_two(int(self._count / self._fill_factor) + 1)
+        with PersistentHashTable(compact_path, capacity=max(capacity, 16)) as compacted:
+            for key, value in self._records():
+                compacted.add(key, value)
+            compacted.flush(truncate=True)
+
+        self.close()
+        os.replace(compact_path, self._path)
+        self._file = open(self._path, 'r+b')
+        self._map()
+
+    def refresh(self):
+        """Re-maps the file, so that a read only table sees the changes another
+        process has published since it was opened."""
+        if not self._readonly:
+            self._publish()
+        self._mm.close()
+        self._map()
+
+    def flush(self, truncate: bool = False):
+        """Publishes the pending changes and writes them to disk.
+
+        :param truncate: If True, the unused space reserved at the end of the file is released.
+        """
+        self._publish()
+        self._mm.flush()
+        if truncate and len(self._mm) > self._log_end:
+            self._mm.close()
+            self._file.truncate(self._log_end)
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_WRITE)
+
+    def close(self):
+        """Writes the changes to disk and closes the file."""
+        if not self._mm.closed:
+            if not self._readonly:
+                self.flush(truncate=True)
+            self._mm.close()
+            self._file.close()
+
+    def __enter__(self) -> PersistentHashTable:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
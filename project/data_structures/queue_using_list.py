@@ -1,25 +1,63 @@
+from itertools import islice
+
+
 class Queue:
-    """A First In First Out (FIFO) collection implemented using list."""
-    def __init__(self):
-        self._list = list()
+    """A First In First Out (FIFO) collection implemented using list.
+
+    The list is used as a ring buffer whose capacity is always a power of two, so
+    the index after the last slot wraps around to the first by masking it with
+    capacity - 1 rather than comparing it with the length.
+    """
+    def __init__(self, capacity: int = 0, shrink: bool = False):
+        """Constructs an empty queue.
+
+        :param capacity: The number of items to make room for up front, rounded up
+            to a power of two. The list is not allocated until the first enqueue if 0.
+        :param shrink: True to halve the capacity whenever a dequeue leaves it at most
+            a quarter full, never below the initial capacity.
+        """
+        if capacity < 0:
+            raise ValueError('The capacity cannot be negative')
+
+        self._min_capacity = max(4, 1 << (capacity - 1).bit_length()) if capacity > 0 else 4
+        self._list = self._min_capacity * [None] if capacity > 0 else list()
+        self._shrink = shrink
         self._size = 0      # The number of items in the queue
         self._head = 0      # The index of the first (oldest) item in the queue
-        self._tail = -1     # The index of the last (newest) item in the queue
 
     def _double_size(self):
+        """Doubles the capacity of the full list. The list is extended in place, which
+        copies it at most once, and then the shorter of the two wrapped parts of the
+        queue is moved into the new slots so the items stay in order."""
         if len(self._list) == 0:
-            self._list = 4 * [None]
-        else:
-            if self._tail < self._head:
-                new_list = self._list[self._head:] + self._list[:self._head]
+            self._list = self._min_capacity * [None]
+            return
+
+        items = self._list
+        capacity = len(items)
+        items.extend(capacity * [None])
+
+        if self._head != 0:
+            wrapped = self._head + self._size - capacity    # The items at the start of the list
+            if wrapped <= capacity - self._head:
+                # Move the items at the start after the items at the end.
+                items[capacity:capacity + wrapped] = items[:wrapped]
+                items[:wrapped] = wrapped * [None]
             else:
-                new_list = self._list[self._head:]
-            new_list += self._size * [None]
-
-            self._list = new_list
-            self._head = 0
-            self._tail = self._size - 1
-            self._size = len(self._list)
+                # Move the items at the end to the end of the doubled list.
+                head = self._head + capacity
+                items[head:] = items[self._head:capacity]
+                items[self._head:capacity] = (capacity - self._head) * [None]
+                self._head = head
+
+    def _halve_size(self):
+        """Halves the capacity, copying the items in order to the start of a new list."""
+        capacity = len(self._list) // 2
+        items = list(self.enumerate())
+        items.extend((capacity - self._size) * [None])
+
+        self._list = items
+        self._head = 0
 
     def enqueue(self, item):
         """Adds the specified item to the back of the queue.
@@ -29,13 +67,7 @@ class Queue:
         if len(self._list) == self._size:
             self._double_size()
 
-        # If tail is at the end of the array, we need to wrap around
-        if self._tail == len(self._list) - 1:
-            self._tail = 0
-        else:
-            self._tail += 1
-
-        self._list[self._tail] = item
+        self._list[(self._head + self._size) & (len(self._list) - 1)] = item
         self._size += 1
 
     def dequeue(self):
@@ -47,16 +79,14 @@ class Queue:
         if self._size == 0:
             raise IndexError("The queue is empty.")
 
-        item = self._list[self._head]
-        self._list[self._head] = None
+        items = self._list
+        item = items[self._head]
+        items[self._head] = None
+        self._head = (self._head + 1) & (len(items) - 1)
         self._size -= 1
 
-        if self._head == self._tail:                # If head is at the same index as tail, move both to 0 index
-            self._head = self._tail = 0
-        elif self._head == len(self._list) - 1:     # If head is at the last index in the array, wrap around
-            self._head = 0
-        else:                                       # Mode to the next value
-            self._head += 1
+        if self._shrink and self._size <= len(items) >> 2 and len(items) > self._min_capacity:
+            self._halve_size()
 
         return item
 
@@ -80,26 +110,23 @@ class Queue:
 
     def clear(self):
         """Removes all items from the queue."""
-        # self._list = list()
+        self._list = self._min_capacity * [None] if self._list else list()
         self._size = 0
         self._head = 0
-        self._tail = -1
 
     def enumerate(self):
         """Enumerates each item in the queue in FIFO order. The queue remains unaltered.
 
         :return: The FIFO enumerator.
         """
-        if self._size == 0:
-            return []
-
-        if self._tail < self._head:
-            print_list = self._list[self._head:] + self._list[:self._tail + 1]
+        # Iterate over the list in place rather than over slices of it.
+        items = self._list
+        end = self._head + self._size
+        if end <= len(items):
+            yield from islice(items, self._head, end)
         else:
-            print_list = self._list[self._head:self._tail + 1]
-
-        for item in print_list:
-            yield item
+            yield from islice(items, self._head, len(items))
+            yield from islice(items, 0, end - len(items))
 
     def print(self):
         [print(item) for item in self.enumerate() if item is not None]
@@ -1,47 +1,50 @@
 from __future__ import annotations
-from typing import TypeVar, NoReturn, Deque, Iterable, Iterator, Generator
-from collections import deque
+from typing import TypeVar, NoReturn, Iterable, Iterator, Generator, Sized
+from .hash_table import HashTable, OpenAddressingHashTableArray
 
 T = TypeVar('T')
 
 
 class Set:
+    """A collection of unique items backed by a hash table whose keys are the
+    items, so that add, remove and contains are O(1) and the set algebra is
+    linear in the sizes of the sets."""
+
     def __init__(self, items: Iterable[T] = None):
-        self._items: Deque[T] = deque()
+        self._items: HashTable = HashTable(array_type=OpenAddressingHashTableArray)
         if items is not None:
             self.add_range(items)
 
     def __contains__(self, item: T) -> bool:
-        return self._items.__contains__(item)
+        return item in self._items
 
     def __len__(self):
         return len(self._items)
 
     def __iter__(self) -> Iterator[T]:
-        return self._items.__iter__()
+        return iter(self._items)
 
     def add(self, item: T) -> NoReturn:
-        if self.contains(item):
-            raise ValueError(f'Item {item} already exists in the Set')
-
-        self._items.append(item)
+        try:
+            self._items.add(item, None)
+        except KeyError:
+            raise ValueError(f'Item {item} already exists in the Set') from None
 
     def add_range(self, items: Iterable[T]) -> NoReturn:
+        if isinstance(items, Sized):
+            self._items.reserve(len(self) + len(items))
+
         [self.add(item) for item in items]
 
     def _add_range_skip_duplicates(self, items: Iterable[T]) -> NoReturn:
+        if isinstance(items, Sized):
+            self._items.reserve(len(self) + len(items))
+
         for item in items:
-            try:
-                self.add(item)
-            except ValueError:
-                pass
+            self._items[item] = None
 
     def remove(self, item: T) -> bool:
-        try:
-            self._items.remove(item)
-            return True
-        except ValueError:
-            return False
+        return self._items.remove(item)
 
     def contains(self, item: T) -> bool:
         return self.__contains__(item)
@@ -49,35 +52,78 @@ class Set:
     def count(self) -> int:
         return len(self)
 
+    def copy(self) -> Set:
+        result = Set()
+        result._items.reserve(len(self))
+        result._items.add_many((item, None) for item in self)
+
+        return result
+
     def union(self, other: Set) -> Set:
-        result = Set(self._items)
-        result._add_range_skip_duplicates(other.enumerate())
+        result = self.copy()
+        result._add_range_skip_duplicates(other)
 
         return result
 
     def intersection(self, other: Set) -> Set:
+        # Only the smaller set needs to be walked.
+        smaller, larger = (self, other) if len(self) <= len(other) else (other, self)
         result = Set()
 
-        for item in self:
-            if other.contains(item):
-                result.add(item)
+        for item in smaller:
+            if item in larger:
+                result._items.add(item, None)
 
         return result
 
     def difference(self, other: Set) -> Set:
-        result = Set(self._items)
+        result = Set()
 
-        for item in other:
-            result.remove(item)
+        for item in self:
+            if item not in other:
+                result._items.add(item, None)
 
         return result
 
     def symmetric_difference(self, other: Set) -> Set:
-        union_result = self.union(other)
-        intersection_result = self.intersection(other)
+        result = self.difference(other)
+
+        for item in other:
+            if item not in self:
+                result._items.add(item, None)
+
+        return result
+
+    # region In-Place Operations
+    def update(self, other: Iterable[T]) -> NoReturn:
+        """Adds every item of other which is not in the set yet."""
+        self._add_range_skip_duplicates(other)
+
+    def intersection_update(self, other: Set) -> NoReturn:
+        """Removes every item which is not in other."""
+        self._items.remove_many([item for item in self if item not in other])
+
+    def difference_update(self, other: Iterable[T]) -> NoReturn:
+        """Removes every item which is in other."""
+        if other is self:
+            self.clear()
+        else:
+            self._items.remove_many(other)
+
+    def symmetric_difference_update(self, other: Set) -> NoReturn:
+        """Removes every item which is in other and adds every item of other which is not in the set."""
+        if other is self:
+            self.clear()
+            return
+
+        for item in other:
+            if not self._items.remove(item):
+                self._items.add(item, None)
+    # endregion
 
-        return union_result.difference(intersection_result)
+    def clear(self) -> NoReturn:
+        self._items.clear()
 
     def enumerate(self) -> Generator[T]:
-        for item in self._items:
+        for item in self._items.keys():
             yield item
@@ -1,5 +1,11 @@
+from __future__ import annotations
+from collections import deque
+from typing import Iterable
+
+
 class LinkedListNode:
     """A node in the singly linked list."""
+    __slots__ = ('value', 'next')
 
     def __init__(self, value):
         """Constructs a new node with the specified value."""
@@ -10,11 +16,22 @@ class LinkedListNode:
 class LinkedList:
     """A singly linked list collection capable of basic operations such as
     Add, Remove, Find and Enumerate.
+
+    Removing the last node needs the node before the tail, which the nodes do not
+    link back to. So the first remove_last walks the list once and keeps the nodes
+    before the tail in a deque: add_last then pushes the old tail and remove_last
+    pops the new tail off it, so a list used as a stack at its tail walks only once.
+    The deque always holds the last nodes before the tail in order, though not
+    always all of them: add_first leaves it as it is, remove_first pops the head
+    off its left end if it is there, and remove deletes the removed node from it.
+    extend, splice and split_at discard it, and remove_last walks again once it is
+    empty.
     """
     def __init__(self):
         self._head = None    # The first node in the list or None if empty
         self._tail = None    # The last node in the list or None if empty
         self._count = 0
+        self._predecessors = None   # The last nodes before the tail, once remove_last needed them
 
     def head(self) -> LinkedListNode:
         return self._head
@@ -22,10 +39,11 @@ class LinkedList:
     def tail(self) -> LinkedListNode:
         return self._tail
 
-    def add_first(self, node: LinkedListNode):
+    def add_first(self, node: LinkedListNode) -> LinkedListNode:
         """Adds the specified node to the start of the list.
 
         :param node: The node to add
+        :return: The added node.
         """
         # Save the head node so we don't lose the reference
         old_head = self._head
@@ -42,36 +60,135 @@ class LinkedList:
             self._tail = self._head
 
         self._count += 1
+        return node
 
-    def add_last(self, node: LinkedListNode):
+    def add_last(self, node: LinkedListNode) -> LinkedListNode:
         """Adds the specified node to the end of the list.
 
         :param node: The node to add
+        :return: The added node.
         """
         if self._count == 0:
             self._head = node
         else:
             self._tail.next = node
+            if self._predecessors is not None:
+                self._predecessors.append(self._tail)
 
         self._tail = node
         self._count += 1
+        return node
 
-    def add(self, value):
+    def add(self, value) -> LinkedListNode:
         """Adds the specified value to the start of the list.
 
         :param value: The value to add.
+        :return: The node of the value.
         """
-        self.add_first(LinkedListNode(value))
+        return self.add_first(LinkedListNode(value))
 
-    def append(self, value):
+    def append(self, value) -> LinkedListNode:
         """Append the specified value to the end of the list.
 
         :param value: The value to append.
+        :return: The node of the value.
+        """
+        return self.add_last(LinkedListNode(value))
+
+    @classmethod
+    def from_iterable(cls, values: Iterable) -> LinkedList:
+        """Builds a list of the values in the order they are enumerated.
+
+        :param values: The values to add.
+        :return: The new list.
+        """
+        linked_list = cls()
+        linked_list.extend(values)
+        return linked_list
+
+    def extend(self, values: Iterable):
+        """Appends all the values to the end of the list. The new nodes are linked to
+        each other first and then to the tail in one step, instead of one append each.
+
+        :param values: The values to append.
+        """
+        head = None
+        tail = None
+        added = 0
+
+        for value in values:
+            node = LinkedListNode(value)
+            if tail is None:
+                head = node
+            else:
+                tail.next = node
+            tail = node
+            added += 1
+
+        if head is not None:
+            self._link_last(head, tail, added)
+
+    def _link_last(self, head: LinkedListNode, tail: LinkedListNode, count: int):
+        """Links the chain of count nodes from head to tail to the end of the list."""
+        if self._count == 0:
+            self._head = head
+        else:
+            self._tail.next = head
+
+        self._tail = tail
+        self._count += count
+        self._predecessors = None
+
+    def splice(self, other: LinkedList):
+        """Moves all the nodes of the other list to the end of this list in O(1), by
+        linking its head to this tail. The other list is left empty.
+
+        :param other: The list to move the nodes from.
+        :raises ValueError: If the other list is this list.
         """
-        self.add_last(LinkedListNode(value))
+        if other is self:
+            raise ValueError('Cannot splice a list into itself')
+
+        if other._count != 0:
+            self._link_last(other._head, other._tail, other._count)
+            other.clear()
+
+    def split_at(self, node: LinkedListNode) -> LinkedList:
+        """Moves the specified node and all the nodes after it to a new list. The nodes
+        do not link back, so finding the node before it walks from the head.
+
+        :param node: A node which is currently in this list.
+        :return: The new list, starting with the node.
+        """
+        previous = None
+        current = self._head
+        kept = 0
+        while current is not node:
+            previous = current
+            current = current.next
+            kept += 1
+
+        rest = type(self)()
+        rest._head = node
+        rest._tail = self._tail
+        rest._count = self._count - kept
+
+        if previous is None:
+            self._head = None
+            self._tail = None
+        else:
+            previous.next = None
+            self._tail = previous
+        self._count = kept
+        self._predecessors = None
+
+        return rest
 
     def remove_first(self):
         if self._count != 0:
+            if self._predecessors and self._predecessors[0] is self._head:
+                self._predecessors.popleft()
+
             self._head = self._head.next
             self._count -= 1
 
@@ -83,11 +200,17 @@ class LinkedList:
             if self._count == 1:
                 self._head = None
                 self._tail = None
+                self._predecessors = None
             else:
-                current: LinkedListNode = self._head
-                while current.next is not self._tail:
-                    current = current.next
-
+                if not self._predecessors:
+                    # Walk the list once to collect the nodes before the tail.
+                    self._predecessors = deque()
+                    current: LinkedListNode = self._head
+                    while current is not self._tail:
+                        self._predecessors.append(current)
+                        current = current.next
+
+                current = self._predecessors.pop()
                 current.next = None
                 self._tail = current
 
@@ -102,6 +225,7 @@ class LinkedList:
         """
         previous = None
         current = self._head
+        position = 0
 
         # Cases:
         # 1: Empty list -> do nothing
@@ -119,30 +243,54 @@ class LinkedList:
                     if current.next is None:        # Case 3c
                         self._tail = previous
 
+                    self._remove_predecessor(position)
                     self._count -= 1
 
                 return True
 
             previous = current
             current = current.next
+            position += 1
 
         return False
 
+    def _remove_predecessor(self, position: int):
+        """Removes the node at the position, which is not the head, from the nodes kept
+        before the tail: the node itself if it is before the tail, or the node before it,
+        which is the new tail, if it was the tail."""
+        predecessors = self._predecessors
+        if predecessors:
+            # The deque holds the nodes at positions count - 1 - len(predecessors) to count - 2.
+            index = position - (self._count - 1 - len(predecessors))
+            if index == len(predecessors):
+                predecessors.pop()
+            elif index >= 0:
+                del predecessors[index]
+
     def pop(self):
-        """Remove a value from the end of the list."""
+        """Remove a value from the end of the list.
+
+        :return: The removed value, or None if the list is empty.
+        """
+        if self._count == 0:
+            return None
+
+        value = self._tail.value
         self.remove_last()
+        return value
 
     def clear(self):
         """Remove all the nodes from the list."""
         self._head = None
         self._tail = None
         self._count = 0
+        self._predecessors = None
 
-    # def count(self) -> int:
-    #     """
-    #     :return: The number of items currently in the list.
-    #     """
-    #     return self._count
+    def __len__(self) -> int:
+        """
+        :return: The number of items currently in the list.
+        """
+        return self._count
 
     def count(self, value) -> int:
         """
@@ -0,0 +1,212 @@
+from __future__ import annotations
+import random
+from typing import TypeVar, Iterable, List, Optional
+
+TNode = TypeVar('TNode')
+
+
+class SkipListNode:
+    """A node in the skip list, linked forward at each of its levels."""
+    __slots__ = ('value', 'next')
+
+    def __init__(self, value, level: int):
+        """Constructs a new node with the specified value and number of levels."""
+        self.value = value                                        # The value of the node.
+        self.next: List[Optional[SkipListNode]] = [None] * level  # The next node at each level (None if last).
+
+
+class SkipList:
+    """A sorted collection kept as a singly linked list of values, where each node is
+    also linked at a random number of higher levels that skip over more and more
+    nodes. A search starts at the highest level and drops a level whenever the next
+    node is past the value, so add, contains and remove take expected O(log n).
+
+    The levels are drawn from a random generator owned by the list, so two lists
+    built with the same seed and the same operations have the same shape.
+
+    Nodes only link forward, and every change is a single link assignment done in
+    an order that keeps the list valid for a reader walking it at the same time: a
+    new node gets its own links before it is linked in, from the bottom level up,
+    and a removed node is unlinked from the top level down and keeps its links. So
+    a concurrent ordered map can take a writer lock around add and remove and let
+    contains and range run without one, as ConcurrentHashTable does for get.
+    """
+
+    def __init__(self, values: Iterable[TNode] = None, seed=None,
+                 probability: float = 0.5, max_level: int = 32):
+        """Constructs a skip list.
+
+        :param values: The values to add, in any order.
+        :param seed: The seed of the random generator which picks the node levels,
+            or None to seed it from the system.
+        :param probability: The probability that a node at one level also links at the next.
+        :param max_level: The maximum number of levels of a node.
+        """
+        if not 0 < probability < 1:
+            raise ValueError('The probability must be between 0 and 1')
+        if max_level < 1:
+            raise ValueError('The maximum level must be at least 1')
+
+        self._random = random.Random(seed)
+        self._probability = probability
+        self._max_level = max_level
+        self._head = SkipListNode(None, max_level)  # The sentinel before the first node at every level
+        self._level = 1                             # The number of levels in use
+        self._count = 0
+
+        if values is not None:
+            self.extend(values)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, value: TNode) -> bool:
+        return self.contains(value)
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < self._max_level and self._random.random() < self._probability:
+            level += 1
+        return level
+
+    def _last_before(self, value: TNode) -> SkipListNode:
+        """Returns the last node less than the value, or the head if there is none."""
+        current = self._head
+        for level in range(self._level - 1, -1, -1):
+            following = current.next[level]
+            while following is not None and following.value < value:
+                current = following
+                following = current.next[level]
+
+        return current
+
+    def _predecessors(self, value: TNode) -> List[SkipListNode]:
+        """Returns the last node before the value at each level in use, top level first."""
+        predecessors = []
+        current = self._head
+        for level in range(self._level - 1, -1, -1):
+            following = current.next[level]
+            while following is not None and following.value < value:
+                current = following
+                following = current.next[level]
+            predecessors.append(current)
+
+        return predecessors
+
+    def add(self, value: TNode):
+        """Adds the provided value, after any values equal to it.
+
+        :param value: Value to add.
+        """
+        level = self._random_level()
+        node = SkipListNode(value, level)
+
+        # Find the last node not greater than the value at each level of the new node.
+        predecessors = []
+        current = self._head
+        for index in range(max(level, self._level) - 1, -1, -1):
+            following = current.next[index]
+            while following is not None and not value < following.value:
+                current = following
+                following = current.next[index]
+            if index < level:
+                predecessors.append(current)
+
+        # Link the node in from the bottom level up, each level once its own link is set.
+        for index, predecessor in enumerate(reversed(predecessors)):
+            node.next[index] = predecessor.next[index]
+            predecessor.next[index] = node
+
+        if level > self._level:
+            self._level = level
+        self._count += 1
+
+    def extend(self, values: Iterable[TNode]):
+        """Adds all the provided values.
+
+        :param values: The values to add.
+        """
+        for value in values:
+            self.add(value)
+
+    def contains(self, value: TNode) -> bool:
+        """Determines if the specified value exists in the list.
+
+        :param value: The value to search for.
+        :return: True if the list contains the value, false otherwise.
+        """
+        following = self._last_before(value).next[0]
+        return following is not None and following.value == value
+
+    def remove(self, value: TNode) -> bool:
+        """Removes the first occurrence of the specified value.
+
+        :param value: The value to remove.
+        :return: True if value was removed, False otherwise.
+        """
+        predecessors = self._predecessors(value)
+        node = predecessors[-1].next[0]
+        if node is None or node.value != value:
+            return False
+
+        # Unlink the node from the top level down; its own links are left as they are.
+        # The node is the first one not less than the value, so it follows the
+        # predecessor at each of its levels.
+        for level in range(len(node.next) - 1, -1, -1):
+            predecessor = predecessors[self._level - 1 - level]
+            predecessor.next[level] = node.next[level]
+
+        while self._level > 1 and self._head.next[self._level - 1] is None:
+            self._level -= 1
+        self._count -= 1
+        return True
+
+    def range(self, low: TNode = None, high: TNode = None):
+        """Enumerates the values with low <= value < high in order. It seeks to the first
+        value in expected O(log n) and then visits only the values yielded.
+
+        :param low: The inclusive lower bound, or None for no lower bound.
+        :param high: The exclusive upper bound, or None for no upper bound.
+        :return: The enumerator.
+        """
+        current = self._head if low is None else self._last_before(low)
+        current = current.next[0]
+
+        if high is None:
+            while current is not None:
+                yield current.value
+                current = current.next[0]
+        else:
+            while current is not None and current.value < high:
+                yield current.value
+                current = current.next[0]
+
+    # region In-Order Traversal
+    def in_order_traversal(self, action):
+        """Performs the provided action on each value in order."""
+        for value in self.enumerate_in_order_traversal():
+            action(value)
+
+    def enumerate_in_order_traversal(self):
+        """Enumerates the values in order.
+
+        :return: The enumerator.
+        """
+        current = self._head.next[0]
+        while current is not None:
+            yield current.value
+            current = current.next[0]
+    # endregion
+
+    def clear(self):
+        """Removes all the values."""
+        self._head = SkipListNode(None, self._max_level)
+        self._level = 1
+        self._count = 0
+
+    def count(self) -> int:
+        """Returns the number of values currently contained in the list.
+
+        :return: Returns the count of values in the list.
+        """
+        return self._count
@@ -0,0 +1,177 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right, insort_right
+from typing import TypeVar, Iterable, List
+
+TNode = TypeVar('TNode')
+
+
+class SortedList:
+    """A sorted collection kept as a list of sorted sublists, each holding between
+    half and twice the fan-out values, plus a list of the greatest value of every
+    sublist.
+
+    A lookup bisects the maxima to pick a sublist and then bisects the sublist, so
+    it costs two C level binary searches over contiguous lists instead of one
+    method call and pointer dereference per level of a binary tree. An insert or a
+    remove shifts at most twice the fan-out references within one sublist.
+
+    It has the same add, contains, remove, in-order traversal, count and clear
+    methods as AVLTree, so it can replace one where only those are used.
+    """
+
+    def __init__(self, values: Iterable[TNode] = None, fan_out: int = 1000):
+        """Constructs a sorted list.
+
+        :param values: The values to add, in any order.
+        :param fan_out: The target number of values per sublist.
+        """
+        if fan_out < 4:
+            raise ValueError('The fan-out must be at least 4')
+
+        self._fan_out = fan_out
+        self._lists: List[List[TNode]] = []
+        self._maxes: List[TNode] = []
+        self._count = 0
+
+        if values is not None:
+            self.extend(values)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, value: TNode) -> bool:
+        return self.contains(value)
+
+    def add(self, value: TNode):
+        """Adds the provided value, after any values equal to it.
+
+        :param value: Value to add.
+        """
+        maxes = self._maxes
+        if not maxes:
+            self._lists.append([value])
+            maxes.append(value)
+        else:
+            index = bisect_right(maxes, value)
+            if index == len(maxes):
+                # The value is the new greatest value.
+                index -= 1
+                self._lists[index].append(value)
+                maxes[index] = value
+            else:
+                insort_right(self._lists[index], value)
+
+            self._split_if_full(index)
+
+        self._count += 1
+
+    def extend(self, values: Iterable[TNode]):
+        """Adds all the provided values. Into an empty list the values are sorted and
+        cut into sublists directly, rather than added one by one.
+
+        :param values: The values to add.
+        """
+        if self._count:
+            for value in values:
+                self.add(value)
+            return
+
+        values = sorted(values)
+        fan_out = self._fan_out
+        self._lists = [values[start:start + fan_out] for start in range(0, len(values), fan_out)]
+        self._maxes = [sublist[-1] for sublist in self._lists]
+        self._count = len(values)
+
+    def _split_if_full(self, index: int):
+        """Splits the sublist at the index in two halves if it grew past twice the fan-out."""
+        sublist = self._lists[index]
+        if len(sublist) > 2 * self._fan_out:
+            half = len(sublist) // 2
+            self._lists.insert(index + 1, sublist[half:])
+            self._maxes.insert(index + 1, sublist[-1])
+            del sublist[half:]
+            self._maxes[index] = sublist[-1]
+
+    def contains(self, value: TNode) -> bool:
+        """Determines if the specified value exists in the list.
+
+        :param value: The value to search for.
+        :return: True if the list contains the value, false otherwise.
+        """
+        index = bisect_left(self._maxes, value)
+        if index == len(self._maxes):
+            return False
+
+        sublist = self._lists[index]
+        return sublist[bisect_left(sublist, value)] == value
+
+    def remove(self, value: TNode) -> bool:
+        """Removes the first occurrence of the specified value.
+
+        :param value: The value to remove.
+        :return: True if value was removed, False otherwise.
+        """
+        maxes = self._maxes
+        index = bisect_left(maxes, value)
+        if index == len(maxes):
+            return False
+
+        sublist = self._lists[index]
+        position = bisect_left(sublist, value)
+        if sublist[position] != value:
+            return False
+
+        del sublist[position]
+        self._count -= 1
+
+        if not sublist:
+            del self._lists[index]
+            del maxes[index]
+            return True
+
+        maxes[index] = sublist[-1]
+        if len(sublist) < self._fan_out // 2 and len(self._lists) > 1:
+            self._merge_with_neighbour(index)
+
+        return True
+
+    def _merge_with_neighbour(self, index: int):
+        """Merges the sublist at the index, which shrank below half the fan-out, into the
+        next sublist (or the previous one if it is the last) and splits the result again
+        if it is too big."""
+        if index == len(self._lists) - 1:
+            index -= 1
+
+        self._lists[index].extend(self._lists[index + 1])
+        self._maxes[index] = self._maxes[index + 1]
+        del self._lists[index + 1]
+        del self._maxes[index + 1]
+        self._split_if_full(index)
+
+    # region In-Order Traversal
+    def in_order_traversal(self, action):
+        """Performs the provided action on each value in order."""
+        for value in self.enumerate_in_order_traversal():
+            action(value)
+
+    def enumerate_in_order_traversal(self):
+        """Enumerates the values in order.
+
+        :return: The enumerator.
+        """
+        for sublist in self._lists:
+            yield from sublist
+    # endregion
+
+    def clear(self):
+        """Removes all the values."""
+        self._lists = []
+        self._maxes = []
+        self._count = 0
+
+    def count(self) -> int:
+        """Returns the number of values currently contained in the list.
+
+        :return: Returns the count of values in the list.
+        """
+        return self._count
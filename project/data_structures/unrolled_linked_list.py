@@ -0,0 +1,234 @@
+from __future__ import annotations
+from typing import Optional, List
+
+
+class UnrolledLinkedListNode:
+    """A block of the unrolled linked list: up to the list's block size values in order."""
+    __slots__ = ('values', 'next', 'previous')
+
+    def __init__(self, values: List = None):
+        """Constructs a new block holding the specified values."""
+        self.values: List = [] if values is None else values   # The values of the block.
+        self.next: Optional[UnrolledLinkedListNode] = None      # The next block (None if last block).
+        self.previous: Optional[UnrolledLinkedListNode] = None  # The previous block (None if first block).
+
+
+class UnrolledLinkedList:
+    """A doubly linked list of blocks which each hold up to block_size values.
+
+    Storing many values per node spreads the node overhead over the whole block
+    and turns enumerate, contains and count into loops over contiguous Python
+    lists instead of one pointer dereference per value. A block which is full
+    when a value is inserted into it is split in two halves, and a block which
+    drops below half full after a removal is merged with, or refilled from, its
+    neighbour, so every block but the last stays at least half full.
+    """
+    def __init__(self, block_size: int = 64):
+        """Constructs an empty list.
+
+        :param block_size: The maximum number of values in a block.
+        """
+        if block_size < 2:
+            raise ValueError('The block size must be at least 2')
+
+        self._block_size = block_size
+        self._head: Optional[UnrolledLinkedListNode] = None  # The first block or None if empty
+        self._tail: Optional[UnrolledLinkedListNode] = None  # The last block or None if empty
+        self._count = 0
+
+    def __len__(self) -> int:
+        """
+        :return: The number of items currently in the list.
+        """
+        return self._count
+
+    # region Blocks
+    def _insert_block_after(self, block: Optional[UnrolledLinkedListNode], new_block: UnrolledLinkedListNode):
+        """Links the new block after the block, or at the start if block is None."""
+        following = self._head if block is None else block.next
+        new_block.previous = block
+        new_block.next = following
+
+        if block is None:
+            self._head = new_block
+        else:
+            block.next = new_block
+        if following is None:
+            self._tail = new_block
+        else:
+            following.previous = new_block
+
+    def _unlink_block(self, block: UnrolledLinkedListNode):
+        if block.previous is None:
+            self._head = block.next
+        else:
+            block.previous.next = block.next
+
+        if block.next is None:
+            self._tail = block.previous
+        else:
+            block.next.previous = block.previous
+
+    def _split(self, block: UnrolledLinkedListNode):
+        """Moves the second half of a full block into a new block after it."""
+        half = len(block.values) // 2
+        self._insert_block_after(block, UnrolledLinkedListNode(block.values[half:]))
+        del block.values[half:]
+
+    def _fill(self, block: UnrolledLinkedListNode):
+        """Restores a block which dropped below half full after a removal: an empty block
+        is dropped, otherwise it is merged with its next block if both fit in one block,
+        or takes values from the start of the next block until it is half full."""
+        if not block.values:
+            self._unlink_block(block)
+            return
+
+        following = block.next
+        if following is None or len(block.values) >= self._block_size // 2:
+            return
+
+        if len(block.values) + len(following.values) <= self._block_size:
+            block.values.extend(following.values)
+            self._unlink_block(following)
+        else:
+            moved = self._block_size // 2 - len(block.values)
+            block.values.extend(following.values[:moved])
+            del following.values[:moved]
+    # endregion
+
+    def add(self, value):
+        """Adds the specified value to the start of the list, splitting the first
+        block if it is full.
+
+        :param value: The value to add.
+        """
+        self.insert(0, value)
+
+    def append(self, value):
+        """Append the specified value to the end of the list.
+
+        :param value: The value to append.
+        """
+        if self._tail is None or len(self._tail.values) == self._block_size:
+            self._insert_block_after(self._tail, UnrolledLinkedListNode([value]))
+        else:
+            self._tail.values.append(value)
+
+        self._count += 1
+
+    def insert(self, index: int, value):
+        """Inserts the value before the specified position, splitting the block it falls
+        into if that block is full.
+
+        :param index: The position of the value once inserted, from 0 to the length.
+        :param value: The value to insert.
+        :raises IndexError: If the index is out of range.
+        """
+        if not 0 <= index <= self._count:
+            raise IndexError(f'Index {index} is out of range')
+        if index == self._count:
+            self.append(value)
+            return
+
+        block = self._head
+        while index > len(block.values):
+            index -= len(block.values)
+            block = block.next
+
+        if len(block.values) == self._block_size:
+            self._split(block)
+            if index > len(block.values):
+                index -= len(block.values)
+                block = block.next
+
+        block.values.insert(index, value)
+        self._count += 1
+
+    def remove_first(self):
+        if self._count != 0:
+            del self._head.values[0]
+            self._count -= 1
+            self._fill(self._head)
+
+    def remove_last(self):
+        if self._count != 0:
+            self._tail.values.pop()
+            self._count -= 1
+            if not self._tail.values:
+                self._unlink_block(self._tail)
+
+    def remove(self, value) -> bool:
+        """Remove the first occurrence of the value from the list
+        (searching from Head to Tail).
+
+        :param value: The value to remove.
+        :return: True if the value was found and removed, False otherwise.
+        """
+        block = self._head
+        while block is not None:
+            if value in block.values:
+                block.values.remove(value)
+                self._count -= 1
+                self._fill(block)
+                return True
+
+            block = block.next
+
+        return False
+
+    def pop(self):
+        """Remove a value from the end of the list.
+
+        :return: The removed value, or None if the list is empty.
+        """
+        if self._count == 0:
+            return None
+
+        value = self._tail.values[-1]
+        self.remove_last()
+        return value
+
+    def clear(self):
+        """Remove all the blocks from the list."""
+        self._head = None
+        self._tail = None
+        self._count = 0
+
+    def count(self, value) -> int:
+        """
+        :param value: The value to count in the list.
+        :return: Return number of occurrences of the value.
+        """
+        value_count = 0
+        block = self._head
+
+        while block is not None:
+            value_count += block.values.count(value)
+            block = block.next
+
+        return value_count
+
+    def contains(self, value) -> bool:
+        """Check if the list contains specified value.
+
+        :param value: The item to search
+        :return: True if the item is found, False otherwise.
+        """
+        block = self._head
+
+        while block is not None:
+            if value in block.values:
+                return True
+            block = block.next
+
+        return False
+
+    def enumerate(self):
+        """Enumerates over the list values from head to tail.
+
+        :return: A head to tail enumerator.
+        """
+        block = self._head
+        while block is not None:
+            yield from block.values
+            block = block.next
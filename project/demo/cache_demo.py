@@ -0,0 +1,26 @@
+from project.data_structures.cache import LRUCache, LFUCache, TTLCache, memoize
+
+
+def print_counters(name: str, cache):
+    print(f'{name}:\t{len(cache)} entries, {cache.hits} hits, {cache.misses} misses, {cache.evictions} evictions')
+
+
+@memoize(LRUCache(100))
+def fibonacci(num: int) -> int:
+    return num if num < 2 else fibonacci(num - 1) + fibonacci(num - 2)
+
+
+def main():
+    for cache, name in ((LRUCache(3), 'LRU'), (LFUCache(3), 'LFU'), (TTLCache(3, ttl=60), 'TTL')):
+        for key in 'abacadaeaf':
+            if cache.get(key) is None:
+                cache.put(key, key.upper())
+        print_counters(name, cache)
+    print()
+
+    print('Fibonacci(90):', fibonacci(90))
+    print_counters('Memoized', fibonacci.cache)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,13 @@
+import gc
+import tracemalloc
+
+
+def traced_bytes(build) -> int:
+    """Returns the bytes still allocated by build once it returns, holding on to its result."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
@@ -0,0 +1,38 @@
+import unittest
+from project.data_structures.avl_tree import AVLTree
+
+
+class AVLTreeOrderedMapTest(unittest.TestCase):
+    def setUp(self):
+        self.tree = AVLTree()
+        for key in (10, 20, 30, 40):
+            self.tree.put(key, str(key))
+
+    def test_lower_bound_returns_key_value_pair(self):
+        self.assertEqual(self.tree.lower_bound(15), (20, '20'))
+        self.assertEqual(self.tree.lower_bound(20), (20, '20'))
+        self.assertEqual(self.tree.lower_bound(5), (10, '10'))
+        self.assertIsNone(self.tree.lower_bound(41))
+
+    def test_floor_and_ceiling_return_keys(self):
+        self.assertEqual(self.tree.floor(25), 20)
+        self.assertEqual(self.tree.ceiling(25), 30)
+        self.assertIsNone(self.tree.floor(5))
+        self.assertIsNone(self.tree.ceiling(45))
+
+    def test_pop_min_and_pop_max(self):
+        self.assertEqual(self.tree.pop_min(), (10, '10'))
+        self.assertEqual(self.tree.pop_max(), (40, '40'))
+        self.assertEqual(list(self.tree.range()), [(20, '20'), (30, '30')])
+        self.tree.check_invariants()
+
+    def test_empty_tree_raises_value_error(self):
+        empty = AVLTree()
+        for method in (empty.min, empty.max, empty.pop_min, empty.pop_max):
+            with self.subTest(method=method.__name__):
+                with self.assertRaises(ValueError):
+                    method()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from project.data_structures.concurrent_hash_table import ConcurrentHashTable
+from project.data_structures.hash_table import HashTable, HashTableArray
+
+# Keys whose hash codes differ only above the lowest 32 bits.
+HIGH_BIT_KEY_SETS = {
+    'high bit ints': [i << 40 for i in range(20000)],
+    'floats over 1024': [i / 1024 for i in range(20000)],
+    'small floats': [i * 2 ** -20 for i in range(20000)],
+}
+
+
+class HashSpreadTest(unittest.TestCase):
+    def test_chained_array_spreads_high_bit_keys(self):
+        array = HashTableArray(32768)
+        for name, keys in HIGH_BIT_KEY_SETS.items():
+            with self.subTest(keys=name):
+                buckets = {array.get_index(key) for key in keys}
+                self.assertGreater(len(buckets), len(keys) // 2)
+
+    def test_hash_table_stores_high_bit_keys(self):
+        for name, keys in HIGH_BIT_KEY_SETS.items():
+            with self.subTest(keys=name):
+                table = HashTable()
+                for key in keys:
+                    table[key] = key
+                self.assertEqual(len(table), len(keys))
+                self.assertTrue(all(table[key] == key for key in keys))
+
+    def test_concurrent_table_spreads_high_bit_keys(self):
+        for name, keys in HIGH_BIT_KEY_SETS.items():
+            with self.subTest(keys=name):
+                table = ConcurrentHashTable()
+                for key in keys:
+                    table[key] = key
+                longest = max(len(bucket) for bucket in table._buckets if bucket is not None)
+                self.assertLessEqual(longest, 16)
+                self.assertEqual(len(table), len(keys))
+
+
+class ConcurrentHashTableMergeTest(unittest.TestCase):
+    def test_merge_adds_combines_and_removes(self):
+        table = ConcurrentHashTable()
+        self.assertEqual(table.merge('a', 1, lambda old, new: old + new), 1)
+        self.assertEqual(table.merge('a', 2, lambda old, new: old + new), 3)
+        self.assertIsNone(table.merge('a', 0, lambda old, new: None))
+        self.assertNotIn('a', table)
+
+    def test_merge_none_into_missing_key_adds_nothing(self):
+        table = ConcurrentHashTable()
+        self.assertIsNone(table.merge('a', None, lambda old, new: old))
+        self.assertNotIn('a', table)
+        self.assertEqual(len(table), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
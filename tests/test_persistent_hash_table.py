@@ -0,0 +1,36 @@
+import os
+import tempfile
+import unittest
+from project.data_structures.persistent_hash_table import PersistentHashTable
+
+
+class PersistentHashTableReopenTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'table.pht')
+
+    def test_grow_after_unclean_exit(self):
+        table = PersistentHashTable(self.path, capacity=64)
+        for key in range(48):
+            table[key] = key
+        table.flush()
+        # Updating a single key keeps one pending slot, so nothing is published.
+        for update in range(300):
+            table[0] = update
+
+        # Exit without close(), so the file keeps its reserved space past the log
+        # end, holding the unpublished records the header does not point at.
+        table._mm.close()
+        table._file.close()
+
+        with PersistentHashTable(self.path) as table:
+            # The index is full enough that this add grows it into the reserved space.
+            table[1000] = 1
+            self.assertEqual(len(table), 49)
+            self.assertEqual(table[1000], 1)
+            self.assertEqual({key: table[key] for key in range(48)}, {key: key for key in range(48)})
+
+
+if __name__ == '__main__':
+    unittest.main()
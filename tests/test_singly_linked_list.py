@@ -0,0 +1,65 @@
+import random
+import unittest
+from collections import deque
+from project.data_structures.singly_linked_list import LinkedList
+
+
+class SinglyLinkedListTest(unittest.TestCase):
+    def test_alternating_head_and_tail_pops_walk_once(self):
+        linked_list = LinkedList.from_iterable(range(1000))
+        expected = deque(range(1000))
+
+        self.assertEqual(linked_list.pop(), expected.pop())
+        predecessors = linked_list._predecessors
+
+        while expected:
+            linked_list.remove_first()
+            expected.popleft()
+            if expected:
+                self.assertEqual(linked_list.pop(), expected.pop())
+                # The nodes before the tail were collected once and never walked for again.
+                self.assertIs(linked_list._predecessors, predecessors)
+            self.assertEqual(len(linked_list), len(expected))
+
+        self.assertIsNone(linked_list.head())
+        self.assertIsNone(linked_list.tail())
+
+    def test_mixed_operations_match_deque(self):
+        rng = random.Random(21)
+        linked_list = LinkedList()
+        expected = deque()
+
+        for _ in range(5000):
+            operation = rng.randrange(6)
+            value = rng.randrange(50)
+            if operation == 0:
+                linked_list.add(value)
+                expected.appendleft(value)
+            elif operation == 1:
+                linked_list.append(value)
+                expected.append(value)
+            elif operation == 2:
+                linked_list.remove_first()
+                if expected:
+                    expected.popleft()
+            elif operation == 3:
+                self.assertEqual(linked_list.pop(), expected.pop() if expected else None)
+            elif operation == 4:
+                found = value in expected
+                self.assertEqual(linked_list.remove(value), found)
+                if found:
+                    expected.remove(value)
+            else:
+                linked_list.remove_last()
+                if expected:
+                    expected.pop()
+
+            self.assertEqual(len(linked_list), len(expected))
+            self.assertEqual(list(linked_list.enumerate()), list(expected))
+            if expected:
+                self.assertEqual(linked_list.head().value, expected[0])
+                self.assertEqual(linked_list.tail().value, expected[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()